@@ -10,10 +10,24 @@ from enum import Enum
 
 from yajaw.configuration import YajawConfig
 
-__all__ = ["jira", "configuration", "exceptions", "ApiType"]
+__all__ = [
+    "jira",
+    "mirror",
+    "records",
+    "export",
+    "configuration",
+    "exceptions",
+    "ApiType",
+    "Session",
+    "batch",
+]
 
 
 ApiType = Enum("API", ["CLASSIC", "AGILE", "INTERNAL"])
 Option = Enum("Confirmation", ["YES", "NO"])
 
 YajawConfig.load_initial_settings()
+
+# isort: off
+from yajaw.core.session import Session  # noqa: E402  pylint: disable=wrong-import-position
+from yajaw.core.batch import batch  # noqa: E402  pylint: disable=wrong-import-position
@@ -0,0 +1,254 @@
+"""
+Module responsible for the yajaw command-line interface.
+Heavy modules are imported by each subcommand, so the startup stays minimal.
+"""
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Iterable
+
+_OUTPUT_FORMATS = ("jsonl", "json", "keys")
+
+
+class _Progress:
+    """
+    Class representing the live progress of a command printed to stderr.
+
+    A daemon thread prints the counters of the stats object on a single line every
+    interval, and the final counters once the command is done.
+    """
+
+    def __init__(self, stats, mode: str = "auto", interval: float = 1.0):
+        self.stats = stats
+        self.live = mode == "always" or (mode == "auto" and sys.stderr.isatty())
+        self.summary = mode != "never"
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._report, name="yajaw-progress", daemon=True)
+
+    def _line(self) -> str:
+        "Format the counters of the stats object."
+        stats = self.stats
+        return (
+            f"{stats.issues} items, {stats.bytes / 1024**2:.1f} MiB,"
+            f" {stats.issues_per_second:.0f} items/s, {stats.elapsed:.1f}s"
+        )
+
+    def _report(self):
+        "Print the counters until the command is done."
+        while not self._stop.wait(self.interval):
+            print(f"\r{self._line()}", end="", file=sys.stderr, flush=True)
+
+    def __enter__(self) -> "_Progress":
+        if self.live:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self.live:
+            self._thread.join()
+        if self.stats.finished is None:
+            self.stats.finished = time.monotonic()
+        if self.summary:
+            print(f"\r{self._line()}", file=sys.stderr, flush=True)
+
+
+def _write_items(items: Iterable[dict], output_format: str, stats, output) -> None:
+    """Write the items to the binary output in the requested format and count them."""
+    from yajaw.core.codec import encode_json
+
+    first = True
+    if output_format == "json":
+        output.write(b"[")
+    for item in items:
+        if output_format == "keys":
+            line = f"{item.get('key', '')}\n".encode()
+        elif output_format == "json":
+            line = (b"" if first else b",") + encode_json(item)
+        else:
+            line = encode_json(item) + b"\n"
+        output.write(line)
+        stats.issues += 1
+        stats.bytes += len(line)
+        first = False
+    if output_format == "json":
+        output.write(b"]\n")
+
+
+def _configure(args: argparse.Namespace) -> None:
+    """Apply the settings provided as flags to the yajaw configuration."""
+    from yajaw import YajawConfig
+
+    settings = {
+        ("concurrency", "semaphore_limit"): args.concurrency,
+        ("pagination", "page_results"): args.page_size,
+        ("pagination", "page_window"): args.window,
+        ("retries", "tries"): args.tries,
+        ("retries", "delay"): args.delay,
+        ("requests", "timeout"): args.timeout,
+    }
+    for (section, setting), value in settings.items():
+        if value is not None:
+            YajawConfig.update_configuration(section, setting, value)
+
+
+def _run_search(args: argparse.Namespace, stats, output) -> None:
+    """Stream the issues matched by the JQL."""
+    from yajaw import jira
+
+    issues = jira.iter_search_issues(
+        args.jql, expand=args.expand, fields=args.fields, window=args.window
+    )
+    _write_items(issues, args.format, stats, output)
+
+
+def _run_issue(args: argparse.Namespace, stats, output) -> None:
+    """Fetch the issues by key."""
+    from yajaw import jira
+
+    issues = jira.fetch_issues_from_list(args.keys, expand=args.expand, fields=args.fields)
+    _write_items((issue for issue in issues if issue), args.format, stats, output)
+
+
+def _run_projects(args: argparse.Namespace, stats, output) -> None:
+    """Fetch the projects by key, or every project."""
+    from yajaw import jira
+
+    if args.keys:
+        projects = jira.fetch_projects_from_list(args.keys, expand=args.expand)
+    else:
+        projects = jira.fetch_all_projects(expand=args.expand)
+    _write_items(projects, args.format, stats, output)
+
+
+def _run_export(args: argparse.Namespace, stats, output) -> None:
+    """Export the issues matched by the JQL to a file."""
+    from yajaw import export
+
+    if args.format == "parquet":
+        stats.issues = export.to_parquet(
+            args.jql,
+            args.path,
+            fields=args.fields,
+            compression="zstd" if args.compression == "infer" else args.compression,
+            window=args.window,
+        )
+        return
+    export.jsonl(
+        args.jql,
+        args.path,
+        expand=args.expand,
+        fields=args.fields,
+        compression=args.compression,
+        window=args.window,
+        stats=stats,
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line."""
+    parser = argparse.ArgumentParser(
+        prog="yajaw", description="Fast bulk reads from a Jira instance."
+    )
+    parser.add_argument("--concurrency", type=int, help="maximum number of requests in flight")
+    parser.add_argument("--page-size", type=int, help="number of results per page")
+    parser.add_argument("--window", type=int, help="maximum number of pages in flight")
+    parser.add_argument("--tries", type=int, help="maximum number of attempts per request")
+    parser.add_argument("--delay", type=float, help="base delay in seconds between attempts")
+    parser.add_argument("--timeout", type=int, help="timeout in seconds of each request")
+    progress = parser.add_mutually_exclusive_group()
+    progress.add_argument(
+        "--progress",
+        dest="progress",
+        action="store_const",
+        const="always",
+        default="auto",
+        help="print the live progress on stderr even when it is not a terminal",
+    )
+    progress.add_argument(
+        "--quiet",
+        dest="progress",
+        action="store_const",
+        const="never",
+        help="print neither the progress nor the summary",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search = subparsers.add_parser("search", help="stream the issues matched by a JQL")
+    search.add_argument("jql", help="JQL of the search")
+    issue = subparsers.add_parser("issue", help="fetch issues by key")
+    issue.add_argument("keys", nargs="+", help="issue keys")
+    projects = subparsers.add_parser("projects", help="fetch projects by key, or every project")
+    projects.add_argument("keys", nargs="*", help="project keys")
+    for command in (search, issue, projects):
+        command.add_argument("--format", choices=_OUTPUT_FORMATS, default="jsonl")
+        command.add_argument("--output", "-o", help="output file instead of stdout")
+        command.add_argument("--expand", help="comma-separated attributes to expand")
+    for command in (search, issue):
+        command.add_argument("--fields", help="comma-separated fields or a field profile")
+
+    export = subparsers.add_parser("export", help="export the issues matched by a JQL to a file")
+    export.add_argument("jql", help="JQL of the search")
+    export.add_argument("path", help="output file")
+    export.add_argument("--format", choices=("jsonl", "parquet"), default="jsonl")
+    export.add_argument("--fields", help="comma-separated fields or a field profile")
+    export.add_argument("--expand", help="comma-separated attributes to expand")
+    export.add_argument(
+        "--compression",
+        choices=("infer", "gzip", "zstd"),
+        default="infer",
+        help="compression of the file, inferred from the suffix of JSON Lines files and"
+        " zstd for Parquet files by default",
+    )
+
+    search.set_defaults(handler=_run_search)
+    issue.set_defaults(handler=_run_issue)
+    projects.set_defaults(handler=_run_projects)
+    export.set_defaults(handler=_run_export)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of the yajaw command.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments. Defaults to the\
+        arguments of the process.
+
+    Returns:
+        Exit status of the command.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.command == "export" and args.format == "parquet" and args.expand:
+        parser.error("--expand is not supported with --format parquet")
+
+    from yajaw import exceptions
+    from yajaw.utils.performance import ExportStats
+
+    _configure(args)
+    stats = ExportStats()
+    output_path = getattr(args, "output", None)
+    output = None
+    try:
+        output = open(output_path, "wb") if output_path else sys.stdout.buffer
+        with _Progress(stats, mode=args.progress):
+            args.handler(args, stats, output)
+    except (exceptions.YajawError, OSError, ImportError) as exc:
+        print(f"yajaw: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if output is not None:
+            output.flush()
+            if output_path:
+                output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,13 @@ import tomllib
 from pathlib import Path
 from typing import ClassVar
 
+from yajaw.core.breaker import CircuitBreakerRegistry
+from yajaw.core.cache import HttpCache, MemoryCache, TotalEstimates
+from yajaw.core.codec import JsonDecoder, get_decoder
+from yajaw.core.limiter import AdaptiveLimiter, RateLimiter
+from yajaw.core.metrics import Metrics, PrometheusSink
+from yajaw.core.retry import RetryBudget, RetryPolicy
+
 
 class YajawConfig:
     """
@@ -28,11 +35,38 @@ class YajawConfig:
         DELAY: Number of seconds to wait before submitting the next request
         BACKOFF: Number multiplied against the delay to define its new value\
         in order to adjust the load against the Jira instance
+        RATE_LIMITER: Token buckets limiting requests per second per endpoint class, if enabled
+        METRICS: Hook reporting the metrics of each request attempt to its sinks, if enabled
+        CIRCUIT_BREAKERS: Circuit breakers of the Jira hosts, if enabled
+        RETRY_POLICY: Policy deciding when and how failed requests are retried. It is\
+        built from the retries settings, unless a custom policy setting is provided
         LOGGER: Logger instance created based on configuration settings
-        SEMAPHORE: Semaphore object created based on configuration settings
+        SEMAPHORE: Semaphore object created based on configuration settings. It is an\
+        AdaptiveLimiter when the concurrency mode is set to adaptive. Otherwise, each\
+        event loop gets its own semaphore with the same limit
+        SEMAPHORE_LIMIT: Maximum number of requests in flight per event loop in fixed mode
+        RUNNER_MODE: Either ephemeral, where each sync call runs on a new event loop, or\
+        persistent, where sync calls run on a process-wide background event loop
         TIMEOUT: Number of seconds used to configure the semaphore timeout setting
+        JSON_DECODER: Function decoding the JSON bodies of responses, picked by the\
+        json_decoder setting among json, orjson, msgspec or auto
         DEFAULT_PAGINATION: Initial dictionary with the start position and number \
         of results to be requested in paginated requests
+        PAGE_WINDOW: Maximum number of pages kept in flight by streaming searches
+        SPECULATIVE_PAGINATION: Whether resources reporting isLast without a total are\
+        paged by requesting a window of future offsets instead of one page at a time
+        PROBE_WINDOW: Initial number of future offsets requested by speculative pagination
+        MAX_PROBE_WINDOW: Maximum number of future offsets requested by speculative pagination
+        ADAPTIVE_PAGINATION: Whether the number of results per page is learned per endpoint\
+        from the cap of the server, the latency and the body size of the pages
+        MAX_PAGE_RESULTS: Largest number of results per page requested in adaptive mode
+        TARGET_PAGE_SECONDS: Target latency in seconds of a page in adaptive mode
+        TARGET_PAGE_BYTES: Target body size in bytes of a page in adaptive mode
+        FIELD_PROFILES: Dictionary of named lists of fields used to trim searches
+        HTTP_CACHE: On-disk conditional request cache used by GET requests, if enabled
+        MEMORY_CACHE: In-memory cache used by single-resource reads, if enabled
+        TOTAL_ESTIMATES: Last total observed per paginated request, used to request\
+        the first and the remaining pages at once, if enabled
 
     Raises:
         NameError: Raised when it can't update the configuration\
@@ -49,10 +83,29 @@ class YajawConfig:
     TRIES: int
     DELAY: float
     BACKOFF: float
+    RETRY_POLICY: RetryPolicy
+    CIRCUIT_BREAKERS: CircuitBreakerRegistry | None
+    RATE_LIMITER: RateLimiter | None
+    METRICS: Metrics | None
     LOGGER: logging.Logger
-    SEMAPHORE: asyncio.BoundedSemaphore
+    SEMAPHORE: asyncio.BoundedSemaphore | AdaptiveLimiter
+    SEMAPHORE_LIMIT: int
+    RUNNER_MODE: str
     TIMEOUT: int
+    JSON_DECODER: JsonDecoder
     DEFAULT_PAGINATION: dict
+    PAGE_WINDOW: int
+    SPECULATIVE_PAGINATION: bool
+    PROBE_WINDOW: int
+    MAX_PROBE_WINDOW: int
+    ADAPTIVE_PAGINATION: bool
+    MAX_PAGE_RESULTS: int
+    TARGET_PAGE_SECONDS: float
+    TARGET_PAGE_BYTES: int
+    FIELD_PROFILES: dict
+    HTTP_CACHE: HttpCache | None
+    MEMORY_CACHE: MemoryCache | None
+    TOTAL_ESTIMATES: TotalEstimates | None
 
     _MIN_SEMAPHORE_LIMIT: int = 5
 
@@ -64,13 +117,103 @@ class YajawConfig:
             "agile_api_v1": "rest/agile/1.0",
             "greenhopper_api": "rest/greenhopper/1.0",
         },
-        "retries": {"tries": 10, "delay": 0.0, "backoff": 2},
-        "requests": {"timeout": 60},
-        "concurrency": {"semaphore_limit": 50},
-        "pagination": {"page_results": 40},
+        "retries": {
+            "tries": 10,
+            "delay": 0.5,
+            "backoff": 2,
+            "max_delay": 60.0,
+            "jitter": "full",
+            "status_tries": {"400": 1},
+            "budget_capacity": 100,
+            "budget_rate": 10.0,
+        },
+        "requests": {"timeout": 60, "json_decoder": "auto"},
+        "rate_limit": {
+            "enabled": False,
+            "rates": {
+                "search": 2.0,
+                "issue": 20.0,
+                "project": 10.0,
+                "agile": 10.0,
+                "default": 10.0,
+            },
+            "bursts": {"search": 5, "issue": 40, "project": 20, "agile": 20, "default": 20},
+        },
+        "circuit_breaker": {
+            "enabled": False,
+            "failure_threshold": 5,
+            "recovery_time": 30.0,
+            "half_open_probes": 1,
+        },
+        "concurrency": {
+            "semaphore_limit": 50,
+            "mode": "fixed",
+            "adaptive_floor": 5,
+            "adaptive_ceiling": 200,
+            "runner": "ephemeral",
+        },
+        "pagination": {
+            "page_results": 40,
+            "page_window": 10,
+            "speculative": False,
+            "probe_window": 4,
+            "max_probe_window": 32,
+            "adaptive": False,
+            "max_page_results": 1000,
+            "target_page_seconds": 2.0,
+            "target_page_bytes": 4194304,
+        },
+        "field_profiles": {"key_only": ["key"]},
+        "cache": {
+            "http_directory": "",
+            "http_max_bytes": 268435456,
+            "memory_entries": 0,
+            "memory_ttl": 60.0,
+            "memory_endpoint_ttls": {},
+            "estimate_entries": 0,
+            "estimate_path": "",
+        },
+        "metrics": {
+            "enabled": False,
+            "buckets": [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+        },
     }
 
-    __sections: ClassVar = ["jira", "log", "retries", "requests", "concurrency"]
+    # Objects built from the settings, keyed by section and name, with their settings
+    _components: ClassVar = {
+        ("retries", "budget"): ("budget_capacity", "budget_rate"),
+        ("rate_limit", "limiter"): ("enabled", "rates", "bursts"),
+        ("metrics", "registry"): ("enabled", "buckets"),
+        ("circuit_breaker", "registry"): (
+            "enabled",
+            "failure_threshold",
+            "recovery_time",
+            "half_open_probes",
+        ),
+        ("concurrency", "semaphore"): (
+            "semaphore_limit",
+            "mode",
+            "adaptive_floor",
+            "adaptive_ceiling",
+        ),
+        ("cache", "http_cache"): ("http_directory", "http_max_bytes"),
+        ("cache", "memory_cache"): ("memory_entries", "memory_ttl", "memory_endpoint_ttls"),
+        ("cache", "total_estimates"): ("estimate_entries", "estimate_path"),
+    }
+
+    __sections: ClassVar = [
+        "jira",
+        "log",
+        "retries",
+        "requests",
+        "concurrency",
+        "pagination",
+        "field_profiles",
+        "cache",
+        "circuit_breaker",
+        "rate_limit",
+        "metrics",
+    ]
 
     @staticmethod
     def configuration(
@@ -102,6 +245,8 @@ class YajawConfig:
 
         Updates the configuration dictionary with the informed setting value
         using the section and setting keys and refresh the class attributes.
+        Objects built from the setting, such as the rate limiter or the caches,
+        are built again, so features can be enabled or tuned at runtime.
 
         Args:
             section (str): Section of the configuration.
@@ -114,6 +259,7 @@ class YajawConfig:
         """
         if section in YajawConfig.__sections:
             YajawConfig._configuration_settings[section][setting] = value
+            YajawConfig._build_components(section, setting)
             YajawConfig._set_class_variables()
         else:
             raise NameError
@@ -125,30 +271,104 @@ class YajawConfig:
 
         Yajaw settings are loaded to a dictionary in memory from a configuration file, or
         use default values if the file is missing. Jira instance and access must be updated
-        if no file is found.
+        if no file is found. Settings missing from the file keep their default values.
         """
         fname = "yajaw.toml"
         try:
             with open(Path.home() / ".yajaw" / fname, "rb") as toml:
-                YajawConfig._configuration_settings = tomllib.load(toml)
+                for section, settings in tomllib.load(toml).items():
+                    YajawConfig._configuration_settings.setdefault(section, {}).update(settings)
         except FileNotFoundError:
             ...
         YajawConfig._configuration_settings["log"] = {}
         YajawConfig._configuration_settings["log"]["logger"] = YajawConfig._define_logger()
-        limit = YajawConfig._configuration_settings["concurrency"]["semaphore_limit"]
-        # Ensures da minimum value of 5 for the BoundedSemaphore
-        semaphore_limit = (
-            limit if limit > YajawConfig._MIN_SEMAPHORE_LIMIT else YajawConfig._MIN_SEMAPHORE_LIMIT
-        )
-        YajawConfig._configuration_settings["concurrency"]["semaphore"] = asyncio.BoundedSemaphore(
-            semaphore_limit
-        )
-        YajawConfig._configuration_settings["pagination"]["default"] = {
-            "startAt": 0,
-            "maxResults": YajawConfig._configuration_settings["pagination"]["page_results"],
-        }
+        YajawConfig._build_components()
         YajawConfig._set_class_variables()
 
+    @staticmethod
+    def _build_components(section: str | None = None, setting: str | None = None):
+        """
+        Builds the objects derived from the configuration settings.
+
+        Every object is built when no setting is informed. Otherwise, only the objects
+        depending on the updated setting are built again, so the others keep their state,
+        such as cached entries or open circuits. Updating an object itself, for instance
+        to inject a custom Metrics hook, replaces it without building anything.
+
+        Args:
+            section (str | None, optional): Section of the updated setting. Defaults to None.
+            setting (str | None, optional): Updated setting. Defaults to None.
+        """
+        settings = YajawConfig._configuration_settings
+        for (component_section, name), inputs in YajawConfig._components.items():
+            if section is not None and (component_section != section or setting not in inputs):
+                continue
+            settings[component_section][name] = YajawConfig._build_component(
+                component_section, name, settings[component_section]
+            )
+
+    @staticmethod
+    def _build_component(section: str, name: str, values: dict):
+        """Returns the named object built from the settings of the section, or None if disabled."""
+        match section, name:
+            case "retries", "budget":
+                # The budget is shared by the policies built whenever settings are updated
+                return RetryBudget(values["budget_capacity"], values["budget_rate"])
+            case "rate_limit", "limiter":
+                return RateLimiter(values["rates"], values["bursts"]) if values["enabled"] else None
+            case "metrics", "registry":
+                # Enabled metrics are aggregated by a Prometheus sink, which also provides snapshots
+                return Metrics(PrometheusSink(values["buckets"])) if values["enabled"] else None
+            case "circuit_breaker", "registry":
+                return (
+                    CircuitBreakerRegistry(
+                        values["failure_threshold"],
+                        values["recovery_time"],
+                        values["half_open_probes"],
+                    )
+                    if values["enabled"]
+                    else None
+                )
+            case "concurrency", "semaphore":
+                # Ensures da minimum value of 5 for the BoundedSemaphore
+                semaphore_limit = max(values["semaphore_limit"], YajawConfig._MIN_SEMAPHORE_LIMIT)
+                # Adaptive mode starts from the semaphore limit and adjusts it from the responses
+                return (
+                    AdaptiveLimiter(
+                        floor=values["adaptive_floor"],
+                        ceiling=values["adaptive_ceiling"],
+                        initial=semaphore_limit,
+                    )
+                    if values["mode"] == "adaptive"
+                    else asyncio.BoundedSemaphore(semaphore_limit)
+                )
+            case "cache", "http_cache":
+                # An empty directory keeps the HTTP cache disabled
+                return (
+                    HttpCache(values["http_directory"], values["http_max_bytes"])
+                    if values["http_directory"]
+                    else None
+                )
+            case "cache", "memory_cache":
+                # No entries keeps the in-memory cache disabled
+                return (
+                    MemoryCache(
+                        values["memory_entries"],
+                        values["memory_ttl"],
+                        values["memory_endpoint_ttls"],
+                    )
+                    if values["memory_entries"]
+                    else None
+                )
+            case "cache", "total_estimates":
+                # No entries keeps the total estimates disabled
+                return (
+                    TotalEstimates(values["estimate_entries"], values["estimate_path"])
+                    if values["estimate_entries"]
+                    else None
+                )
+        raise NameError(f"{section}.{name}")
+
     @staticmethod
     def _define_logger() -> logging.Logger:
         """
@@ -187,9 +407,65 @@ class YajawConfig:
         YajawConfig.TRIES = YajawConfig._configuration_settings["retries"]["tries"]
         YajawConfig.DELAY = YajawConfig._configuration_settings["retries"]["delay"]
         YajawConfig.BACKOFF = YajawConfig._configuration_settings["retries"]["backoff"]
+        retries = YajawConfig._configuration_settings["retries"]
+        YajawConfig.RETRY_POLICY = retries.get("policy") or RetryPolicy(
+            tries=retries["tries"],
+            base_delay=retries["delay"],
+            multiplier=retries["backoff"],
+            max_delay=retries["max_delay"],
+            jitter=retries["jitter"],
+            status_tries=retries["status_tries"],
+            budget=retries["budget"],
+        )
+        YajawConfig.CIRCUIT_BREAKERS = YajawConfig._configuration_settings["circuit_breaker"][
+            "registry"
+        ]
+        YajawConfig.RATE_LIMITER = YajawConfig._configuration_settings["rate_limit"]["limiter"]
+        YajawConfig.METRICS = YajawConfig._configuration_settings["metrics"]["registry"]
         YajawConfig.LOGGER = YajawConfig._configuration_settings["log"]["logger"]
         YajawConfig.SEMAPHORE = YajawConfig._configuration_settings["concurrency"]["semaphore"]
+        YajawConfig.SEMAPHORE_LIMIT = max(
+            YajawConfig._configuration_settings["concurrency"]["semaphore_limit"],
+            YajawConfig._MIN_SEMAPHORE_LIMIT,
+        )
+        YajawConfig.RUNNER_MODE = YajawConfig._configuration_settings["concurrency"]["runner"]
         YajawConfig.TIMEOUT = YajawConfig._configuration_settings["requests"]["timeout"]
+        YajawConfig.JSON_DECODER = get_decoder(
+            YajawConfig._configuration_settings["requests"]["json_decoder"]
+        )
+        YajawConfig._configuration_settings["pagination"]["default"] = {
+            "startAt": 0,
+            "maxResults": YajawConfig._configuration_settings["pagination"]["page_results"],
+        }
         YajawConfig.DEFAULT_PAGINATION = YajawConfig._configuration_settings["pagination"][
             "default"
         ]
+        YajawConfig.PAGE_WINDOW = YajawConfig._configuration_settings["pagination"]["page_window"]
+        YajawConfig.SPECULATIVE_PAGINATION = bool(
+            YajawConfig._configuration_settings["pagination"]["speculative"]
+        )
+        YajawConfig.PROBE_WINDOW = max(
+            1, YajawConfig._configuration_settings["pagination"]["probe_window"]
+        )
+        YajawConfig.MAX_PROBE_WINDOW = max(
+            YajawConfig.PROBE_WINDOW,
+            YajawConfig._configuration_settings["pagination"]["max_probe_window"],
+        )
+        YajawConfig.ADAPTIVE_PAGINATION = bool(
+            YajawConfig._configuration_settings["pagination"]["adaptive"]
+        )
+        YajawConfig.MAX_PAGE_RESULTS = YajawConfig._configuration_settings["pagination"][
+            "max_page_results"
+        ]
+        YajawConfig.TARGET_PAGE_SECONDS = YajawConfig._configuration_settings["pagination"][
+            "target_page_seconds"
+        ]
+        YajawConfig.TARGET_PAGE_BYTES = YajawConfig._configuration_settings["pagination"][
+            "target_page_bytes"
+        ]
+        YajawConfig.FIELD_PROFILES = YajawConfig._configuration_settings["field_profiles"]
+        YajawConfig.HTTP_CACHE = YajawConfig._configuration_settings["cache"]["http_cache"]
+        YajawConfig.MEMORY_CACHE = YajawConfig._configuration_settings["cache"]["memory_cache"]
+        YajawConfig.TOTAL_ESTIMATES = YajawConfig._configuration_settings["cache"][
+            "total_estimates"
+        ]
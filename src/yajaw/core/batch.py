@@ -0,0 +1,172 @@
+"""Module responsible for running many sync calls concurrently on a single event loop."""
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from yajaw.core.session import Session
+from yajaw.utils.concurrency import bind_batch, unbind_batch
+
+_PENDING = object()
+
+
+class BatchCall:
+    """
+    Class representing the lazy result of a sync call made inside a batch.
+
+    The call is not sent when it is made. It is sent together with every other call
+    pending in the batch when the result of any of them is accessed, or when the
+    batch block exits.
+    """
+
+    def __init__(self, batch: "Batch", coroutine_function: Callable[[], Awaitable]):
+        """
+        Initializes a BatchCall object.
+
+        Args:
+            batch (Batch): Batch running the call.
+            coroutine_function (Callable[[], Awaitable]): Function creating the coroutine\
+            of the call.
+        """
+        self._batch = batch
+        self._coroutine_function = coroutine_function
+        self._result = _PENDING
+        self._exception: BaseException | None = None
+
+    def done(self) -> bool:
+        """Whether the call was already sent and completed."""
+        return self._result is not _PENDING or self._exception is not None
+
+    def result(self):
+        """
+        Returns the result of the call, running the pending calls of the batch if needed.
+
+        Raises:
+            Exception: The exception raised by the call, if any.
+        """
+        if not self.done():
+            self._batch.flush()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    async def _run(self):
+        """Awaits the call and keeps its outcome."""
+        try:
+            self._result = await self._coroutine_function()
+        except Exception as exc:
+            self._exception = exc
+
+    def __repr__(self) -> str:
+        state = "done" if self.done() else "pending"
+        return f"BatchCall({state})"
+
+
+class Batch:
+    """
+    Class representing a group of sync calls run concurrently on one event loop.
+
+    Inside the block, sync functions of yajaw.jira return a BatchCall instead of
+    their result. The pending calls are sent concurrently, over the pooled client of
+    a session, when any result is accessed or when the block exits:
+
+        with yajaw.batch() as b:
+            project = jira.fetch_project("ABC")
+            issue = jira.fetch_issue("ABC-1")
+            issues = jira.search_issues("project = ABC")
+        print(project.result()["name"], len(issues.result()))
+
+    Attributes:
+        session: Session owning the event loop and the pooled client.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = False,
+    ):
+        """
+        Initializes a Batch object with the given pool configuration.
+
+        Args:
+            limits (httpx.Limits | None, optional): Connection pool limits. Defaults to\
+            a pool sized after the configured semaphore limit.
+            keepalive_expiry (float | None, optional): Seconds an idle connection is kept\
+            alive. It overrides the value set in limits. Defaults to None.
+            http2 (bool, optional): Enables HTTP/2. Defaults to False.
+        """
+        self.session = Session(limits=limits, keepalive_expiry=keepalive_expiry, http2=http2)
+        self._pending: list[BatchCall] = []
+        self._token = None
+
+    def defer(self, func: Callable[..., Awaitable], args: tuple, kwargs: dict) -> BatchCall:
+        """
+        Queues the call to be sent with the other pending calls.
+
+        Args:
+            func (Callable[..., Awaitable]): Function returning the coroutine of the call.
+            args (tuple): Positional arguments of the call.
+            kwargs (dict): Keyword arguments of the call.
+
+        Returns:
+            BatchCall: Lazy result of the call.
+        """
+        call = BatchCall(self, functools.partial(func, *args, **kwargs))
+        self._pending.append(call)
+        return call
+
+    def owns_running_loop(self) -> bool:
+        """Whether the caller already runs on the event loop of the batch."""
+        runner = self.session.runner
+        return runner is not None and runner.owns_running_loop()
+
+    def flush(self):
+        """Sends every pending call concurrently and waits for all of them."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        async def run_all():
+            await asyncio.gather(*(call._run() for call in pending))
+
+        self.session.runner.run(run_all())
+
+    def __enter__(self) -> "Batch":
+        self.session.__enter__()
+        self._token = bind_batch(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        unbind_batch(self._token)
+        try:
+            if exc_info[0] is None:
+                self.flush()
+            else:
+                for call in self._pending:
+                    call._exception = RuntimeError("Batch exited before the call was sent.")
+                self._pending.clear()
+        finally:
+            self.session.__exit__(*exc_info)
+
+
+def batch(
+    limits: httpx.Limits | None = None,
+    keepalive_expiry: float | None = None,
+    http2: bool = False,
+) -> Batch:
+    """
+    Creates a Batch to run sync calls concurrently inside a with block.
+
+    Args:
+        limits (httpx.Limits | None, optional): Connection pool limits. Defaults to\
+        a pool sized after the configured semaphore limit.
+        keepalive_expiry (float | None, optional): Seconds an idle connection is kept\
+        alive. It overrides the value set in limits. Defaults to None.
+        http2 (bool, optional): Enables HTTP/2. Defaults to False.
+
+    Returns:
+        Batch: Batch to be used as a context manager.
+    """
+    return Batch(limits=limits, keepalive_expiry=keepalive_expiry, http2=http2)
@@ -0,0 +1,214 @@
+"""Module responsible for failing fast while a Jira instance keeps failing."""
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from http import HTTPStatus
+
+import httpx
+
+from yajaw.exceptions import CircuitOpenError
+
+CircuitState = Enum("CircuitState", ["CLOSED", "OPEN", "HALF_OPEN"])
+
+
+class CircuitBreaker:
+    """
+    Class representing a circuit breaker guarding the requests sent to a host.
+
+    The circuit is closed while requests succeed. After failure_threshold consecutive
+    failures, meaning transport errors, 429 or 5xx responses, it opens and every request
+    fails right away with CircuitOpenError. Once recovery_time has elapsed it becomes
+    half-open and lets up to half_open_probes requests through: a success closes the
+    circuit and a failure opens it again. Other 4xx responses are neutral, so they
+    neither close nor open the circuit.
+
+    Attributes:
+        key: Identifier of the guarded host.
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_time: Seconds the circuit stays open before probing the host.
+        half_open_probes: Requests allowed through while the circuit is half-open.
+        state: Current state of the circuit.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        half_open_probes: int = 1,
+        listeners: list[Callable] | None = None,
+    ):
+        """
+        Initializes a closed CircuitBreaker object.
+
+        Args:
+            key (str): Identifier of the guarded host.
+            failure_threshold (int, optional): Consecutive failures that open the circuit.\
+            Defaults to 5.
+            recovery_time (float, optional): Seconds before probing the host. Defaults to 30.0.
+            half_open_probes (int, optional): Requests allowed through while half-open.\
+            Defaults to 1.
+            listeners (list[Callable] | None, optional): Callables receiving the key, the\
+            previous and the new state on every transition. Defaults to None.
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_probes = half_open_probes
+        self.state = CircuitState.CLOSED
+        self._listeners = listeners if listeners is not None else []
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: CircuitState) -> tuple | None:
+        """Changes the state and returns the transition. It expects the lock to be held."""
+        if state is self.state:
+            return None
+        previous, self.state = self.state, state
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        self._probes = 0
+        return previous, state
+
+    def _notify(self, transition: tuple | None):
+        """Calls the listeners with the transition, if any."""
+        if transition is not None:
+            for listener in self._listeners:
+                listener(self.key, *transition)
+
+    def before_request(self):
+        """
+        Checks if a request may be sent to the host.
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with every probe in flight.
+        """
+        with self._lock:
+            transition = None
+            if (
+                self.state is CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.recovery_time
+            ):
+                transition = self._transition(CircuitState.HALF_OPEN)
+            allowed = self.state is CircuitState.CLOSED or (
+                self.state is CircuitState.HALF_OPEN and self._probes < self.half_open_probes
+            )
+            if allowed and self.state is CircuitState.HALF_OPEN:
+                self._probes += 1
+        self._notify(transition)
+        if not allowed:
+            raise CircuitOpenError(f"Circuit breaker is open for {self.key}")
+
+    def record(self, result: httpx.Response | Exception | None):
+        """
+        Records the outcome of a request sent after before_request.
+
+        Args:
+            result (httpx.Response | Exception | None): Response or transport error\
+            received. None records an abandoned request without changing the state, like\
+            4xx responses other than 429.
+        """
+        if isinstance(result, httpx.TransportError):
+            failed = True
+        elif not isinstance(result, httpx.Response):
+            failed = None
+        elif result.status_code == HTTPStatus.TOO_MANY_REQUESTS or httpx.codes.is_server_error(
+            result.status_code
+        ):
+            failed = True
+        elif httpx.codes.is_client_error(result.status_code):
+            # Such as 401 or 404, which tell nothing about the health of the host
+            failed = None
+        else:
+            failed = False
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+            transition = None
+            if failed is True:
+                self._failures += 1
+                if self.state is CircuitState.HALF_OPEN or (
+                    self._failures >= self.failure_threshold
+                ):
+                    transition = self._transition(CircuitState.OPEN)
+            elif failed is False:
+                self._failures = 0
+                transition = self._transition(CircuitState.CLOSED)
+        self._notify(transition)
+
+
+class CircuitBreakerRegistry:
+    """
+    Class representing the circuit breakers of every host, created on first use.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open a circuit.
+        recovery_time: Seconds a circuit stays open before probing the host.
+        half_open_probes: Requests allowed through while a circuit is half-open.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_time: float = 30.0, half_open_probes: int = 1
+    ):
+        """
+        Initializes an empty CircuitBreakerRegistry object.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that open a circuit.\
+            Defaults to 5.
+            recovery_time (float, optional): Seconds before probing a host. Defaults to 30.0.
+            half_open_probes (int, optional): Requests allowed through while half-open.\
+            Defaults to 1.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_probes = half_open_probes
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._listeners: list[Callable] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable):
+        """
+        Registers a callable notified of every state transition.
+
+        Args:
+            listener (Callable): Callable receiving the base URL of the host, the previous\
+            and the new CircuitState.
+        """
+        self._listeners.append(listener)
+
+    def get(self, url: str) -> CircuitBreaker:
+        """
+        Returns the circuit breaker of the host serving the URL.
+
+        Args:
+            url (str): URL of the request.
+
+        Returns:
+            CircuitBreaker: The breaker keyed by the base URL of the host.
+        """
+        parsed = httpx.URL(url)
+        key = f"{parsed.scheme}://{parsed.netloc.decode()}"
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(
+                    key,
+                    failure_threshold=self.failure_threshold,
+                    recovery_time=self.recovery_time,
+                    half_open_probes=self.half_open_probes,
+                    listeners=self._listeners,
+                )
+            return self._breakers[key]
+
+    def states(self) -> dict:
+        """
+        Returns the current state of every circuit breaker.
+
+        Returns:
+            Dictionary of CircuitState keyed by base URL.
+        """
+        with self._lock:
+            return {key: breaker.state for key, breaker in self._breakers.items()}
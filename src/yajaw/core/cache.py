@@ -0,0 +1,489 @@
+"""Module responsible for caching HTTP responses of read requests."""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import httpx
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class HttpCache:
+    """
+    Class representing an on-disk cache of response bodies and their validators.
+
+    Responses carrying an ETag or Last-Modified header are stored on disk. Later
+    requests for the same resource are sent with If-None-Match or If-Modified-Since,
+    and a 304 Not Modified answer is served from the cache without transferring the
+    body again. The cache is bounded in bytes and evicts the least recently used
+    entries first. The methods reading or writing files block, so the REST layer runs
+    them in a worker thread, and the counters are guarded by a lock shared by every
+    thread and event loop using the cache.
+
+    Attributes:
+        directory: Directory holding the cached entries.
+        max_bytes: Maximum number of bytes of cached bodies.
+        hits: Number of 304 responses served from the cache.
+        misses: Number of responses transferred in full.
+        revalidations: Number of conditional requests sent.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 256 * 1024**2):
+        """
+        Initializes a HttpCache object and indexes the entries already on disk.
+
+        Args:
+            directory (str | Path): Directory holding the cached entries. It is created\
+            if missing.
+            max_bytes (int, optional): Maximum number of bytes of cached bodies.\
+            Defaults to 256 MiB.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        bodies = sorted(self.directory.glob("*.body"), key=lambda path: path.stat().st_mtime)
+        for body in bodies:
+            self._entries[body.stem] = body.stat().st_size
+            self._size += self._entries[body.stem]
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        """Returns the cache key of a GET request for the url and parameters."""
+        identity = json.dumps([str(url), params], sort_keys=True, default=str)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Returns the metadata and body file paths of the entry."""
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def validators(self, key: str) -> dict:
+        """
+        Returns the conditional request headers for the cached entry.
+
+        Args:
+            key (str): Cache key of the request.
+
+        Returns:
+            Dictionary with If-None-Match and If-Modified-Since headers. An empty\
+            dictionary is returned if the entry is not cached.
+        """
+        meta_path, _ = self._paths(key)
+        with self._lock:
+            if key not in self._entries:
+                return {}
+        try:
+            headers = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        validators = {}
+        if "etag" in headers:
+            validators["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validators["If-Modified-Since"] = headers["last-modified"]
+        if validators:
+            with self._lock:
+                self.revalidations += 1
+        return validators
+
+    def store(self, key: str, response: httpx.Response):
+        """
+        Stores the response body if it carries any validator.
+
+        Args:
+            key (str): Cache key of the request.
+            response (httpx.Response): Successful response received for the request.
+        """
+        with self._lock:
+            self.misses += 1
+        headers = {
+            name: response.headers[name] for name in _STORED_HEADERS if name in response.headers
+        }
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+        content = response.content
+        if len(content) > self.max_bytes:
+            return
+        meta_path, body_path = self._paths(key)
+        _write_atomically(body_path, content)
+        _write_atomically(meta_path, json.dumps(headers).encode())
+        with self._lock:
+            self._size += len(content) - self._entries.pop(key, 0)
+            self._entries[key] = len(content)
+            self._evict()
+
+    def revalidated(self, key: str, response: httpx.Response) -> httpx.Response:
+        """
+        Returns the cached response matching a 304 Not Modified answer.
+
+        Args:
+            key (str): Cache key of the request.
+            response (httpx.Response): The 304 response received for the request.
+
+        Returns:
+            httpx.Response: Response rebuilt from the cache, or the original response if\
+            the entry is no longer available.
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            headers = json.loads(meta_path.read_text())
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            return response
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        try:
+            os.utime(body_path)
+        except OSError:
+            # The entry was evicted meanwhile, but its content was already read
+            ...
+        return httpx.Response(
+            status_code=httpx.codes.OK, headers=headers, content=content, request=response.request
+        )
+
+    def _evict(self):
+        """Removes the least recently used entries until the cache fits its size limit."""
+        while self._size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Removes every cached entry."""
+        with self._lock:
+            for key in self._entries:
+                for path in self._paths(key):
+                    path.unlink(missing_ok=True)
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dictionary with hits, misses, revalidations, entries and bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+
+def _write_atomically(path: Path, content: bytes):
+    """Writes the content to a temporary file and renames it over the target path."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as temporary:
+        temporary.write(content)
+    try:
+        os.replace(temporary.name, path)
+    except OSError:
+        os.unlink(temporary.name)
+        raise
+
+
+class MemoryCache:
+    """
+    Class representing an in-process TTL and LRU cache of responses with request coalescing.
+
+    Responses of single-resource reads are kept in memory for a time to live defined
+    per endpoint, the first segment of the resource, such as project or issue. Identical
+    requests made while one is already in flight on the same event loop share its
+    result instead of being sent again.
+
+    Attributes:
+        max_entries: Maximum number of responses kept in memory.
+        ttl: Default time to live, in seconds, of the cached responses.
+        endpoint_ttls: Time to live, in seconds, per endpoint overriding the default.
+        hits: Number of requests served from memory.
+        misses: Number of requests sent to the Jira instance.
+        coalesced: Number of requests that waited on an identical in-flight request.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl: float = 60.0, endpoint_ttls: dict | None = None
+    ):
+        """
+        Initializes a MemoryCache object.
+
+        Args:
+            max_entries (int, optional): Maximum number of responses kept in memory.\
+            Defaults to 1024.
+            ttl (float, optional): Default time to live in seconds. Defaults to 60.0.
+            endpoint_ttls (dict | None, optional): Time to live in seconds per endpoint,\
+            such as {"project": 300, "issue": 30}. Defaults to None.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, str, httpx.Response]] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    @staticmethod
+    def key(method: str, url: str, params: dict) -> tuple:
+        """Returns the cache key of a request for the method, url and parameters."""
+        return method, str(url), json.dumps(params, sort_keys=True, default=str)
+
+    def _ttl(self, resource: str) -> float:
+        """Returns the time to live of the endpoint serving the resource."""
+        return self.endpoint_ttls.get(resource.split("/", 1)[0], self.ttl)
+
+    def get(self, key: tuple) -> httpx.Response | None:
+        """Returns the cached response for the key if it is still fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key: tuple, resource: str, response: httpx.Response):
+        """Stores the response and evicts the least recently used ones beyond the limit."""
+        ttl = self._ttl(resource)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, resource, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def fetch(
+        self, key: tuple, resource: str, loader: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Returns the cached response for the key, loading it if needed.
+
+        Args:
+            key (tuple): Cache key of the request.
+            resource (str): Resource part of the URL endpoint, used for its time to live.
+            loader (Callable[[], Awaitable[httpx.Response]]): Coroutine function that\
+            sends the request when the response is neither cached nor in flight.
+
+        Returns:
+            httpx.Response: The cached, shared or newly received response.
+        """
+        response = self.get(key)
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            return response
+
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            in_flight = self._in_flight.get(flight_key)
+            if in_flight is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                future = asyncio.get_running_loop().create_future()
+                self._in_flight[flight_key] = future
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The request being shared was cancelled, so this one is sent instead
+                return await self.fetch(key, resource, loader)
+
+        try:
+            response = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Marks the exception as retrieved when no request is waiting on it
+            future.exception()
+            raise
+        else:
+            self.put(key, resource, response)
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[flight_key]
+
+    def invalidate(self, resource: str | None = None):
+        """
+        Removes cached responses.
+
+        Args:
+            resource (str | None, optional): Resource, or resource prefix such as\
+            "project", whose responses are removed. Every response is removed when None.
+        """
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+                return
+            resource = resource.strip("/")
+            for key, (_, entry_resource, _) in list(self._entries.items()):
+                if entry_resource == resource or entry_resource.startswith(f"{resource}/"):
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dictionary with hits, misses, coalesced and entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "entries": len(self._entries),
+            }
+
+
+class TotalEstimates:
+    """
+    Class representing the last total observed per paginated request.
+
+    A paginated request normally waits for its first page to learn the total before
+    requesting the others. With an estimate from a previous run of the same request,
+    the first page and the estimated remaining pages are requested at once. Estimates
+    are kept in memory, bounded and evicted least recently used first, and optionally
+    persisted to a JSON file, so scheduled queries benefit across processes.
+
+    Attributes:
+        max_entries: Maximum number of estimates kept.
+        path: JSON file persisting the estimates, if any.
+        hits: Number of paginated requests started from an estimate.
+        misses: Number of paginated requests without an estimate.
+    """
+
+    _PAGINATION_ATTRIBUTES = ("startAt", "maxResults")
+
+    def __init__(self, max_entries: int = 4096, path: str | Path | None = None):
+        """
+        Initializes a TotalEstimates object and loads the persisted estimates, if any.
+
+        Args:
+            max_entries (int, optional): Maximum number of estimates kept.\
+            Defaults to 4096.
+            path (str | Path | None, optional): JSON file persisting the estimates.\
+            They are only kept in memory when None. Defaults to None.
+        """
+        self.max_entries = max_entries
+        self.path = None if not path else Path(path).expanduser()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        if self.path is not None and self.path.exists():
+            try:
+                stored = json.loads(self.path.read_bytes())
+                for key, (total, max_results) in list(stored.items())[-max_entries:]:
+                    self._entries[key] = (int(total), int(max_results))
+            except (OSError, TypeError, ValueError, AttributeError):
+                # A corrupt or unreadable file only loses the estimates
+                self._entries.clear()
+
+    @classmethod
+    def key(cls, method: str, url: str, params: dict, payload: dict) -> str:
+        """
+        Returns the estimate key of a paginated request, regardless of its page.
+
+        Whitespace in the JQL is normalized, so equivalent queries share an estimate.
+        """
+        params = {k: v for k, v in params.items() if k not in cls._PAGINATION_ATTRIBUTES}
+        payload = {k: v for k, v in payload.items() if k not in cls._PAGINATION_ATTRIBUTES}
+        if isinstance(payload.get("jql"), str):
+            payload["jql"] = " ".join(payload["jql"].split())
+        if isinstance(params.get("jql"), str):
+            params["jql"] = " ".join(params["jql"].split())
+        identity = json.dumps([method, str(url), params, payload], sort_keys=True, default=str)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[int, int] | None:
+        """
+        Returns the last total and maxResults observed for the request.
+
+        Args:
+            key (str): Estimate key of the request.
+
+        Returns:
+            tuple[int, int] | None: The total and maxResults, or None if not estimated.
+        """
+        with self._lock:
+            estimate = self._entries.get(key)
+            if estimate is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return estimate
+
+    def put(self, key: str, total: int, max_results: int):
+        """
+        Stores the total and maxResults observed for the request.
+
+        The estimates are written to the file when they change, so it blocks on disk
+        I/O and should be called in a worker thread from asynchronous code.
+
+        Args:
+            key (str): Estimate key of the request.
+            total (int): Total reported by the first page.
+            max_results (int): maxResults reported by the first page.
+        """
+        with self._lock:
+            changed = self._entries.get(key) != (total, max_results)
+            self._entries[key] = (total, max_results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        if not changed or self.path is None:
+            return
+        with self._write_lock:
+            # The content is taken once the file is free, so the last write is the latest
+            with self._lock:
+                content = json.dumps(self._entries).encode()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomically(self.path, content)
+
+    def clear(self):
+        """Removes every estimate, including the persisted ones."""
+        with self._lock:
+            self._entries.clear()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        """
+        Returns the estimate counters.
+
+        Returns:
+            Dictionary with hits, misses and entries.
+        """
+        with self._lock:
+            entries = len(self._entries)
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
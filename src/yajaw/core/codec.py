@@ -0,0 +1,77 @@
+"""Module responsible for decoding the JSON bodies of responses."""
+import json
+from collections.abc import Callable
+from typing import Any
+
+JsonDecoder = Callable[[bytes], Any]
+
+DECODERS = ("auto", "json", "orjson", "msgspec")
+
+
+def _json_decoder() -> JsonDecoder:
+    """Returns the decoder of the standard library."""
+    return json.loads
+
+
+def _orjson_decoder() -> JsonDecoder:
+    """Returns the orjson decoder. It requires the optional orjson package."""
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    """Returns the msgspec decoder. It requires the optional msgspec package."""
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+_FACTORIES = {"json": _json_decoder, "orjson": _orjson_decoder, "msgspec": _msgspec_decoder}
+
+
+def get_decoder(decoder: str | JsonDecoder = "auto") -> JsonDecoder:
+    """
+    Returns the function used to decode JSON bodies.
+
+    Args:
+        decoder (str | JsonDecoder, optional): Either a callable taking the body bytes,\
+        or the name of a decoder: json, orjson, msgspec or auto. The auto decoder is\
+        orjson, then msgspec, when installed, and json otherwise. Defaults to "auto".
+
+    Raises:
+        ValueError: The decoder name is not supported.
+        ImportError: The package of the requested decoder is not installed.
+
+    Returns:
+        JsonDecoder: Function decoding the body bytes into Python objects.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder not in DECODERS:
+        raise ValueError(f"Unsupported JSON decoder: {decoder}")
+    if decoder != "auto":
+        return _FACTORIES[decoder]()
+    for name in ("orjson", "msgspec"):
+        try:
+            return _FACTORIES[name]()
+        except ImportError:
+            continue
+    return _json_decoder()
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    Encodes the value into compact JSON bytes, with orjson when installed.
+
+    Args:
+        value (Any): Value made of JSON compatible objects.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+    return orjson.dumps(value)
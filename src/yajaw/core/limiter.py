@@ -0,0 +1,263 @@
+"""Module responsible for limiting the load sent to the Jira instance."""
+import asyncio
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+
+_OVERLOAD_STATUS = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)
+
+
+class AdaptiveLimiter:
+    """
+    Class representing a concurrency limit adjusted from the observed responses.
+
+    It is used like asyncio.BoundedSemaphore, but the number of requests in flight
+    follows an additive increase, multiplicative decrease (AIMD) policy. The limit grows
+    by about one slot per round of successful responses and shrinks by a factor when
+    a request times out, the server answers 429 or 503, or the recent latency exceeds
+    the long term latency by the tolerance factor. Slots are shared by every event
+    loop of the process.
+
+    Attributes:
+        floor: Minimum number of requests in flight.
+        ceiling: Maximum number of requests in flight.
+        decrease: Factor applied to the limit on overload.
+        tolerance: Ratio between recent and long term latency considered overload.
+    """
+
+    def __init__(
+        self,
+        floor: int = 5,
+        ceiling: int = 200,
+        initial: int | None = None,
+        decrease: float = 0.7,
+        tolerance: float = 2.0,
+    ):
+        """
+        Initializes an AdaptiveLimiter object.
+
+        Args:
+            floor (int, optional): Minimum number of requests in flight. Defaults to 5.
+            ceiling (int, optional): Maximum number of requests in flight. Defaults to 200.
+            initial (int | None, optional): Initial limit. Defaults to the floor.
+            decrease (float, optional): Factor applied to the limit on overload.\
+            Defaults to 0.7.
+            tolerance (float, optional): Ratio between recent and long term latency\
+            considered overload. Defaults to 2.0.
+        """
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.decrease = decrease
+        self.tolerance = tolerance
+        self._limit = float(min(max(initial or self.floor, self.floor), self.ceiling))
+        self._in_flight = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+        self._recent_latency: float | None = None
+        self._baseline_latency: float | None = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Current number of requests in flight."""
+        return self._in_flight
+
+    def stats(self) -> dict:
+        """
+        Returns the limiter gauges for monitoring.
+
+        Returns:
+            Dictionary with limit, in_flight, waiting, recent_latency and baseline_latency.
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "recent_latency": self._recent_latency,
+            "baseline_latency": self._baseline_latency,
+        }
+
+    async def acquire(self):
+        """Waits until a slot is available and takes it."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                handed_over = (loop, future) not in self._waiters
+                if not handed_over:
+                    self._waiters.remove((loop, future))
+            if handed_over:
+                self.release()
+            raise
+
+    def release(self):
+        """Gives the slot back and hands it over to the next waiter, if any."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def _wake_waiters(self):
+        """Hands the available slots over to the waiters. It expects the lock to be held."""
+        while self._waiters and self._in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            self._in_flight += 1
+            loop.call_soon_threadsafe(_set_if_pending, future)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info):
+        self.release()
+
+    def observe(self, latency: float, status_code: int | None = None, timeout: bool = False):
+        """
+        Adjusts the limit from the outcome of a request.
+
+        Args:
+            latency (float): Seconds taken by the request.
+            status_code (int | None, optional): Status code received. Defaults to None.
+            timeout (bool, optional): Whether the request timed out. Defaults to False.
+        """
+        with self._lock:
+            if self._baseline_latency is None:
+                self._baseline_latency = self._recent_latency = latency
+            self._recent_latency = 0.8 * self._recent_latency + 0.2 * latency
+            self._baseline_latency = 0.99 * self._baseline_latency + 0.01 * latency
+
+            overloaded = (
+                timeout
+                or status_code in _OVERLOAD_STATUS
+                or self._recent_latency > self.tolerance * self._baseline_latency
+            )
+            now = time.monotonic()
+            if overloaded:
+                # Responses of requests sent before the last decrease do not shrink it again
+                if now - self._last_decrease >= self._recent_latency:
+                    self._limit = max(self.floor, self._limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self._limit = min(self.ceiling, self._limit + 1 / self._limit)
+                self._wake_waiters()
+
+
+def _set_if_pending(future: asyncio.Future):
+    """Completes the future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+
+class TokenBucket:
+    """
+    Class representing a token bucket limiting the rate of requests.
+
+    Tokens are refilled at rate per second up to burst. Each request takes a token and
+    waits for it when the bucket is empty. Tokens are reserved under a thread lock, so
+    the same bucket may be shared by every event loop and thread of the process, and
+    waiters are served in arrival order.
+
+    Attributes:
+        rate: Number of tokens refilled per second.
+        burst: Maximum number of tokens in the bucket.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        """
+        Initializes a TokenBucket object with a full bucket.
+
+        Args:
+            rate (float): Number of tokens refilled per second.
+            burst (float | None, optional): Maximum number of tokens. Defaults to\
+            the rate, or one token if the rate is lower than one.
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, possibly in advance, and returns the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self):
+        """Gives back a reserved token, such as when its request is cancelled while waiting."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    async def acquire(self):
+        """Waits until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+
+
+class RateLimiter:
+    """
+    Class representing token buckets per endpoint class.
+
+    Requests are classified as search, issue, project, agile or default, and take a
+    token from the bucket of their class. A total bucket, when defined, is also
+    spent by every request to honour a global limit such as a per-user rate limit.
+
+    Attributes:
+        buckets: Token bucket per endpoint class.
+    """
+
+    def __init__(self, rates: dict[str, float], bursts: dict[str, float] | None = None):
+        """
+        Initializes a RateLimiter object.
+
+        Args:
+            rates (dict[str, float]): Requests per second per endpoint class, such as\
+            {"search": 2, "issue": 20, "total": 30}. Classes without a rate are not limited.
+            bursts (dict[str, float] | None, optional): Burst size per endpoint class.\
+            Defaults to the rate of each class.
+        """
+        bursts = bursts or {}
+        self.buckets = {
+            endpoint: TokenBucket(rate, bursts.get(endpoint))
+            for endpoint, rate in rates.items()
+            if rate > 0
+        }
+
+    async def acquire(self, endpoint: str):
+        """
+        Waits until the request may be sent according to its class and the total rate.
+
+        Args:
+            endpoint (str): Endpoint class of the request.
+        """
+        delay = 0.0
+        buckets = [self.buckets[name] for name in (endpoint, "total") if name in self.buckets]
+        for bucket in buckets:
+            delay = max(delay, bucket.reserve())
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # The tokens were never used, so later requests do not wait for them
+                for bucket in buckets:
+                    bucket.refund()
+                raise
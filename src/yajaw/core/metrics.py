@@ -0,0 +1,318 @@
+"""Module responsible for collecting metrics of the HTTP requests sent to Jira."""
+import copy
+import threading
+from collections.abc import Callable, Iterable
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RequestMetric:
+    """
+    Class representing the outcome of a single HTTP request attempt.
+
+    Attributes:
+        method: HTTP method of the request.
+        endpoint: Resource template of the request, such as issue/{id}.
+        status: Status code of the response, or None when no response was received.
+        error: Name of the exception raised instead of a response, if any.
+        attempt: Number of the attempt, starting at 1. Attempts after the first are retries.
+        seconds: Latency of the HTTP exchange, excluding the wait for the semaphore.
+        wait_seconds: Time spent waiting for the semaphore before sending the request.
+        request_bytes: Size of the request body.
+        response_bytes: Size of the response body.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "status",
+        "error",
+        "attempt",
+        "seconds",
+        "wait_seconds",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        status: int | None,
+        error: str | None,
+        attempt: int,
+        seconds: float,
+        wait_seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ):
+        """
+        Initializes a RequestMetric object.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): Resource template of the request.
+            status (int | None): Status code of the response.
+            error (str | None): Name of the exception raised instead of a response.
+            attempt (int): Number of the attempt, starting at 1.
+            seconds (float): Latency of the HTTP exchange.
+            wait_seconds (float): Time spent waiting for the semaphore.
+            request_bytes (int): Size of the request body.
+            response_bytes (int): Size of the response body.
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.error = error
+        self.attempt = attempt
+        self.seconds = seconds
+        self.wait_seconds = wait_seconds
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+
+    @property
+    def outcome(self) -> str:
+        """Status code as a string, or the name of the exception raised instead."""
+        return str(self.status) if self.status is not None else (self.error or "error")
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestMetric(method={self.method!r}, endpoint={self.endpoint!r},"
+            f" outcome={self.outcome!r}, seconds={self.seconds:.3f})"
+        )
+
+
+class MetricsSink:
+    """
+    Class representing a destination of the request metrics, which ignores them.
+
+    Subclasses override started, called when a request is sent, and record, called
+    with the outcome of each attempt. Both are called from the event loops sending
+    the requests, so they must be fast and thread-safe.
+    """
+
+    def started(self, method: str, endpoint: str):
+        """Called right before a request is sent, once the semaphore is acquired."""
+
+    def record(self, metric: RequestMetric):
+        """Called with the outcome of each request attempt."""
+
+
+class CallbackSink(MetricsSink):
+    """Class representing a sink passing each request metric to a callback."""
+
+    def __init__(self, callback: Callable[[RequestMetric], None]):
+        """
+        Initializes a CallbackSink object.
+
+        Args:
+            callback (Callable[[RequestMetric], None]): Function called with each metric.
+        """
+        self.callback = callback
+
+    def record(self, metric: RequestMetric):
+        self.callback(metric)
+
+
+class SnapshotSink(MetricsSink):
+    """
+    Class representing a sink aggregating the request metrics in memory.
+
+    Metrics are aggregated per method and endpoint template: latency histogram,
+    count per status, retries, semaphore wait, bytes and requests in flight.
+
+    Attributes:
+        buckets: Upper bounds, in seconds, of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Initializes a SnapshotSink object without any metric.
+
+        Args:
+            buckets (Iterable[float], optional): Upper bounds in seconds of the latency\
+            histogram buckets. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], dict] = {}
+
+    def _endpoint(self, method: str, endpoint: str) -> dict:
+        """Returns the aggregates of the endpoint. It expects the lock to be held."""
+        key = (method, endpoint)
+        if key not in self._endpoints:
+            self._endpoints[key] = {
+                "requests": 0,
+                "statuses": {},
+                "retries": 0,
+                "latency_buckets": [0] * len(self.buckets),
+                "latency_sum": 0.0,
+                "wait_sum": 0.0,
+                "wait_max": 0.0,
+                "request_bytes": 0,
+                "response_bytes": 0,
+                "in_flight": 0,
+                "in_flight_peak": 0,
+            }
+        return self._endpoints[key]
+
+    def started(self, method: str, endpoint: str):
+        with self._lock:
+            aggregates = self._endpoint(method, endpoint)
+            aggregates["in_flight"] += 1
+            aggregates["in_flight_peak"] = max(
+                aggregates["in_flight_peak"], aggregates["in_flight"]
+            )
+
+    def record(self, metric: RequestMetric):
+        with self._lock:
+            aggregates = self._endpoint(metric.method, metric.endpoint)
+            aggregates["in_flight"] = max(0, aggregates["in_flight"] - 1)
+            aggregates["requests"] += 1
+            outcome = metric.outcome
+            aggregates["statuses"][outcome] = aggregates["statuses"].get(outcome, 0) + 1
+            if metric.attempt > 1:
+                aggregates["retries"] += 1
+            for index, bound in enumerate(self.buckets):
+                if metric.seconds <= bound:
+                    aggregates["latency_buckets"][index] += 1
+            aggregates["latency_sum"] += metric.seconds
+            aggregates["wait_sum"] += metric.wait_seconds
+            aggregates["wait_max"] = max(aggregates["wait_max"], metric.wait_seconds)
+            aggregates["request_bytes"] += metric.request_bytes
+            aggregates["response_bytes"] += metric.response_bytes
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the aggregates.
+
+        Returns:
+            Dictionary of aggregates keyed by "METHOD endpoint". The latency buckets\
+            are cumulative counts, in the order of the buckets attribute.
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": copy.deepcopy(aggregates)
+                for (method, endpoint), aggregates in self._endpoints.items()
+            }
+
+    def reset(self):
+        """Removes every aggregate, except the requests still in flight."""
+        with self._lock:
+            in_flight = {
+                key: aggregates["in_flight"]
+                for key, aggregates in self._endpoints.items()
+                if aggregates["in_flight"]
+            }
+            self._endpoints.clear()
+            for (method, endpoint), count in in_flight.items():
+                self._endpoint(method, endpoint)["in_flight"] = count
+
+
+def _labels(method: str, endpoint: str, **extra: str) -> str:
+    """Returns the Prometheus label set of the endpoint."""
+    labels = {"method": method, "endpoint": endpoint, **extra}
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class PrometheusSink(SnapshotSink):
+    """
+    Class representing a sink aggregating the request metrics for Prometheus.
+
+    The aggregates are rendered in the Prometheus text exposition format, to be
+    served by any HTTP endpoint scraped by Prometheus.
+    """
+
+    _COUNTERS = (
+        ("retries", "yajaw_request_retries_total", "Number of retried request attempts."),
+        (
+            "wait_sum",
+            "yajaw_semaphore_wait_seconds_total",
+            "Time spent waiting for the semaphore.",
+        ),
+        ("request_bytes", "yajaw_request_bytes_total", "Size of the request bodies."),
+        ("response_bytes", "yajaw_response_bytes_total", "Size of the response bodies."),
+    )
+
+    def exposition(self) -> str:
+        """
+        Returns the aggregates in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        snapshot = self.snapshot()
+        endpoints = [(key.split(" ", 1), aggregates) for key, aggregates in snapshot.items()]
+        lines = [
+            "# HELP yajaw_request_duration_seconds Latency of the HTTP requests.",
+            "# TYPE yajaw_request_duration_seconds histogram",
+        ]
+        for (method, endpoint), aggregates in endpoints:
+            for bound, count in zip(self.buckets, aggregates["latency_buckets"]):
+                labels = _labels(method, endpoint, le=repr(float(bound)))
+                lines.append(f"yajaw_request_duration_seconds_bucket{labels} {count}")
+            labels = _labels(method, endpoint, le="+Inf")
+            lines.append(f"yajaw_request_duration_seconds_bucket{labels} {aggregates['requests']}")
+            labels = _labels(method, endpoint)
+            lines.append(f"yajaw_request_duration_seconds_sum{labels} {aggregates['latency_sum']}")
+            lines.append(f"yajaw_request_duration_seconds_count{labels} {aggregates['requests']}")
+
+        lines.append("# HELP yajaw_requests_total Number of request attempts per outcome.")
+        lines.append("# TYPE yajaw_requests_total counter")
+        for (method, endpoint), aggregates in endpoints:
+            for outcome, count in aggregates["statuses"].items():
+                labels = _labels(method, endpoint, status=outcome)
+                lines.append(f"yajaw_requests_total{labels} {count}")
+
+        for name, metric, description in self._COUNTERS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for (method, endpoint), aggregates in endpoints:
+                lines.append(f"{metric}{_labels(method, endpoint)} {aggregates[name]}")
+
+        lines.append("# HELP yajaw_requests_in_flight Number of requests in flight.")
+        lines.append("# TYPE yajaw_requests_in_flight gauge")
+        for (method, endpoint), aggregates in endpoints:
+            lines.append(
+                f"yajaw_requests_in_flight{_labels(method, endpoint)} {aggregates['in_flight']}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+class Metrics:
+    """
+    Class representing the hook of the REST layer dispatching the request metrics.
+
+    Each request attempt is reported to every sink. When metrics are disabled, the
+    hook is None and the REST layer skips every measurement.
+
+    Attributes:
+        sinks: Sinks receiving the metrics.
+    """
+
+    def __init__(self, *sinks: MetricsSink):
+        """
+        Initializes a Metrics object.
+
+        Args:
+            *sinks (MetricsSink): Sinks receiving the metrics.
+        """
+        self.sinks = list(sinks)
+
+    def add_sink(self, sink: MetricsSink):
+        """Adds a sink receiving the metrics from now on."""
+        self.sinks.append(sink)
+
+    def started(self, method: str, endpoint: str):
+        """Reports a request about to be sent to every sink."""
+        for sink in self.sinks:
+            sink.started(method, endpoint)
+
+    def record(self, metric: RequestMetric):
+        """Reports the outcome of a request attempt to every sink."""
+        for sink in self.sinks:
+            sink.record(metric)
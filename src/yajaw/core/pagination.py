@@ -0,0 +1,547 @@
+"""Module responsible for the strategies deciding which pages of a resource are requested."""
+import re
+import threading
+
+import httpx
+
+_ITEM_KEYS = ("issues", "values", "worklogs", "comments")
+
+
+def page_items(page: dict) -> list:
+    """
+    Returns the items of a decoded page, whatever the key holding them.
+
+    Args:
+        page (dict): Decoded page of a paginated resource.
+
+    Returns:
+        list: The items of the page. An empty list is returned if none is found.
+    """
+    for key in _ITEM_KEYS:
+        if isinstance(page.get(key), list):
+            return page[key]
+    return []
+
+
+def dedupe_items(pages: list[dict]) -> list[dict]:
+    """
+    Removes from each decoded page the items with an id already seen in a previous page.
+
+    Args:
+        pages (list[dict]): Decoded pages, updated in place.
+
+    Returns:
+        list[dict]: The same pages.
+    """
+    seen = set()
+    for page in pages:
+        for key in _ITEM_KEYS:
+            items = page.get(key)
+            if not isinstance(items, list):
+                continue
+            unique = []
+            for item in items:
+                item_id = item.get("id") if isinstance(item, dict) else None
+                if item_id is None or item_id not in seen:
+                    unique.append(item)
+                    seen.add(item_id)
+            page[key] = unique
+            break
+    return pages
+
+
+class PaginationStrategy:
+    """
+    Class representing a resource that is not paginated.
+
+    A strategy reads the pagination attributes of a decoded page and tells which
+    pages remain. When every remaining page is known from the first one, they are
+    requested concurrently. Otherwise, each page is requested once the previous one
+    arrived. Subclasses override matches, remaining_pages and next_page.
+
+    Attributes:
+        name: Name of the strategy.
+    """
+
+    name = "single"
+
+    def matches(self, page: dict) -> bool:
+        """Whether the attributes of the page are the ones read by the strategy."""
+        return True
+
+    def remaining_pages(self, page: dict) -> list[dict] | None:
+        """
+        Returns the attributes of every page after the given one.
+
+        Args:
+            page (dict): Decoded page, usually the first one.
+
+        Returns:
+            list[dict] | None: Attributes merged into the params or the payload of\
+            each remaining request, or None when the pages are only known one at a time.
+        """
+        return []
+
+    def next_page(self, page: dict) -> dict | None:
+        """
+        Returns the attributes of the page following the given one.
+
+        Args:
+            page (dict): Decoded page.
+
+        Returns:
+            dict | None: Attributes merged into the params or the payload of the next\
+            request, or None when the page is the last one.
+        """
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OffsetTotalStrategy(PaginationStrategy):
+    """
+    Class representing resources reporting startAt, maxResults and total.
+
+    Every remaining offset is known from the first page, so all of them are requested
+    concurrently. It is the case of the search and of most resources of the Jira API.
+    """
+
+    name = "total"
+
+    def matches(self, page: dict) -> bool:
+        return page.get("total") is not None and page.get("maxResults") is not None
+
+    def remaining_pages(self, page: dict) -> list[dict] | None:
+        start_at = page.get("startAt") or 0
+        max_results = page["maxResults"]
+        if max_results <= 0:
+            return []
+        return [
+            {"startAt": offset, "maxResults": max_results}
+            for offset in range(start_at + max_results, page["total"], max_results)
+        ]
+
+    def next_page(self, page: dict) -> dict | None:
+        start_at = (page.get("startAt") or 0) + page["maxResults"]
+        if page["maxResults"] <= 0 or start_at >= page["total"]:
+            return None
+        return {"startAt": start_at, "maxResults": page["maxResults"]}
+
+
+class OffsetIsLastStrategy(PaginationStrategy):
+    """
+    Class representing resources reporting startAt, maxResults and isLast.
+
+    Resources of the Agile API, such as boards and sprints, may omit the total. Pages
+    are then requested one after the other, each one starting after the items of the
+    previous one, until a page is marked as the last or comes back empty. When the
+    total is reported anyway, every remaining page is requested concurrently.
+    """
+
+    name = "is_last"
+
+    def matches(self, page: dict) -> bool:
+        return "isLast" in page
+
+    def remaining_pages(self, page: dict) -> list[dict] | None:
+        if page.get("isLast"):
+            return []
+        if page.get("total") is not None and page.get("maxResults") is not None:
+            return OffsetTotalStrategy().remaining_pages(page)
+        return None
+
+    def next_page(self, page: dict) -> dict | None:
+        items = page_items(page)
+        if page.get("isLast", True) or not items:
+            return None
+        return {
+            "startAt": (page.get("startAt") or 0) + len(items),
+            "maxResults": page.get("maxResults") or len(items),
+        }
+
+
+class NextPageStrategy(PaginationStrategy):
+    """
+    Class representing resources linking each page to the next one.
+
+    The link is either the URL of the next page, in nextPage, or an opaque cursor, in
+    nextPageToken. No page can be requested before the previous one arrived.
+    """
+
+    name = "next_page"
+
+    def matches(self, page: dict) -> bool:
+        return "nextPage" in page or "nextPageToken" in page
+
+    def remaining_pages(self, page: dict) -> list[dict] | None:
+        return [] if self.next_page(page) is None else None
+
+    def next_page(self, page: dict) -> dict | None:
+        if page.get("isLast"):
+            return None
+        if page.get("nextPageToken"):
+            return {"nextPageToken": page["nextPageToken"]}
+        if page.get("nextPage"):
+            return dict(httpx.URL(page["nextPage"]).params)
+        return None
+
+
+class SpeculativeStrategy(OffsetIsLastStrategy):
+    """
+    Class representing resources reporting isLast, paged by probing future offsets.
+
+    Instead of waiting for each page before requesting the next one, a window of
+    future offsets, spaced by maxResults, is requested concurrently. The window widens
+    while pages keep coming back full, and requests past the last page are cancelled
+    or discarded. It turns a long sequential walk into a few round trips.
+    """
+
+    name = "speculative"
+
+    def is_last(self, page: dict) -> bool:
+        """Whether the page is empty, marked as the last one, or short without isLast."""
+        items = page_items(page)
+        if not items:
+            return True
+        if "isLast" in page:
+            return bool(page["isLast"])
+        return len(items) < (page.get("maxResults") or len(items))
+
+
+class ProbeWindow:
+    """
+    Class representing the size of the window of offsets probed for a resource.
+
+    The window starts from the initial size scaled by the hit rate of the previous
+    walks of the resource, so resources that usually end early are probed with fewer
+    requests, and doubles after each window of full pages.
+
+    Attributes:
+        initial: Initial number of offsets probed concurrently.
+        maximum: Maximum number of offsets probed concurrently.
+        hit_rate: Moving average of the share of probed pages that were not past the end.
+    """
+
+    _SMOOTHING = 0.3
+
+    def __init__(self, initial: int = 4, maximum: int = 32):
+        """
+        Initializes a ProbeWindow object without any previous walk.
+
+        Args:
+            initial (int, optional): Initial number of offsets probed. Defaults to 4.
+            maximum (int, optional): Maximum number of offsets probed. Defaults to 32.
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.hit_rate = 1.0
+        self._lock = threading.Lock()
+
+    def start(self) -> int:
+        """Returns the size of the window at the beginning of a walk."""
+        with self._lock:
+            return max(1, min(self.maximum, round(self.initial * self.hit_rate)))
+
+    def grow(self, size: int) -> int:
+        """Returns the size of the window after a full window of pages."""
+        return min(self.maximum, size * 2)
+
+    def record(self, hits: int, misses: int):
+        """
+        Updates the hit rate with the outcome of a walk.
+
+        Args:
+            hits (int): Number of probed pages that were used.
+            misses (int): Number of probed pages past the end, cancelled or discarded.
+        """
+        if hits + misses == 0:
+            return
+        with self._lock:
+            observed = hits / (hits + misses)
+            self.hit_rate += self._SMOOTHING * (observed - self.hit_rate)
+
+
+_ID_SEGMENT = re.compile(r"([A-Za-z][A-Za-z0-9_]*-)?\d+")
+_NAME_SEGMENT = re.compile(r"[a-z][A-Za-z]*")
+# Collections whose next segment is a key, which Jira also accepts in lowercase
+_KEYED_COLLECTIONS = frozenset({"project", "issue"})
+_COLLECTION_RESOURCES = frozenset({"bulk", "createmeta", "picker", "recent", "search", "type"})
+
+
+def resource_template(resource: str) -> str:
+    """
+    Returns the resource with its identifiers replaced, so it has a bounded cardinality.
+
+    Numeric ids and issue keys are replaced by {id}, and any other identifier, such as
+    a project key or a name, by {key}. Segments made of a lowercase or camelCase word
+    are kept as resource names, unless they follow a collection addressed by key.
+
+    Args:
+        resource (str): Resource part of the URL endpoint.
+
+    Returns:
+        str: The resource template, such as project/{key} or board/{id}/sprint.
+    """
+    segments = resource.strip("/").split("/")
+    template = []
+    for position, segment in enumerate(segments):
+        previous = segments[position - 1] if position else None
+        if position and _ID_SEGMENT.fullmatch(segment):
+            template.append("{id}")
+        elif not position or (
+            _NAME_SEGMENT.fullmatch(segment)
+            and (previous not in _KEYED_COLLECTIONS or segment in _COLLECTION_RESOURCES)
+        ):
+            template.append(segment)
+        else:
+            template.append("{key}")
+    return "/".join(template)
+
+
+_probe_windows: dict[str, ProbeWindow] = {}
+_probe_windows_lock = threading.Lock()
+
+
+def probe_window(resource: str, initial: int, maximum: int) -> ProbeWindow:
+    """
+    Returns the probe window shared by the resources with the same path template.
+
+    Identifiers in the path are ignored, so the sprints of every board share a window.
+
+    Args:
+        resource (str): Resource part of the URL endpoint.
+        initial (int): Initial number of offsets probed, if the window is created.
+        maximum (int): Maximum number of offsets probed, if the window is created.
+
+    Returns:
+        ProbeWindow: The probe window of the resource.
+    """
+    template = resource_template(resource)
+    with _probe_windows_lock:
+        if template not in _probe_windows:
+            _probe_windows[template] = ProbeWindow(initial=initial, maximum=maximum)
+        return _probe_windows[template]
+
+
+class PageSizer:
+    """
+    Class representing the page size learned for an endpoint.
+
+    The first page is requested with the maximum size, so the server reveals its cap
+    through the maxResults it returns. The following requests use the largest size
+    within the cap whose expected latency and body size stay under their targets,
+    estimated from moving averages of the pages observed so far. The latency is
+    modelled as a fixed cost per request plus a cost per item: full pages measure
+    the cost of their size, while short pages, such as the last one or the only one
+    of a small result, only tell the fixed cost apart, so they never shrink the size.
+
+    Attributes:
+        minimum: Smallest page size requested.
+        maximum: Largest page size requested.
+        target_seconds: Target latency in seconds of a page.
+        target_bytes: Target body size in bytes of a page.
+        cap: Largest page size accepted by the server, once observed.
+        baseline_seconds: Estimated latency of a request regardless of its items.
+        seconds_per_item: Estimated latency per item on top of the baseline.
+        bytes_per_item: Moving average of the body size per item.
+    """
+
+    _SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        maximum: int = 1000,
+        target_seconds: float = 2.0,
+        target_bytes: int = 4 * 1024**2,
+        minimum: int = 10,
+    ):
+        """
+        Initializes a PageSizer object without any observed page.
+
+        Args:
+            maximum (int, optional): Largest page size requested. Defaults to 1000.
+            target_seconds (float, optional): Target latency of a page. Defaults to 2.0.
+            target_bytes (int, optional): Target body size of a page. Defaults to 4 MiB.
+            minimum (int, optional): Smallest page size requested. Defaults to 10.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.cap: int | None = None
+        self.baseline_seconds = 0.0
+        self.seconds_per_item: float | None = None
+        self.bytes_per_item: float | None = None
+        # Moving averages of the items and latency of the full and the short pages
+        self._full: tuple[float, float] | None = None
+        self._short: tuple[float, float] | None = None
+        self._lock = threading.Lock()
+
+    def page_size(self) -> int:
+        """Returns the number of results to request per page."""
+        with self._lock:
+            if self.cap is None:
+                return self.maximum
+            size = self.cap
+            if self.seconds_per_item:
+                budget = max(self.target_seconds - self.baseline_seconds, 0.0)
+                size = min(size, int(budget / self.seconds_per_item))
+            if self.bytes_per_item:
+                size = min(size, int(self.target_bytes / self.bytes_per_item))
+            return max(min(self.minimum, self.cap), size)
+
+    def _average(self, current: float | None, observed: float) -> float:
+        """Returns the moving average updated with the observed value."""
+        return observed if current is None else current + self._SMOOTHING * (observed - current)
+
+    def _average_page(
+        self, current: tuple[float, float] | None, items: int, seconds: float
+    ) -> tuple[float, float]:
+        """Returns the moving averages of items and latency updated with a page."""
+        if current is None:
+            return items, seconds
+        return self._average(current[0], items), self._average(current[1], seconds)
+
+    def _fit_latency(self):
+        """Updates the baseline and the latency per item from the full and short pages."""
+        if self._full is None:
+            return
+        full_items, full_seconds = self._full
+        if self._short is None or self._short[0] >= full_items:
+            self.baseline_seconds = 0.0
+            self.seconds_per_item = full_seconds / full_items
+            return
+        short_items, short_seconds = self._short
+        slope = max((full_seconds - short_seconds) / (full_items - short_items), 0.0)
+        self.baseline_seconds = max(min(short_seconds - slope * short_items, full_seconds), 0.0)
+        self.seconds_per_item = slope
+
+    def observe(self, requested: int, page: dict, seconds: float, size_bytes: int):
+        """
+        Updates the cap and the costs per item with a page.
+
+        Args:
+            requested (int): Number of results requested.
+            page (dict): Decoded page.
+            seconds (float): Latency of the page.
+            size_bytes (int): Size of the page body.
+        """
+        returned = page.get("maxResults")
+        items = len(page_items(page))
+        with self._lock:
+            if isinstance(returned, int) and returned > 0:
+                if returned < requested:
+                    self.cap = returned
+                elif self.cap is None or returned > self.cap:
+                    self.cap = min(returned, self.maximum)
+            if items:
+                self.bytes_per_item = self._average(self.bytes_per_item, size_bytes / items)
+            size = returned if isinstance(returned, int) and returned > 0 else requested
+            # Only a full page tells how the latency grows with the page size
+            if items and items >= min(size, requested):
+                self._full = self._average_page(self._full, items, seconds)
+            else:
+                self._short = self._average_page(self._short, items, seconds)
+            self._fit_latency()
+
+
+_page_sizers: dict[tuple, PageSizer] = {}
+_page_sizers_lock = threading.Lock()
+
+
+def page_sizer(
+    resource: str,
+    params: dict,
+    payload: dict,
+    maximum: int,
+    target_seconds: float,
+    target_bytes: int,
+) -> PageSizer:
+    """
+    Returns the page sizer shared by the requests with the same endpoint and projection.
+
+    Requests share a sizer when their resource template, expand and fields are the
+    same, since those decide the cost of each item.
+
+    Args:
+        resource (str): Resource part of the URL endpoint.
+        params (dict): Parameters of the request.
+        payload (dict): Payload of the request.
+        maximum (int): Largest page size requested, if the sizer is created.
+        target_seconds (float): Target latency of a page, if the sizer is created.
+        target_bytes (int): Target body size of a page, if the sizer is created.
+
+    Returns:
+        PageSizer: The page sizer of the request.
+    """
+    expand = payload.get("expand") or params.get("expand")
+    fields = payload.get("fields") or params.get("fields")
+    if isinstance(fields, list):
+        fields = ",".join(sorted(fields))
+    key = (resource_template(resource), str(expand), str(fields))
+    with _page_sizers_lock:
+        if key not in _page_sizers:
+            _page_sizers[key] = PageSizer(
+                maximum=maximum, target_seconds=target_seconds, target_bytes=target_bytes
+            )
+        return _page_sizers[key]
+
+
+STRATEGIES: dict[str, PaginationStrategy] = {
+    strategy.name: strategy
+    for strategy in (
+        NextPageStrategy(),
+        OffsetTotalStrategy(),
+        OffsetIsLastStrategy(),
+        PaginationStrategy(),
+        SpeculativeStrategy(),
+    )
+}
+
+
+def detect_strategy(page: dict) -> PaginationStrategy:
+    """
+    Returns the strategy matching the pagination attributes of a decoded page.
+
+    A link to the next page takes precedence over a total, which allows the widest
+    fan-out, and a total takes precedence over isLast.
+
+    Args:
+        page (dict): Decoded page, usually the first one.
+
+    Returns:
+        PaginationStrategy: The first matching strategy.
+    """
+    return next(strategy for strategy in STRATEGIES.values() if strategy.matches(page))
+
+
+def get_strategy(
+    strategy: str | PaginationStrategy | None, page: dict, speculative: bool = False
+) -> PaginationStrategy:
+    """
+    Returns the strategy to be used for a paginated resource.
+
+    Args:
+        strategy (str | PaginationStrategy | None): Either a strategy, the name of one,\
+        or None to detect it from the page.
+        page (dict): Decoded first page of the resource.
+        speculative (bool, optional): Whether a detected is_last strategy is replaced by\
+        the speculative one. Defaults to False.
+
+    Raises:
+        ValueError: The strategy name is not supported.
+
+    Returns:
+        PaginationStrategy: The strategy to be used.
+    """
+    if strategy is None or strategy == "auto":
+        detected = detect_strategy(page)
+        if speculative and detected.name == "is_last":
+            return STRATEGIES["speculative"]
+        return detected
+    if isinstance(strategy, PaginationStrategy):
+        return strategy
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unsupported pagination strategy: {strategy}")
+    return STRATEGIES[strategy]
@@ -1,12 +1,30 @@
 """Module responsible for lower level HTTP requests."""
 import asyncio
-import math
-import secrets
+import collections
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
 from http import HTTPStatus
 
 import httpx
 
 from yajaw import Option, YajawConfig, exceptions
+from yajaw.core.limiter import AdaptiveLimiter
+from yajaw.core.metrics import Metrics, RequestMetric
+from yajaw.core.pagination import (
+    STRATEGIES,
+    PaginationStrategy,
+    SpeculativeStrategy,
+    dedupe_items,
+    get_strategy,
+    page_items,
+    page_sizer,
+    probe_window,
+    resource_template,
+)
+from yajaw.utils.concurrency import LoopRunner, current_runner
 
 
 class _PersonalAccessTokenAuth(httpx.Auth):
@@ -49,16 +67,77 @@ def _generate_auth() -> _PersonalAccessTokenAuth:
     return _PersonalAccessTokenAuth(YajawConfig.JIRA_PAT)
 
 
-def _generate_client() -> httpx.AsyncClient:
+def _generate_client(limits: httpx.Limits | None = None, http2: bool = False) -> httpx.AsyncClient:
     """Function responsible for generating the client used in the context for HTTP requests."""
     return httpx.AsyncClient(
         auth=_generate_auth(),
         headers=_generate_headers(),
         timeout=YajawConfig.TIMEOUT,
         follow_redirects=True,
+        limits=limits or httpx.Limits(),
+        http2=http2,
     )
 
 
+_active_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "yajaw_active_client", default=None
+)
+
+
+def bind_client(client: httpx.AsyncClient) -> Token:
+    """Function that makes the client the implicit one for requests in the current context."""
+    return _active_client.set(client)
+
+
+def unbind_client(token: Token) -> None:
+    """Function that restores the implicit client active before the matching bind_client."""
+    _active_client.reset(token)
+
+
+_loop_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _runner_client(runner: LoopRunner) -> httpx.AsyncClient:
+    """Function that returns the pooled client of the runner loop, creating it on first use."""
+    client = _loop_clients.get(runner.loop)
+    if client is None:
+        client = _loop_clients[runner.loop] = _generate_client()
+
+        async def close_client():
+            del _loop_clients[runner.loop]
+            await client.aclose()
+
+        runner.add_finalizer(close_client)
+    return client
+
+
+@asynccontextmanager
+async def client_scope(client: httpx.AsyncClient | None = None):
+    """
+    Async context manager that yields the client used by HTTP requests.
+
+    The client explicitly provided has precedence, followed by the client bound by an
+    active yajaw.Session and the pooled client of the long-lived loop running the
+    request, such as the background runner. A new client is created otherwise and
+    closed on exit.
+
+    Args:
+        client (httpx.AsyncClient | None, optional): A client object to be reused.
+
+    Yields:
+        httpx.AsyncClient: The client to be used in the HTTP requests.
+    """
+    if client is None:
+        client = _active_client.get()
+    if client is None and (runner := current_runner()) is not None:
+        client = _runner_client(runner)
+    if client is not None:
+        yield client
+    else:
+        async with _generate_client() as ephemeral_client:
+            yield ephemeral_client
+
+
 class JiraInfo:
     """
     Class representing the Jira instance and the necessary parameters for HTTP requests.
@@ -116,20 +195,54 @@ def _log_and_raise_request_issue(error_type: str, warning: Option = Option.NO) -
     raise getattr(exceptions, error_type)
 
 
+# Attempt of the request being sent, reported by the metrics
+_current_attempt: ContextVar[int] = ContextVar("yajaw_attempt", default=1)
+
+
 async def _retry_request(jira: JiraInfo, client: httpx.AsyncClient):
     """Retry the given function on certain conditions."""
-    delay = secrets.SystemRandom().uniform(0, YajawConfig.DELAY)
-    for attempt in range(1, YajawConfig.TRIES + 1):
-        await asyncio.sleep(delay)
-        result = await _send_request(jira=jira, client=client)
+    policy = YajawConfig.RETRY_POLICY
+    attempt, delay = 0, 0.0
+    while True:
+        attempt += 1
+        if attempt > 1:
+            await asyncio.sleep(delay)
+        _current_attempt.set(attempt)
+        try:
+            result = await _send_guarded_request(jira=jira, client=client)
+        except httpx.TransportError as exc:
+            # Timeouts and connection errors are retried like failed responses
+            result = exc
         _log_attempt_info(result, attempt, delay, error=Option.NO)
-        if not _retry_response_error_detected(result):
+        retry = isinstance(result, httpx.TransportError) or _retry_response_error_detected(result)
+        if not retry:
             return result
-        delay *= YajawConfig.BACKOFF
+        if not policy.allows_retry(attempt, result):
+            break
+        delay = policy.next_delay(attempt, delay, result)
     _log_attempt_info(result, attempt, delay, error=Option.YES)
+    if isinstance(result, httpx.TransportError):
+        raise exceptions.InvalidResponseError from result
     raise exceptions.InvalidResponseError
 
 
+async def _send_guarded_request(jira: JiraInfo, client: httpx.AsyncClient):
+    """Sends the request through the circuit breaker of its host, if enabled."""
+    if YajawConfig.CIRCUIT_BREAKERS is None:
+        return await _send_request(jira=jira, client=client)
+    breaker = YajawConfig.CIRCUIT_BREAKERS.get(jira.url)
+    breaker.before_request()
+    result = None
+    try:
+        result = await _send_request(jira=jira, client=client)
+    except httpx.TransportError as exc:
+        result = exc
+        raise
+    finally:
+        breaker.record(result)
+    return result
+
+
 def _log_attempt_info(result, attempt, delay, error=Option.NO):
     """Log information for a retry attempt."""
     log_level = YajawConfig.LOGGER.error if error == Option.YES else YajawConfig.LOGGER.info
@@ -146,11 +259,114 @@ def _log_attempt_info(result, attempt, delay, error=Option.NO):
     log_level(log_message)
 
 
+def _endpoint_class(jira: JiraInfo) -> str:
+    """Function that classifies the request by the endpoint it targets."""
+    if jira.api in (YajawConfig.AGILE_API, YajawConfig.GREENHOPPER_API):
+        return "agile"
+    endpoint = jira.resource.split("/", 1)[0]
+    return endpoint if endpoint in ("search", "issue", "project") else "default"
+
+
+def _observe_limiter(limiter, start: float, response=None, timeout: bool = False):
+    """Feeds the outcome of a request to the limiter when it adapts to the responses."""
+    if isinstance(limiter, AdaptiveLimiter):
+        status_code = response.status_code if isinstance(response, httpx.Response) else None
+        limiter.observe(time.perf_counter() - start, status_code=status_code, timeout=timeout)
+
+
+_loop_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _concurrency_limiter() -> asyncio.BoundedSemaphore | AdaptiveLimiter:
+    """Returns the limiter of requests in flight usable on the running event loop."""
+    limiter = YajawConfig.SEMAPHORE
+    if isinstance(limiter, AdaptiveLimiter):
+        # The adaptive limiter is shared by every event loop of the process
+        return limiter
+    # asyncio semaphores are bound to the first event loop that waits on them
+    loop = asyncio.get_running_loop()
+    limit, semaphore = _loop_semaphores.get(loop, (None, None))
+    if limit != YajawConfig.SEMAPHORE_LIMIT:
+        semaphore = asyncio.BoundedSemaphore(YajawConfig.SEMAPHORE_LIMIT)
+        _loop_semaphores[loop] = (YajawConfig.SEMAPHORE_LIMIT, semaphore)
+    return semaphore
+
+
+def _record_metric(
+    metrics: Metrics,
+    method: str,
+    endpoint: str,
+    attempt: int,
+    wait_start: float,
+    start: float,
+    response: httpx.Response | None = None,
+    error: BaseException | None = None,
+):
+    """Reports the outcome of a request attempt to the metrics sinks."""
+    seconds = time.perf_counter() - start
+    request_bytes = response_bytes = 0
+    if isinstance(response, httpx.Response):
+        response_bytes = len(response.content)
+        try:
+            request_bytes = int(response.request.headers.get("content-length", 0))
+        except RuntimeError:
+            request_bytes = 0
+    metrics.record(
+        RequestMetric(
+            method=method,
+            endpoint=endpoint,
+            status=response.status_code if isinstance(response, httpx.Response) else None,
+            error=None if error is None else type(error).__name__,
+            attempt=attempt,
+            seconds=seconds,
+            wait_seconds=start - wait_start,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+        )
+    )
+
+
 async def _send_request(jira: JiraInfo, client: httpx.AsyncClient) -> httpx.Response:
     """Function responsible for making a low-level HTTP request."""
     method, url, params, payload = jira.method, jira.url, jira.params, jira.payload
-    async with YajawConfig.SEMAPHORE:
-        return await client.request(method=method, url=url, params=params, json=payload)
+    cache = YajawConfig.HTTP_CACHE if method == "GET" else None
+    key = None if cache is None else cache.key(url, params)
+    # The cache reads and writes files, which would otherwise block the event loop
+    headers = None if cache is None else await asyncio.to_thread(cache.validators, key)
+
+    if YajawConfig.RATE_LIMITER is not None:
+        await YajawConfig.RATE_LIMITER.acquire(_endpoint_class(jira))
+
+    metrics = YajawConfig.METRICS
+    limiter = _concurrency_limiter()
+    wait_start = time.perf_counter()
+    async with limiter:
+        start = time.perf_counter()
+        if metrics is not None:
+            endpoint = resource_template(jira.resource)
+            metrics.started(method, endpoint)
+            attempt = _current_attempt.get()
+        try:
+            response = await client.request(
+                method=method, url=url, params=params, json=payload, headers=headers
+            )
+        except BaseException as exc:
+            if isinstance(exc, httpx.TimeoutException):
+                _observe_limiter(limiter, start, timeout=True)
+            if metrics is not None:
+                _record_metric(metrics, method, endpoint, attempt, wait_start, start, error=exc)
+            raise
+        _observe_limiter(limiter, start, response=response)
+        if metrics is not None:
+            _record_metric(metrics, method, endpoint, attempt, wait_start, start, response=response)
+
+    if cache is None or not isinstance(response, httpx.Response):
+        return response
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return await asyncio.to_thread(cache.revalidated, key, response)
+    if httpx.codes.is_success(response.status_code):
+        await asyncio.to_thread(cache.store, key, response)
+    return response
 
 
 async def send_single_request(
@@ -162,92 +378,449 @@ async def send_single_request(
     Args:
         jira (JiraInfo): Object of JiraInfo class representing the Jira instance.
         client (httpx.AsyncClient | None, optional): A client object used in the HTTP request.
-        It may be already created when the function is called by send_paginated_requests. A new
-        client is created otherwise.
+        It may be already created when the function is called by send_paginated_requests or
+        bound by an active yajaw.Session. A new client is created and closed otherwise.
 
     Raises:
         exceptions.ResourceNotFoundError: Resource could not be found as informed.
+        exceptions.CircuitOpenError: The circuit breaker of the Jira instance is open.
+        exceptions.ResourceUnauthorizedError: The credentials were not accepted.
+        exceptions.ResourceForbiddenError: Access to the resource is forbidden.
         exceptions.YajawError: An error happened on a HTTP request.
 
     Returns:
         httpx.Response: _description_
     """
     try:
-        if client is None:
-            client = _generate_client()
-        task = asyncio.create_task(_retry_request(jira=jira, client=client))
-        response = await task
+        async with client_scope(client) as scoped_client:
+            task = asyncio.create_task(_retry_request(jira=jira, client=scoped_client))
+            response = await task
     except exceptions.ResourceNotFoundError as exc:
         YajawConfig.LOGGER.warning("Resource could not be found.")
         raise exceptions.ResourceNotFoundError from exc
+    except exceptions.CircuitOpenError:
+        YajawConfig.LOGGER.warning("Circuit breaker is open.")
+        raise
+    except (exceptions.ResourceUnauthorizedError, exceptions.ResourceForbiddenError):
+        YajawConfig.LOGGER.error("Access to the resource was denied.")
+        raise
     except exceptions.YajawError as e:
         YajawConfig.LOGGER.exception("An error happened on a HTTP request.")
         raise exceptions.YajawError from e
     return response
 
 
-async def send_paginated_requests(jira: JiraInfo) -> list[httpx.Response]:
+async def send_cached_request(
+    jira: JiraInfo, client: httpx.AsyncClient | None = None
+) -> httpx.Response:
     """
-    Sends a paginated HTTP request to a Jira instance.
+    Sends a HTTP request to a Jira instance through the in-memory cache.
+
+    When YajawConfig.MEMORY_CACHE is enabled, fresh responses are served from memory
+    and concurrent identical requests share a single one in flight. The request is
+    sent as in send_single_request otherwise.
 
     Args:
         jira (JiraInfo): Object of JiraInfo class representing the Jira instance.
+        client (httpx.AsyncClient | None, optional): A client object used in the HTTP\
+        request. The one bound by an active yajaw.Session, or a new one, is used otherwise.
 
     Returns:
-        list[httpx.Response]: List of response objects received from the requested pages.
+        httpx.Response: Response object, possibly shared with other callers.
     """
-    default_page_attr = YajawConfig.DEFAULT_PAGINATION
-    jira_list = _create_jira_list_with_page_attr(page_attr_list=[default_page_attr], jira=jira)
-    initial_jira = jira_list[0]
+    cache = YajawConfig.MEMORY_CACHE
+    if cache is None:
+        return await send_single_request(jira=jira, client=client)
+    key = cache.key(jira.method, jira.url, jira.params)
+    return await cache.fetch(
+        key, jira.resource, lambda: send_single_request(jira=jira, client=client)
+    )
 
-    client = _generate_client()
-    async with client:
-        # First request with default pagination
-        response = await send_single_request(jira=initial_jira, client=client)
 
-        responses = []
-        responses.append(response)
+# Pages decoded for their pagination attributes, handed over to the first decode_json call
+_decoded_pages: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-        # Identify if additional requests are needed
-        page_attr = _retrieve_pagination_attributes(response=response)
-        if _is_pagination_required(page_attr=page_attr):
-            # Generate the updated page_attr_list
-            page_attr_list = _create_list_of_page_attr(page_attr=page_attr)
 
-            # Generate the updated jira_list
-            jira_list = _create_jira_list_with_page_attr(page_attr_list=page_attr_list, jira=jira)
+def decode_json(response: httpx.Response):
+    """
+    Decodes the JSON body of the response with the configured decoder.
 
-            # Create concurrent requests for the additional pages
-            # iterate over jira_list
-            # Consolidate responses list
-            # for response in paginated_responses: responses.extend(response)
+    Pages returned by send_paginated_requests and iter_paginated_requests were already
+    decoded to read their pagination attributes. That decoded page is returned instead
+    of decoding the body again.
 
-            tasks = [
-                asyncio.create_task(send_single_request(jira=jira, client=client))
-                for jira in jira_list
-            ]
-            group_of_response = await asyncio.gather(*tasks)
+    Args:
+        response (httpx.Response): Response with a JSON body.
 
-            responses.extend(list(group_of_response))
+    Returns:
+        The decoded body.
+    """
+    page = _decoded_pages.pop(response, None)
+    if page is not None:
+        return page
+    return YajawConfig.JSON_DECODER(response.content)
+
+
+def _decode_page(response: httpx.Response) -> dict:
+    """Decodes the page and keeps it for the caller decoding the response later."""
+    page = decode_json(response)
+    _decoded_pages[response] = page
+    return page
+
+
+async def _send_page_request(
+    jira: JiraInfo, client: httpx.AsyncClient, decode: bool
+) -> httpx.Response | dict:
+    """Sends the request of a page and decodes its body if requested."""
+    response = await send_single_request(jira=jira, client=client)
+    return decode_json(response) if decode else response
+
+
+async def _iter_sequential_pages(
+    jira: JiraInfo,
+    client: httpx.AsyncClient,
+    pagination: PaginationStrategy,
+    page: dict,
+    decode: bool,
+) -> AsyncIterator[httpx.Response | dict]:
+    """Requests the pages following the given one, each once the previous one arrived."""
+    while (page_attr := pagination.next_page(page)) is not None:
+        page_jira = _create_jira_list_with_page_attr(page_attr_list=[page_attr], jira=jira)[0]
+        response = await send_single_request(jira=page_jira, client=client)
+        page = decode_json(response) if decode else _decode_page(response)
+        yield page if decode else response
+
+
+async def _iter_speculative_pages(
+    jira: JiraInfo,
+    client: httpx.AsyncClient,
+    pagination: SpeculativeStrategy,
+    page: dict,
+    decode: bool,
+    max_window: int,
+) -> AsyncIterator[httpx.Response | dict]:
+    """
+    Requests the pages following the given one by probing a window of future offsets.
 
-    return responses
+    The offsets are spaced by the maxResults of the given page and requested
+    concurrently. The window doubles after each window of full pages, up to max_window.
+    Requests past the last page are cancelled, or discarded if already answered, and
+    the share of useful requests feeds the initial window of the next walk.
+    """
+    if pagination.is_last(page):
+        return
+    stride = page.get("maxResults") or len(page_items(page))
+    next_offset = (page.get("startAt") or 0) + stride
+    probe = probe_window(jira.resource, YajawConfig.PROBE_WINDOW, YajawConfig.MAX_PROBE_WINDOW)
+    size = min(probe.start(), max_window)
+    in_flight: collections.deque[asyncio.Task] = collections.deque()
+
+    async def probe_offset(offset: int) -> tuple[httpx.Response, dict]:
+        "Request the page at the offset and decode it."
+        page_attr = {"startAt": offset, "maxResults": stride}
+        page_jira = _create_jira_list_with_page_attr(page_attr_list=[page_attr], jira=jira)[0]
+        response = await send_single_request(jira=page_jira, client=client)
+        return response, decode_json(response) if decode else _decode_page(response)
+
+    hits = 0
+    full_pages = 0
+    try:
+        while True:
+            while len(in_flight) < size:
+                in_flight.append(asyncio.create_task(probe_offset(next_offset)))
+                next_offset += stride
+            response, page = await in_flight.popleft()
+            hits += 1
+            yield page if decode else response
+            if pagination.is_last(page):
+                probe.record(hits=hits, misses=len(in_flight))
+                return
+            full_pages += 1
+            if full_pages >= size:
+                size = min(probe.grow(size), max_window)
+                full_pages = 0
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+def _iter_remaining_pages(
+    jira: JiraInfo,
+    client: httpx.AsyncClient,
+    pagination: PaginationStrategy,
+    page: dict,
+    decode: bool,
+    max_window: int,
+) -> AsyncIterator[httpx.Response | dict]:
+    """Returns the iterator over the pages following the given one when they are not known."""
+    if isinstance(pagination, SpeculativeStrategy):
+        return _iter_speculative_pages(
+            jira=jira,
+            client=client,
+            pagination=pagination,
+            page=page,
+            decode=decode,
+            max_window=max_window,
+        )
+    return _iter_sequential_pages(
+        jira=jira, client=client, pagination=pagination, page=page, decode=decode
+    )
+
+
+async def _send_first_page(
+    jira: JiraInfo, client: httpx.AsyncClient, estimate: tuple[int, int] | None = None
+) -> tuple[httpx.Response, dict]:
+    """
+    Sends the request of the first page and decodes it.
+
+    In adaptive mode, the number of results is the one learned for the endpoint and
+    the page updates what was learned. With an estimate, it is the maxResults that
+    spaced the estimated pages.
+    """
+    page_attr = dict(YajawConfig.DEFAULT_PAGINATION)
+    sizer = None
+    if YajawConfig.ADAPTIVE_PAGINATION:
+        sizer = page_sizer(
+            resource=jira.resource,
+            params=jira.params,
+            payload=jira.payload,
+            maximum=YajawConfig.MAX_PAGE_RESULTS,
+            target_seconds=YajawConfig.TARGET_PAGE_SECONDS,
+            target_bytes=YajawConfig.TARGET_PAGE_BYTES,
+        )
+        page_attr["maxResults"] = sizer.page_size()
+    if estimate is not None:
+        page_attr["maxResults"] = estimate[1]
+    initial_jira = _create_jira_list_with_page_attr(page_attr_list=[page_attr], jira=jira)[0]
+
+    started = time.monotonic()
+    response = await send_single_request(jira=initial_jira, client=client)
+    page = _decode_page(response)
+    if sizer is not None:
+        try:
+            seconds = response.elapsed.total_seconds()
+        except RuntimeError:
+            seconds = time.monotonic() - started
+        sizer.observe(
+            requested=page_attr["maxResults"],
+            page=page,
+            seconds=seconds,
+            size_bytes=len(response.content),
+        )
+    return response, page
+
+
+def _start_estimated_pages(
+    jira: JiraInfo, client: httpx.AsyncClient, estimate: tuple[int, int], decode: bool
+) -> dict[tuple, asyncio.Task]:
+    """Schedules the pages after the first one according to the estimated total."""
+    total, max_results = estimate
+    first_page = {"startAt": YajawConfig.DEFAULT_PAGINATION["startAt"], "maxResults": max_results}
+    page_attr_list = STRATEGIES["total"].remaining_pages({**first_page, "total": total})
+    return {
+        (page_attr["startAt"], page_attr["maxResults"]): asyncio.create_task(
+            _send_page_request(
+                jira=_create_jira_list_with_page_attr([page_attr], jira=jira)[0],
+                client=client,
+                decode=decode,
+            )
+        )
+        for page_attr in page_attr_list
+    }
+
+
+async def send_paginated_requests(
+    jira: JiraInfo,
+    client: httpx.AsyncClient | None = None,
+    decode: bool = False,
+    strategy: str | PaginationStrategy | None = None,
+) -> list[httpx.Response] | list[dict]:
+    """
+    Sends a paginated HTTP request to a Jira instance.
+
+    When total estimates are enabled and the same request was already paginated, the
+    first page and the estimated remaining pages are requested at once. Pages missing
+    from the estimate are requested once the first page reports the actual total, and
+    the estimated pages past it are cancelled.
+
+    Args:
+        jira (JiraInfo): Object of JiraInfo class representing the Jira instance.
+        client (httpx.AsyncClient | None, optional): A client object shared by all page\
+        requests. The one bound by an active yajaw.Session, or a new one, is used otherwise.
+        decode (bool, optional): Returns the decoded pages instead of the responses.\
+        Each body is then decoded exactly once, and items returned by two pages are\
+        only kept in the first one when the pages were estimated. Responses decoded\
+        to read their pagination attributes are not decoded again by decode_json.\
+        Defaults to False.
+        strategy (str | PaginationStrategy | None, optional): Pagination strategy of\
+        the resource, or its name: total, is_last, speculative, next_page or single. It is detected\
+        from the first page when None. Defaults to None.
 
+    Returns:
+        list[httpx.Response] | list[dict]: List of response objects received from the\
+        requested pages, or list of decoded pages when decode is True.
+    """
+    estimates = YajawConfig.TOTAL_ESTIMATES
+    estimate_key = None
+    estimate = None
+    estimated_tasks: dict[tuple, asyncio.Task] = {}
+
+    async with client_scope(client) as client:
+        if estimates is not None and strategy in (None, "auto", "total"):
+            estimate_key = estimates.key(jira.method, jira.url, jira.params, jira.payload)
+            estimate = estimates.get(estimate_key)
+            if estimate is not None:
+                # The estimated remaining pages are requested along with the first one
+                estimated_tasks = _start_estimated_pages(
+                    jira=jira, client=client, estimate=estimate, decode=decode
+                )
+        try:
+            # First request with default, or learned, pagination
+            response, first_page = await _send_first_page(
+                jira=jira, client=client, estimate=estimate
+            )
 
-def _create_list_of_page_attr(page_attr: dict) -> list[dict]:
-    """Function that generates a list of attributes needed to retrieve all pages."""
-    if "total" not in page_attr:
-        return [page_attr]
+            responses = []
+            responses.append(first_page if decode else response)
+
+            # The remaining pages are requested concurrently when they are all known
+            pagination = get_strategy(strategy, first_page, YajawConfig.SPECULATIVE_PAGINATION)
+            page_attr_list = pagination.remaining_pages(first_page)
+            if estimate_key is not None and pagination.name == "total":
+                await asyncio.to_thread(
+                    estimates.put, estimate_key, first_page["total"], first_page["maxResults"]
+                )
+            if page_attr_list is None:
+                pages = _iter_remaining_pages(
+                    jira=jira,
+                    client=client,
+                    pagination=pagination,
+                    page=first_page,
+                    decode=decode,
+                    max_window=YajawConfig.MAX_PROBE_WINDOW,
+                )
+                async for page in pages:
+                    responses.append(page)
+            elif page_attr_list:
+                # Estimated pages still needed are reused, the others are cancelled below
+                tasks = [
+                    estimated_tasks.pop((page_attr["startAt"], page_attr["maxResults"]), None)
+                    or asyncio.create_task(
+                        _send_page_request(
+                            jira=_create_jira_list_with_page_attr([page_attr], jira=jira)[0],
+                            client=client,
+                            decode=decode,
+                        )
+                    )
+                    for page_attr in page_attr_list
+                ]
+                group_of_response = await asyncio.gather(*tasks)
+
+                responses.extend(list(group_of_response))
+        finally:
+            for task in estimated_tasks.values():
+                task.cancel()
+            await asyncio.gather(*estimated_tasks.values(), return_exceptions=True)
+
+    if estimate_key is not None and decode:
+        # Issues moving between pages requested at different times are returned once
+        dedupe_items(responses)
+    return responses
 
-    page_attr["start_at"] = page_attr["max_results"]
 
-    page_attr_list = [
-        page_attr["start_at"] + i * page_attr["max_results"]
-        for i in range(int(math.ceil(page_attr["total"] / page_attr["max_results"])) - 1)
-    ]
-    return [{"startAt": page, "maxResults": page_attr["max_results"]} for page in page_attr_list]
+async def iter_paginated_requests(
+    jira: JiraInfo,
+    client: httpx.AsyncClient | None = None,
+    window: int | None = None,
+    ordered: bool = True,
+    decode: bool = False,
+    strategy: str | PaginationStrategy | None = None,
+) -> AsyncIterator[httpx.Response | dict]:
+    """
+    Sends a paginated HTTP request to a Jira instance and yields the pages as they arrive.
 
+    Unlike send_paginated_requests, at most window page requests are in flight at any
+    time and no response is retained after it has been yielded, so memory stays bounded
+    regardless of the number of pages. Pending requests are cancelled if the iteration
+    is abandoned.
 
-# Assuming _generate_params and _generate_payload behave as before, merging dictionaries
+    Args:
+        jira (JiraInfo): Object of JiraInfo class representing the Jira instance.
+        client (httpx.AsyncClient | None, optional): A client object shared by all page\
+        requests. The one bound by an active yajaw.Session, or a new one, is used otherwise.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        YajawConfig.PAGE_WINDOW.
+        ordered (bool, optional): Yields the pages in their original order when True,\
+        or as soon as each one completes otherwise. Defaults to True.
+        decode (bool, optional): Yields the decoded pages instead of the responses.\
+        Each body is then decoded exactly once. Responses decoded to read their\
+        pagination attributes are not decoded again by decode_json. Defaults to False.
+        strategy (str | PaginationStrategy | None, optional): Pagination strategy of\
+        the resource, or its name: total, is_last, speculative, next_page or single. It is detected\
+        from the first page when None. Defaults to None.
+
+    Yields:
+        httpx.Response | dict: Response object received for each requested page, or\
+        decoded page when decode is True.
+    """
+    window = max(1, window or YajawConfig.PAGE_WINDOW)
+    async with client_scope(client) as client:
+        response, first_page = await _send_first_page(jira=jira, client=client)
+        pagination = get_strategy(strategy, first_page, YajawConfig.SPECULATIVE_PAGINATION)
+        page_attr_list = pagination.remaining_pages(first_page)
+        yield first_page if decode else response
+        del response
+
+        if page_attr_list is None:
+            pages = _iter_remaining_pages(
+                jira=jira,
+                client=client,
+                pagination=pagination,
+                page=first_page,
+                decode=decode,
+                max_window=window,
+            )
+            del first_page
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+            return
+        del first_page
+
+        pending_jira = collections.deque(
+            _create_jira_list_with_page_attr(page_attr_list=page_attr_list, jira=jira)
+        )
+        in_flight: collections.deque[asyncio.Task] = collections.deque()
+
+        def refill():
+            "Schedule page requests until the window is full or no page is left."
+            while pending_jira and len(in_flight) < window:
+                page_jira = pending_jira.popleft()
+                in_flight.append(
+                    asyncio.create_task(
+                        _send_page_request(jira=page_jira, client=client, decode=decode)
+                    )
+                )
+
+        try:
+            refill()
+            while in_flight:
+                if ordered:
+                    task = in_flight.popleft()
+                    await asyncio.wait([task])
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    task = done.pop()
+                    in_flight.remove(task)
+                refill()
+                yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
 
 def _create_jira_list_with_page_attr(page_attr_list: list[dict], jira: JiraInfo) -> list[JiraInfo]:
@@ -281,23 +854,3 @@ def _create_jira_list_with_page_attr(page_attr_list: list[dict], jira: JiraInfo)
 
         jira_list.append(new_jira)
     return jira_list
-
-
-def _retrieve_pagination_attributes(response: httpx.Response) -> dict:
-    """Function that gets the pagination valuesa from response and returns a dict with them"""
-    page_attr = {}
-    response_json = response.json()
-    page_attr["start_at"] = response_json["startAt"] if "startAt" in response_json else None
-    page_attr["max_results"] = (
-        response_json["maxResults"] if "maxResults" in response_json else None
-    )
-    page_attr["total"] = response_json["total"] if "total" in response_json else None
-    return page_attr
-
-
-def _is_pagination_required(page_attr: dict) -> bool:
-    """Function that checks if pagination is required."""
-    start_at = page_attr["start_at"]
-    max_results = page_attr["max_results"]
-    total = page_attr["total"]
-    return start_at + max_results < total
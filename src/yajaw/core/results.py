@@ -0,0 +1,87 @@
+"""Module responsible for collecting the results of batches of concurrent requests."""
+import asyncio
+from collections.abc import Awaitable, Hashable
+
+from yajaw import exceptions
+
+FATAL_ERRORS = (exceptions.ResourceUnauthorizedError, exceptions.ResourceForbiddenError)
+
+
+class BatchResult:
+    """
+    Class representing the outcome of a batch of requests, item by item.
+
+    Unlike a plain list, a failed item does not hide the items that succeeded. Each
+    input is found in exactly one of results, errors or cancelled.
+
+    Attributes:
+        results: Value returned per input that succeeded.
+        errors: Exception raised per input that failed.
+        cancelled: Inputs whose requests were cancelled after a fatal error.
+    """
+
+    def __init__(self):
+        """Initializes an empty BatchResult object."""
+        self.results: dict = {}
+        self.errors: dict = {}
+        self.cancelled: list = []
+
+    @property
+    def ok(self) -> bool:
+        """Whether every input succeeded."""
+        return not self.errors and not self.cancelled
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult(results={len(self.results)}, errors={len(self.errors)},"
+            f" cancelled={len(self.cancelled)})"
+        )
+
+
+async def gather_batch(
+    requests: dict[Hashable, Awaitable],
+    cancel_on: tuple[type[BaseException], ...] = FATAL_ERRORS,
+) -> BatchResult:
+    """
+    Runs the requests concurrently and collects their outcomes per input.
+
+    Errors are collected instead of propagated, like asyncio.gather with
+    return_exceptions. When a request raises one of the cancel_on errors, such as an
+    authentication failure that every other request would hit as well, the requests
+    still in flight are cancelled and reported as cancelled.
+
+    Args:
+        requests (dict[Hashable, Awaitable]): Awaitable request per input.
+        cancel_on (tuple[type[BaseException], ...], optional): Errors that cancel the\
+        outstanding requests. Nothing is cancelled when empty. Defaults to the\
+        unauthorized and forbidden errors.
+
+    Returns:
+        BatchResult: Results, errors and cancelled inputs of the batch.
+    """
+    tasks = {key: asyncio.ensure_future(request) for key, request in requests.items()}
+    pending = set(tasks.values())
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+            if cancel_on and any(
+                not task.cancelled() and isinstance(task.exception(), cancel_on) for task in done
+            ):
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+    finally:
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+
+    batch = BatchResult()
+    for key, task in tasks.items():
+        if task.cancelled():
+            batch.cancelled.append(key)
+        elif task.exception() is not None:
+            batch.errors[key] = task.exception()
+        else:
+            batch.results[key] = task.result()
+    return batch
@@ -0,0 +1,200 @@
+"""Module responsible for the policies deciding when and how requests are retried."""
+import secrets
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+import httpx
+
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RetryBudget:
+    """
+    Class representing a process-wide token bucket spent by retries.
+
+    Every retry takes a token, and tokens are refilled at a constant rate up to the
+    capacity. When the bucket is empty, failing requests are not retried, so retries
+    cannot multiply the load on a server that is already struggling.
+
+    Attributes:
+        capacity: Maximum number of tokens in the bucket.
+        rate: Number of tokens refilled per second.
+    """
+
+    def __init__(self, capacity: float = 100.0, rate: float = 10.0):
+        """
+        Initializes a RetryBudget object with a full bucket.
+
+        Args:
+            capacity (float, optional): Maximum number of tokens. Defaults to 100.0.
+            rate (float, optional): Tokens refilled per second. Defaults to 10.0.
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self):
+        """Adds the tokens accrued since the last update. It expects the lock to be held."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_spend(self) -> bool:
+        """Takes a token if one is available and tells whether it was taken."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Class representing how failed requests are retried.
+
+    The delay before each retry is drawn again for every attempt, either with full
+    jitter, uniform between zero and an exponentially growing ceiling, or with
+    decorrelated jitter, uniform between the base delay and three times the previous
+    delay. A delay requested by the server through Retry-After or X-RateLimit-Reset
+    takes precedence. The number of attempts may be set per status code, and every
+    retry spends a token of the shared retry budget.
+
+    Attributes:
+        tries: Maximum number of attempts of a request.
+        base_delay: Seconds used as the base of the delays.
+        multiplier: Growth factor of the full jitter ceiling between attempts.
+        max_delay: Maximum number of seconds waited before a retry.
+        jitter: Either "full" or "decorrelated".
+        status_tries: Maximum number of attempts per status code overriding tries.
+        budget: Retry budget spent by the retries, if any.
+    """
+
+    def __init__(
+        self,
+        tries: int = 10,
+        base_delay: float = 0.5,
+        multiplier: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: str = "full",
+        status_tries: dict[int, int] | None = None,
+        budget: RetryBudget | None = None,
+    ):
+        """
+        Initializes a RetryPolicy object.
+
+        Args:
+            tries (int, optional): Maximum number of attempts. Defaults to 10.
+            base_delay (float, optional): Base of the delays in seconds. Defaults to 0.5.
+            multiplier (float, optional): Growth factor of the full jitter ceiling.\
+            Defaults to 2.0.
+            max_delay (float, optional): Maximum delay in seconds. Defaults to 60.0.
+            jitter (str, optional): Either "full" or "decorrelated". Defaults to "full".
+            status_tries (dict[int, int] | None, optional): Maximum number of attempts\
+            per status code, such as {400: 1} to never retry bad requests. Defaults to None.
+            budget (RetryBudget | None, optional): Retry budget spent by the retries.\
+            Retries are not limited by a budget when None. Defaults to None.
+
+        Raises:
+            ValueError: The jitter is not supported.
+        """
+        if jitter not in ("full", "decorrelated"):
+            raise ValueError(f"Unsupported jitter: {jitter}")
+        self.tries = tries
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.status_tries = {
+            int(status): int(limit) for status, limit in (status_tries or {}).items()
+        }
+        self.budget = budget
+        self._random = secrets.SystemRandom()
+
+    def allows_retry(self, attempt: int, result: httpx.Response | Exception) -> bool:
+        """
+        Checks if a failed attempt may be retried.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1.
+            result (httpx.Response | Exception): Response or transport error received.
+
+        Returns:
+            True if another attempt is allowed and the retry budget has a token for it.
+        """
+        tries = self.tries
+        if isinstance(result, httpx.Response):
+            tries = self.status_tries.get(result.status_code, tries)
+        if attempt >= tries:
+            return False
+        return self.budget is None or self.budget.try_spend()
+
+    def next_delay(
+        self, attempt: int, previous_delay: float, result: httpx.Response | Exception
+    ) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1.
+            previous_delay (float): Seconds waited before the attempt that failed.
+            result (httpx.Response | Exception): Response or transport error received.
+
+        Returns:
+            Seconds to wait before the next attempt.
+        """
+        server_delay = _server_delay(result) if isinstance(result, httpx.Response) else None
+        if server_delay is not None:
+            return min(self.max_delay, server_delay) + self._random.uniform(0, self.base_delay)
+        if self.jitter == "decorrelated":
+            upper = max(self.base_delay, previous_delay * 3)
+            return min(self.max_delay, self._random.uniform(self.base_delay, upper))
+        ceiling = self.base_delay * self.multiplier ** (attempt - 1)
+        return self._random.uniform(0, min(self.max_delay, ceiling))
+
+
+def _server_delay(response: httpx.Response) -> float | None:
+    """Returns the seconds requested by the server through rate limit headers, if any."""
+    headers = ["Retry-After"]
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        headers.append("X-RateLimit-Reset")
+    for header in headers:
+        value = response.headers.get(header)
+        if value is None:
+            continue
+        delay = _parse_delay(value.strip())
+        if delay is not None:
+            return max(0.0, delay)
+    return None
+
+
+def _parse_delay(value: str) -> float | None:
+    """Parses seconds, an epoch timestamp, an HTTP date or an ISO 8601 timestamp."""
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        return number - time.time() if number > _EPOCH_THRESHOLD else number
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (moment - datetime.now(UTC)).total_seconds()
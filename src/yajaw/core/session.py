@@ -0,0 +1,130 @@
+"""Module responsible for long-lived pooled sessions used by HTTP requests."""
+import httpx
+
+from yajaw import YajawConfig
+from yajaw.core import rest
+from yajaw.utils.concurrency import LoopRunner, bind_runner, unbind_runner
+
+
+def _default_limits(keepalive_expiry: float | None = None) -> httpx.Limits:
+    """Function that sizes the connection pool after the configured semaphore limit."""
+    limit = YajawConfig.configuration("concurrency", "semaphore_limit")
+    return httpx.Limits(
+        max_connections=limit,
+        max_keepalive_connections=limit,
+        keepalive_expiry=5.0 if keepalive_expiry is None else keepalive_expiry,
+    )
+
+
+class Session:
+    """
+    Class representing a long-lived pool of connections to the Jira instance.
+
+    A session owns one httpx.AsyncClient shared by every request issued while it is
+    open, so consecutive and concurrent calls reuse warm connections instead of
+    paying a new TCP and TLS handshake each time. Functions in yajaw.jira accept it
+    through the session argument, or pick it up implicitly while it is active.
+
+    Use it as an async context manager on asynchronous code:
+
+        async with Session() as session:
+            projects = await jira.async_fetch_projects_from_list(keys)
+
+    Or as a regular context manager on synchronous code. In that case the client
+    lives on a dedicated event loop and the sync calls made inside the block run on it:
+
+        with Session():
+            projects = jira.fetch_projects_from_list(keys)
+
+    Attributes:
+        limits: Connection pool limits applied to the client.
+        http2: Whether HTTP/2 is negotiated. It requires the optional h2 package.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = False,
+    ):
+        """
+        Initializes a Session object with the given pool configuration.
+
+        Args:
+            limits (httpx.Limits | None, optional): Connection pool limits. Defaults to\
+            a pool sized after the configured semaphore limit.
+            keepalive_expiry (float | None, optional): Seconds an idle connection is kept\
+            alive. It overrides the value set in limits. Defaults to None.
+            http2 (bool, optional): Enables HTTP/2. Defaults to False.
+        """
+        if limits is None:
+            limits = _default_limits(keepalive_expiry)
+        elif keepalive_expiry is not None:
+            limits = httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        self.limits = limits
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._runner: LoopRunner | None = None
+        self._tokens: list = []
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled client owned by the session.
+
+        Raises:
+            RuntimeError: The session is not open.
+        """
+        if self._client is None:
+            raise RuntimeError("Session is not open.")
+        return self._client
+
+    @property
+    def runner(self) -> LoopRunner | None:
+        """Event loop runner of the session while it is open on synchronous code."""
+        return self._runner
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the session currently owns an open client."""
+        return self._client is not None
+
+    def _open_client(self):
+        """Creates the pooled client if the session is not open yet."""
+        if self._client is None:
+            self._client = rest._generate_client(limits=self.limits, http2=self.http2)
+
+    async def aclose(self):
+        """Closes the pooled client and its connections."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def __aenter__(self) -> "Session":
+        self._open_client()
+        self._tokens.append(rest.bind_client(self.client))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        rest.unbind_client(self._tokens.pop())
+        await self.aclose()
+
+    def __enter__(self) -> "Session":
+        self._runner = LoopRunner(name="yajaw-session")
+        self._open_client()
+        self._tokens.append((rest.bind_client(self.client), bind_runner(self._runner)))
+        return self
+
+    def __exit__(self, *exc_info):
+        client_token, runner_token = self._tokens.pop()
+        unbind_runner(runner_token)
+        rest.unbind_client(client_token)
+        runner, self._runner = self._runner, None
+        try:
+            runner.run(self.aclose())
+        finally:
+            runner.close()
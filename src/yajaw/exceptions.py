@@ -60,3 +60,11 @@ class ResourceMethodNotAllowedError(HttpClientError):
     Low level error for internal modules use.
     Error is derived from super class HttpClientError.
     """
+
+
+class CircuitOpenError(YajawError):
+    """
+    Request was not sent because the circuit breaker of the Jira instance is open.
+    It is raised right away while the instance keeps failing, instead of retrying.
+    Error is derived from super class YajawError.
+    """
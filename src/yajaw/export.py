@@ -0,0 +1,820 @@
+"""
+Module responsible for exporting the results of JQL searches.
+Issues are written as pages arrive, so exports do not hold every issue in memory.
+"""
+import asyncio
+import gzip
+import json
+import os
+import secrets
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from yajaw import jira as j
+from yajaw.core.codec import encode_json
+from yajaw.core.session import Session
+from yajaw.utils.concurrency import async_to_sync, sync_iter
+from yajaw.utils.performance import ExportStats
+
+Column = str | Callable[[dict], Any]
+
+_SCALAR_ATTRIBUTES = ("key", "name", "value", "displayName", "id")
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+_WRITE_BUFFER_BYTES = 1024**2
+
+
+def _require_pyarrow():
+    """Imports pyarrow, which is an optional dependency of the columnar exports."""
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "Columnar exports require pyarrow. Install it with: pip install yajaw[arrow]"
+        ) from exc
+    return pyarrow
+
+
+def _scalar(value: Any) -> Any:
+    """Returns a flat value for a field, such as the name of a status or a user."""
+    if isinstance(value, dict):
+        for attribute in _SCALAR_ATTRIBUTES:
+            if attribute in value:
+                return value[attribute]
+        return json.dumps(value, separators=(",", ":"))
+    if isinstance(value, list):
+        return [_scalar(item) for item in value]
+    return value
+
+
+def _extract(issue: dict, column: Column) -> Any:
+    """Returns the value of a column, given as a dotted path or a function, for the issue."""
+    if callable(column):
+        return column(issue)
+    value: Any = issue
+    for part in column.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return _scalar(value)
+
+
+def infer_columns(fields: list[str] | None = None, issue: dict | None = None) -> dict[str, str]:
+    """
+    Returns a field-to-column mapping with the key and one column per field.
+
+    Args:
+        fields (list[str] | None, optional): Fields to be exported. Defaults to the\
+        fields of the issue.
+        issue (dict | None, optional): Issue whose fields are used when no field is\
+        provided. Defaults to None.
+
+    Returns:
+        Dictionary mapping each column name to its dotted path in the issue.
+    """
+    if fields is None:
+        fields = list((issue or {}).get("fields", {}))
+    columns = {"key": "key"}
+    columns.update({field: f"fields.{field}" for field in fields if field != "key"})
+    return columns
+
+
+class ColumnBuilder:
+    """
+    Class representing the columns of the record batch being built.
+
+    Issues are appended row by row to one list per column. Once batch_size rows are
+    buffered, they are converted to an Arrow record batch and the lists are released.
+
+    Attributes:
+        columns: Column name mapped to a dotted path in the issue or a function.
+        batch_size: Number of rows per record batch.
+        schema: Arrow schema of the batches. It is inferred from the first batch when\
+        not provided, with null columns and lists of nulls typed as strings. Later\
+        batches are promoted to it, such as integers in a float column.
+    """
+
+    def __init__(self, columns: dict[str, Column], batch_size: int = 10_000, schema=None):
+        """
+        Initializes a ColumnBuilder object.
+
+        Args:
+            columns (dict[str, Column]): Column name mapped to a dotted path in the\
+            issue, such as "fields.status", or a function taking the issue.
+            batch_size (int, optional): Number of rows per record batch. Defaults to 10000.
+            schema (pyarrow.Schema | None, optional): Schema of the batches. Defaults to None.
+        """
+        self.columns = columns
+        self.batch_size = batch_size
+        self.schema = schema
+        self._data: dict[str, list] = {name: [] for name in columns}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, issue: dict):
+        """Appends the values of the issue to the columns."""
+        for name, column in self.columns.items():
+            self._data[name].append(_extract(issue, column))
+        self._rows += 1
+
+    def is_full(self) -> bool:
+        """Whether the buffered rows reached the batch size."""
+        return self._rows >= self.batch_size
+
+    def flush(self):
+        """
+        Converts the buffered rows to a record batch and releases them.
+
+        Returns:
+            pyarrow.RecordBatch: Batch with the buffered rows.
+        """
+        pa = _require_pyarrow()
+        if self.schema is None:
+            batch = self._infer_batch()
+            self.schema = pa.schema(
+                pa.field(field.name, _without_nulls(field.type)) for field in batch.schema
+            )
+            batch = batch.cast(self.schema)
+        else:
+            try:
+                batch = pa.RecordBatch.from_pydict(self._data, schema=self.schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                batch = self._cast_to_schema(self._infer_batch())
+        self._data = {name: [] for name in self.columns}
+        self._rows = 0
+        return batch
+
+    def _infer_batch(self):
+        """Returns a record batch with the buffered rows and the types they suggest."""
+        pa = _require_pyarrow()
+        try:
+            return pa.RecordBatch.from_pydict(self._data)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            raise ValueError(
+                f"The column types could not be inferred ({exc}). Pass schema= to the export."
+            ) from exc
+
+    def _cast_to_schema(self, batch):
+        """Promotes the batch to the schema of the previous batches, if possible."""
+        pa = _require_pyarrow()
+        for field in batch.schema:
+            expected = self.schema.field(field.name).type
+            try:
+                batch.column(field.name).cast(expected)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as exc:
+                raise ValueError(
+                    f"The column {field.name} holds {field.type} values, while it was"
+                    f" inferred as {expected} from the first batch. Pass schema= to the export."
+                ) from exc
+        return batch.cast(self.schema)
+
+
+def _without_nulls(data_type):
+    """Returns the type with its null parts typed as strings, such as list<null>."""
+    pa = _require_pyarrow()
+    if pa.types.is_null(data_type):
+        return pa.string()
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+        return pa.list_(_without_nulls(data_type.value_type))
+    if pa.types.is_struct(data_type):
+        return pa.struct(pa.field(field.name, _without_nulls(field.type)) for field in data_type)
+    return data_type
+
+
+async def async_iter_record_batches(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    window: int | None = None,
+    session: Session | None = None,
+) -> AsyncIterator:
+    """
+    Async iterator over Arrow record batches with the result of a JQL search.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Issues are appended to the columns as their pages arrive, and a record batch is
+    yielded every batch_size issues. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue, such as "fields.status", or a function taking the issue.\
+        Values that are objects are reduced to their key, name, value, display name\
+        or id. Defaults to the key and one column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the batches. It is inferred\
+        from the first batch when None. Defaults to None.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Yields:
+        pyarrow.RecordBatch: Record batches of at most batch_size issues.
+    """
+    _require_pyarrow()
+    field_list = None if fields is None else j._resolve_fields(fields)
+    if fields is None and columns is not None:
+        paths = [column for column in columns.values() if isinstance(column, str)]
+        if len(paths) == len(columns):
+            field_list = [path.split(".")[1] for path in paths if path.startswith("fields.")]
+            # Jira returns every navigable field for an empty list, so the key is requested
+            field_list = field_list or ["key"]
+
+    builder = None
+    issues = j.async_iter_search_issues(jql=jql, fields=field_list, window=window, session=session)
+    try:
+        async for issue in issues:
+            if builder is None:
+                builder = ColumnBuilder(
+                    columns or infer_columns(field_list, issue), batch_size, schema
+                )
+            builder.append(issue)
+            if builder.is_full():
+                yield builder.flush()
+    finally:
+        await issues.aclose()
+    if builder is not None and len(builder):
+        yield builder.flush()
+
+
+def iter_record_batches(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    window: int | None = None,
+    session: Session | None = None,
+) -> Iterator:
+    """
+    Sync iterator over Arrow record batches with the result of a JQL search.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Issues are appended to the columns as their pages arrive, and a record batch is
+    yielded every batch_size issues. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue, such as "fields.status", or a function taking the issue.\
+        Values that are objects are reduced to their key, name, value, display name\
+        or id. Defaults to the key and one column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the batches. It is inferred\
+        from the first batch when None. Defaults to None.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Yields:
+        pyarrow.RecordBatch: Record batches of at most batch_size issues.
+    """
+    return sync_iter(
+        async_iter_record_batches(
+            jql=jql,
+            columns=columns,
+            fields=fields,
+            batch_size=batch_size,
+            schema=schema,
+            window=window,
+            session=session,
+        )
+    )
+
+
+async def async_to_arrow(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    session: Session | None = None,
+):
+    """
+    Async call to export the result of a JQL search to an Arrow table.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    The table is made of the record batches built while the pages arrive, so the
+    issues are never held as dictionaries. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the table. It is inferred\
+        from the first batch when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Returns:
+        pyarrow.Table: Table with one row per issue. An empty table is returned if\
+        nothing is found.
+    """
+    pa = _require_pyarrow()
+    batches = [
+        batch
+        async for batch in async_iter_record_batches(
+            jql=jql,
+            columns=columns,
+            fields=fields,
+            batch_size=batch_size,
+            schema=schema,
+            session=session,
+        )
+    ]
+    if not batches:
+        return _empty_schema(columns, schema).empty_table()
+    return pa.Table.from_batches(batches)
+
+
+@async_to_sync
+def to_arrow(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    session: Session | None = None,
+):
+    """
+    Sync call to export the result of a JQL search to an Arrow table.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    The table is made of the record batches built while the pages arrive, so the
+    issues are never held as dictionaries. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the table. It is inferred\
+        from the first batch when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Returns:
+        pyarrow.Table: Table with one row per issue. An empty table is returned if\
+        nothing is found.
+    """
+    return async_to_arrow(
+        jql=jql,
+        columns=columns,
+        fields=fields,
+        batch_size=batch_size,
+        schema=schema,
+        session=session,
+    )
+
+
+async def async_to_dataframe(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    session: Session | None = None,
+):
+    """
+    Async call to export the result of a JQL search to a pandas DataFrame.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    The DataFrame is converted from the Arrow table built by async_to_arrow. It requires
+    the optional pyarrow and pandas packages.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the table. It is inferred\
+        from the first batch when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow or pandas package is not installed.
+
+    Returns:
+        pandas.DataFrame: DataFrame with one row per issue.
+    """
+    table = await async_to_arrow(
+        jql=jql,
+        columns=columns,
+        fields=fields,
+        batch_size=batch_size,
+        schema=schema,
+        session=session,
+    )
+    return table.to_pandas()
+
+
+@async_to_sync
+def to_dataframe(
+    jql: str,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    batch_size: int = 10_000,
+    schema=None,
+    session: Session | None = None,
+):
+    """
+    Sync call to export the result of a JQL search to a pandas DataFrame.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    The DataFrame is converted from the Arrow table built by async_to_arrow. It requires
+    the optional pyarrow and pandas packages.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        batch_size (int, optional): Number of issues per record batch. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the table. It is inferred\
+        from the first batch when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow or pandas package is not installed.
+
+    Returns:
+        pandas.DataFrame: DataFrame with one row per issue.
+    """
+    return async_to_dataframe(
+        jql=jql,
+        columns=columns,
+        fields=fields,
+        batch_size=batch_size,
+        schema=schema,
+        session=session,
+    )
+
+
+def _empty_schema(columns: dict[str, Column] | None, schema=None):
+    """Returns the schema used when nothing is found, with string columns by default."""
+    pa = _require_pyarrow()
+    if schema is not None:
+        return schema
+    return pa.schema((name, pa.string()) for name in columns or {"key": "key"})
+
+
+def _temporary_path(path: Path) -> Path:
+    """Creates the unique file written before being renamed over the target on completion."""
+    while True:
+        temporary = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            # Unlike tempfile, the mode follows the umask, as the renamed export is shared
+            os.close(os.open(temporary, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+        except FileExistsError:
+            continue
+        return temporary
+
+
+async def async_to_parquet(
+    jql: str,
+    path: str | Path,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    row_group_size: int = 10_000,
+    schema=None,
+    compression: str = "zstd",
+    window: int | None = None,
+    session: Session | None = None,
+) -> int:
+    """
+    Async call to export the result of a JQL search to a Parquet file.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Each record batch is written as a row group while the next pages arrive, so
+    memory is bounded by the row group size. The file is written under a temporary
+    name and renamed on completion. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        path (str | Path): Path of the Parquet file.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        row_group_size (int, optional): Number of issues per row group. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the file. It is inferred\
+        from the first batch when None. Defaults to None.
+        compression (str, optional): Parquet compression codec. Defaults to "zstd".
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Returns:
+        Number of issues written.
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    temporary = _temporary_path(path)
+    writer = None
+    rows = 0
+    try:
+        async for batch in async_iter_record_batches(
+            jql=jql,
+            columns=columns,
+            fields=fields,
+            batch_size=row_group_size,
+            schema=schema,
+            window=window,
+            session=session,
+        ):
+            if writer is None:
+                writer = pq.ParquetWriter(temporary, batch.schema, compression=compression)
+            # Writing releases the GIL, so it runs while the next pages are received
+            await asyncio.to_thread(writer.write_batch, batch, row_group_size=row_group_size)
+            rows += batch.num_rows
+        if writer is None:
+            # An empty file still carries the columns
+            empty_schema = _empty_schema(columns, schema)
+            writer = pq.ParquetWriter(temporary, empty_schema, compression=compression)
+        writer.close()
+        writer = None
+        os.replace(temporary, path)
+    finally:
+        if writer is not None:
+            writer.close()
+        temporary.unlink(missing_ok=True)
+    return rows
+
+
+@async_to_sync
+def to_parquet(
+    jql: str,
+    path: str | Path,
+    columns: dict[str, Column] | None = None,
+    fields: list[str] | str | None = None,
+    row_group_size: int = 10_000,
+    schema=None,
+    compression: str = "zstd",
+    window: int | None = None,
+    session: Session | None = None,
+) -> int:
+    """
+    Sync call to export the result of a JQL search to a Parquet file.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Each record batch is written as a row group while the next pages arrive, so
+    memory is bounded by the row group size. The file is written under a temporary
+    name and renamed on completion. It requires the optional pyarrow package.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        path (str | Path): Path of the Parquet file.
+        columns (dict[str, Column] | None, optional): Column name mapped to a dotted\
+        path in the issue or a function taking the issue. Defaults to the key and one\
+        column per field.
+        fields (list[str] | str | None, optional): Fields returned for each issue.\
+        Defaults to the fields used by the columns, or every navigable field.
+        row_group_size (int, optional): Number of issues per row group. Defaults to 10000.
+        schema (pyarrow.Schema | None, optional): Schema of the file. It is inferred\
+        from the first batch when None. Defaults to None.
+        compression (str, optional): Parquet compression codec. Defaults to "zstd".
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ImportError: The pyarrow package is not installed.
+
+    Returns:
+        Number of issues written.
+    """
+    return async_to_parquet(
+        jql=jql,
+        path=path,
+        columns=columns,
+        fields=fields,
+        row_group_size=row_group_size,
+        schema=schema,
+        compression=compression,
+        window=window,
+        session=session,
+    )
+
+
+def _compression_for(path: Path, compression: str | None) -> str | None:
+    """Returns the compression requested, or the one inferred from the file suffix."""
+    if compression != "infer":
+        return compression
+    return _COMPRESSION_SUFFIXES.get(path.suffix.lower())
+
+
+def _open_stream(file, name: str, compression: str | None, level: int | None):
+    """Wraps the binary file in a stream writing with the requested compression."""
+    if compression is None:
+        return file
+    if compression == "gzip":
+        # The header records the final name rather than the temporary one
+        return gzip.GzipFile(
+            filename=name, mode="wb", compresslevel=6 if level is None else level, fileobj=file
+        )
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "The zstd compression requires zstandard. Install it with: pip install yajaw[zstd]"
+            ) from exc
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(file)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+async def async_jsonl(
+    jql: str,
+    path: str | Path,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    compression: str | None = "infer",
+    level: int | None = None,
+    window: int | None = None,
+    stats: ExportStats | None = None,
+    session: Session | None = None,
+) -> ExportStats:
+    """
+    Async call to export the result of a JQL search to a JSON Lines file.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Issues are written one per line as their pages arrive, through a bounded buffer,
+    so memory stays constant regardless of the number of issues. The file is written
+    under a temporary name and renamed on completion, so readers never see a partial
+    export.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        path (str | Path): Path of the JSON Lines file.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        compression (str | None, optional): Either gzip, zstd, None for no compression,\
+        or infer to pick it from the suffix of the path, such as .gz or .zst.\
+        The zstd compression requires the optional zstandard package. Defaults to "infer".
+        level (int | None, optional): Compression level. Defaults to the default level\
+        of the compression.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        stats (ExportStats | None, optional): Counters updated while the export runs,\
+        such as to report progress from another thread. Defaults to new counters.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: The compression is not supported.
+        ImportError: The zstandard package is not installed and zstd is requested.
+
+    Returns:
+        ExportStats: Number of issues and bytes written, and the time taken.
+    """
+    path = Path(path)
+    stats = stats or ExportStats()
+    compression = _compression_for(path, compression)
+    temporary = _temporary_path(path)
+    file = stream = open(temporary, "wb")
+    try:
+        stream = _open_stream(file, path.name, compression, level)
+        issues = j.async_iter_search_issues(
+            jql=jql, expand=expand, fields=fields, window=window, session=session
+        )
+        buffer = bytearray()
+        buffered = 0
+        try:
+            async for issue in issues:
+                buffer += encode_json(issue)
+                buffer += b"\n"
+                buffered += 1
+                if len(buffer) >= _WRITE_BUFFER_BYTES:
+                    # Compression and writes release the GIL while the next pages arrive
+                    await asyncio.to_thread(stream.write, bytes(buffer))
+                    stats.issues += buffered
+                    stats.bytes += len(buffer)
+                    buffer.clear()
+                    buffered = 0
+        finally:
+            await issues.aclose()
+        if buffer:
+            await asyncio.to_thread(stream.write, bytes(buffer))
+            stats.issues += buffered
+            stats.bytes += len(buffer)
+        stream.close()
+        file.close()
+        os.replace(temporary, path)
+    finally:
+        stream.close()
+        file.close()
+        temporary.unlink(missing_ok=True)
+        stats.finished = time.monotonic()
+    return stats
+
+
+@async_to_sync
+def jsonl(
+    jql: str,
+    path: str | Path,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    compression: str | None = "infer",
+    level: int | None = None,
+    window: int | None = None,
+    stats: ExportStats | None = None,
+    session: Session | None = None,
+) -> ExportStats:
+    """
+    Sync call to export the result of a JQL search to a JSON Lines file.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Issues are written one per line as their pages arrive, through a bounded buffer,
+    so memory stays constant regardless of the number of issues. The file is written
+    under a temporary name and renamed on completion, so readers never see a partial
+    export.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        path (str | Path): Path of the JSON Lines file.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        compression (str | None, optional): Either gzip, zstd, None for no compression,\
+        or infer to pick it from the suffix of the path, such as .gz or .zst.\
+        The zstd compression requires the optional zstandard package. Defaults to "infer".
+        level (int | None, optional): Compression level. Defaults to the default level\
+        of the compression.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        stats (ExportStats | None, optional): Counters updated while the export runs,\
+        such as to report progress from another thread. Defaults to new counters.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: The compression is not supported.
+        ImportError: The zstandard package is not installed and zstd is requested.
+
+    Returns:
+        ExportStats: Number of issues and bytes written, and the time taken.
+    """
+    return async_jsonl(
+        jql=jql,
+        path=path,
+        expand=expand,
+        fields=fields,
+        compression=compression,
+        level=level,
+        window=window,
+        stats=stats,
+        session=session,
+    )
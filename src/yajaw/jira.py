@@ -3,14 +3,32 @@ Module wrapping up the supported Jira resources.
 It is the main external interface for yajaw users.
 """
 import asyncio
+import collections
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
 
 from yajaw import ApiType, YajawConfig
 from yajaw import exceptions as e
 from yajaw.core import rest
-from yajaw.utils.concurrency import async_to_sync
+from yajaw.core.results import FATAL_ERRORS, BatchResult, gather_batch
+from yajaw.core.session import Session
+from yajaw.records import ChangelogRecord, changelog_records, convert_issues
+from yajaw.utils.concurrency import async_to_sync, sync_iter
+
+# Bytes of the JQL searching issues by key, below the limits of the Jira instances
+_MAX_JQL_LENGTH = 8000
+
 
+def _session_client(session: Session | None):
+    """Returns the client owned by the session, if any was provided."""
+    return None if session is None else session.client
 
-async def async_fetch_all_projects(expand: str | None = None) -> list[dict]:
+
+async def async_fetch_all_projects(
+    expand: str | None = None, session: Session | None = None
+) -> list[dict]:
     """
     Async call to fetch all projects.
 
@@ -24,6 +42,8 @@ async def async_fetch_all_projects(expand: str | None = None) -> list[dict]:
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded.\
         They are: description, issueTypes, lead, and projectKeys.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
 
     Returns:
         List of dictionaries representing the returned projects.\
@@ -40,14 +60,14 @@ async def async_fetch_all_projects(expand: str | None = None) -> list[dict]:
     )
 
     try:
-        response = await rest.send_single_request(jira=jira)
-        return response.json()
+        response = await rest.send_cached_request(jira=jira, client=_session_client(session))
+        return rest.decode_json(response)
     except e.ResourceNotFoundError:
         return []
 
 
 @async_to_sync
-def fetch_all_projects(expand: str | None = None) -> list[dict]:
+def fetch_all_projects(expand: str | None = None, session: Session | None = None) -> list[dict]:
     """
     Sync call to fetch all projects.
 
@@ -61,15 +81,19 @@ def fetch_all_projects(expand: str | None = None) -> list[dict]:
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded.\
         They are: description, issueTypes, lead, and projectKeys.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
 
     Returns:
         List of dictionaries representing the returned projects.\
         An empty list is returned if nothing found.
     """
-    return async_fetch_all_projects(expand=expand)
+    return async_fetch_all_projects(expand=expand, session=session)
 
 
-async def async_fetch_project(project_key: str, expand: str | None = None) -> dict:
+async def async_fetch_project(
+    project_key: str, expand: str | None = None, session: Session | None = None
+) -> dict:
     """
     Async call to fetch the details of a single project.
 
@@ -82,6 +106,8 @@ async def async_fetch_project(project_key: str, expand: str | None = None) -> di
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded. They are: description, issueTypes, lead,\
         projectKeys, and issueTypeHierarchy. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
 
     Returns:
         Dictionary with the project details. An empty dictionary is returned\
@@ -98,14 +124,16 @@ async def async_fetch_project(project_key: str, expand: str | None = None) -> di
     )
 
     try:
-        response = await rest.send_single_request(jira=jira)
-        return response.json()
+        response = await rest.send_cached_request(jira=jira, client=_session_client(session))
+        return rest.decode_json(response)
     except e.ResourceNotFoundError:
         return {}
 
 
 @async_to_sync
-def fetch_project(project_key: str, expand: str | None = None) -> dict:
+def fetch_project(
+    project_key: str, expand: str | None = None, session: Session | None = None
+) -> dict:
     """
     Sync call to fetch the details of a single project.
 
@@ -118,17 +146,23 @@ def fetch_project(project_key: str, expand: str | None = None) -> dict:
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded. They are: description, issueTypes, lead,\
         projectKeys, and issueTypeHierarchy. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
 
     Returns:
         Dictionary with the project details. An empty dictionary is returned\
         if nothing is found.
     """
-    return async_fetch_project(project_key=project_key, expand=expand)
+    return async_fetch_project(project_key=project_key, expand=expand, session=session)
 
 
 async def async_fetch_projects_from_list(
-    project_keys: list[str], expand: str | None = None
-) -> list[dict]:
+    project_keys: list[str],
+    expand: str | None = None,
+    session: Session | None = None,
+    return_exceptions: bool = False,
+    cancel_on_fatal: bool = True,
+) -> list[dict] | BatchResult:
     """
     Async call to fetch the details of a list of projects.
 
@@ -142,15 +176,27 @@ async def async_fetch_projects_from_list(
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded. They are: description, issueTypes, lead,\
         projectKeys, and issueTypeHierarchy. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        return_exceptions (bool, optional): Whether a BatchResult is returned with\
+        the projects keyed by project key and the errors per project key, instead of\
+        a list. Defaults to False.
+        cancel_on_fatal (bool, optional): Whether the outstanding requests are\
+        cancelled when a request is unauthorized or forbidden. Defaults to True.
+
+    Raises:
+        exceptions.YajawError: A request failed for a reason other than a project\
+        not found, and return_exceptions is False.
 
     Returns:
         List of dictionaries representing the returned projects.\
-        An empty list is returned if nothing found.
+        An empty list is returned if nothing found, or if any project is not found.\
+        A BatchResult is returned instead when return_exceptions is True.
     """
     expand_dict = {} if expand is None else {"expand": expand}
 
-    jira_list = [
-        rest.JiraInfo(
+    jira_by_key = {
+        project_key: rest.JiraInfo(
             method="GET",
             resource=f"project/{project_key}",
             api=YajawConfig.SERVER_API,
@@ -158,18 +204,38 @@ async def async_fetch_projects_from_list(
             payload=None,
         )
         for project_key in project_keys
-    ]
+    }
 
-    try:
-        tasks = [asyncio.create_task(rest.send_single_request(jira=jira)) for jira in jira_list]
-        responses = await asyncio.gather(*tasks)
-        return [response.json() for response in responses]
-    except e.ResourceNotFoundError:
+    async def fetch(jira: rest.JiraInfo, client: httpx.AsyncClient) -> dict:
+        response = await rest.send_cached_request(jira=jira, client=client)
+        return rest.decode_json(response)
+
+    async with rest.client_scope(_session_client(session)) as client:
+        batch = await gather_batch(
+            {key: fetch(jira, client) for key, jira in jira_by_key.items()},
+            cancel_on=FATAL_ERRORS if cancel_on_fatal else (),
+        )
+
+    if return_exceptions:
+        return batch
+    errors = [
+        error for error in batch.errors.values() if not isinstance(error, e.ResourceNotFoundError)
+    ]
+    if errors:
+        raise errors[0]
+    if batch.errors:
         return []
+    return [batch.results[key] for key in project_keys]
 
 
 @async_to_sync
-def fetch_projects_from_list(project_keys: list[str], expand: str | None = None) -> list[dict]:
+def fetch_projects_from_list(
+    project_keys: list[str],
+    expand: str | None = None,
+    session: Session | None = None,
+    return_exceptions: bool = False,
+    cancel_on_fatal: bool = True,
+) -> list[dict] | BatchResult:
     """
     Sync call to fetch the details of a list of projects.
 
@@ -183,17 +249,69 @@ def fetch_projects_from_list(project_keys: list[str], expand: str | None = None)
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded. They are: description, issueTypes, lead,\
         projectKeys, and issueTypeHierarchy. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        return_exceptions (bool, optional): Whether a BatchResult is returned with\
+        the projects keyed by project key and the errors per project key, instead of\
+        a list. Defaults to False.
+        cancel_on_fatal (bool, optional): Whether the outstanding requests are\
+        cancelled when a request is unauthorized or forbidden. Defaults to True.
+
+    Raises:
+        exceptions.YajawError: A request failed for a reason other than a project\
+        not found, and return_exceptions is False.
 
     Returns:
         List of dictionaries representing the returned projects.\
-        An empty list is returned if nothing found.
+        An empty list is returned if nothing found, or if any project is not found.\
+        A BatchResult is returned instead when return_exceptions is True.
     """
-    return async_fetch_projects_from_list(project_keys=project_keys, expand=expand)
+    return async_fetch_projects_from_list(
+        project_keys=project_keys,
+        expand=expand,
+        session=session,
+        return_exceptions=return_exceptions,
+        cancel_on_fatal=cancel_on_fatal,
+    )
 
 
-async def async_fetch_issue(
-    issue_key: str, expand: str | None = None, api: ApiType = ApiType.CLASSIC
+def _issue_jira_info(
+    issue_key: str,
+    expand: str | None = None,
+    api: ApiType = ApiType.CLASSIC,
+    fields: list[str] | str | None = None,
+) -> rest.JiraInfo:
+    """Returns the JiraInfo for fetching a single issue with the requested projection."""
+    expand_dict = {} if expand is None else {"expand": expand}
+    if fields is not None:
+        expand_dict["fields"] = ",".join(_resolve_fields(fields))
+
+    api_value = YajawConfig.SERVER_API if api == ApiType.CLASSIC else YajawConfig.AGILE_API
+
+    return rest.JiraInfo(
+        method="GET", resource=f"issue/{issue_key}", api=api_value, params=expand_dict, payload=None
+    )
+
+
+async def _async_fetch_single_issue(
+    jira: rest.JiraInfo, client: httpx.AsyncClient | None = None
 ) -> dict:
+    """Returns the issue fetched by key, following moves, or an empty dictionary."""
+    try:
+        response = await rest.send_cached_request(jira=jira, client=client)
+        return rest.decode_json(response)
+    except e.ResourceNotFoundError:
+        return {}
+
+
+async def async_fetch_issue(
+    issue_key: str,
+    expand: str | None = None,
+    api: ApiType = ApiType.CLASSIC,
+    session: Session | None = None,
+    fields: list[str] | str | None = None,
+    result_type: type = dict,
+) -> dict | Any:
     """
     Async call to fetch the details of a single issue.
 
@@ -212,28 +330,35 @@ async def async_fetch_issue(
         api (ApiType, optional): Takes the enumeration values ApiType.CLASSIC or\
         ApiType.AGILE as possible values to represent which API to be used. Defaults\
         to ApiType.CLASSIC.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for the issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every field is returned when None. Defaults to None.
+        result_type (type, optional): Type of the returned issue. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
 
     Returns:
         Dictionary with the issue details. An empty dictionary is returned\
-        if nothing is found.
+        if nothing is found. A record of result_type, or None if nothing is found,\
+        is returned instead when result_type is not dict.
     """
-    expand_dict = {} if expand is None else {"expand": expand}
-
-    api_value = YajawConfig.SERVER_API if api == ApiType.CLASSIC else YajawConfig.AGILE_API
-
-    jira = rest.JiraInfo(
-        method="GET", resource=f"issue/{issue_key}", api=api_value, params=expand_dict, payload=None
-    )
-
-    try:
-        response = await rest.send_single_request(jira=jira)
-        return response.json()
-    except e.ResourceNotFoundError:
-        return {}
+    jira = _issue_jira_info(issue_key=issue_key, expand=expand, api=api, fields=fields)
+    issue = await _async_fetch_single_issue(jira=jira, client=_session_client(session))
+    if result_type is dict:
+        return issue
+    return result_type.from_issue(issue) if issue else None
 
 
 @async_to_sync
-def fetch_issue(issue_key: str, expand: str | None = None, api: ApiType = ApiType.CLASSIC) -> dict:
+def fetch_issue(
+    issue_key: str,
+    expand: str | None = None,
+    api: ApiType = ApiType.CLASSIC,
+    session: Session | None = None,
+    fields: list[str] | str | None = None,
+    result_type: type = dict,
+) -> dict | Any:
     """
     Sync call to fetch the details of a single issue.
 
@@ -252,37 +377,261 @@ def fetch_issue(issue_key: str, expand: str | None = None, api: ApiType = ApiTyp
         api (ApiType, optional): Takes the enumeration values ApiType.CLASSIC or\
         ApiType.AGILE as possible values to represent which API to be used. Defaults\
         to ApiType.CLASSIC.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for the issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every field is returned when None. Defaults to None.
+        result_type (type, optional): Type of the returned issue. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
 
     Returns:
         Dictionary with the issue details. An empty dictionary is returned\
-        if nothing is found.
+        if nothing is found. A record of result_type, or None if nothing is found,\
+        is returned instead when result_type is not dict.
     """
-    return async_fetch_issue(issue_key=issue_key, expand=expand, api=api)
+    return async_fetch_issue(
+        issue_key=issue_key,
+        expand=expand,
+        api=api,
+        session=session,
+        fields=fields,
+        result_type=result_type,
+    )
 
 
-async def async_search_issues(jql: str, expand: str | None = None) -> list[dict]:
+def _key_list_jql(issue_keys: list[str]) -> str:
+    """Returns the JQL matching the issue keys, quoted and escaped."""
+    quoted = ('"{}"'.format(key.replace("\\", "\\\\").replace('"', '\\"')) for key in issue_keys)
+    return "key in ({})".format(", ".join(quoted))
+
+
+def _chunk_issue_keys(issue_keys: list[str], chunk_size: int) -> list[list[str]]:
+    """Splits the unique keys into chunks bounded by size and by the encoded length of their JQL."""
+    chunks: list[list[str]] = [[]]
+    empty_length = length = len(_key_list_jql([]).encode())
+    for key in dict.fromkeys(issue_keys):
+        # Quoted and escaped key, followed by the separator
+        clause_length = len(_key_list_jql([key]).encode()) - empty_length + 2
+        if chunks[-1] and (
+            len(chunks[-1]) >= chunk_size or length + clause_length > _MAX_JQL_LENGTH
+        ):
+            chunks.append([])
+            length = empty_length
+        chunks[-1].append(key)
+        length += clause_length
+    return [chunk for chunk in chunks if chunk]
+
+
+async def _async_search_key_chunk(
+    chunk: list[str],
+    expand: str | None,
+    fields: list[str] | str | None,
+    client: httpx.AsyncClient,
+) -> dict[str, dict]:
     """
-    Async call to fetch the result of a search for issues using JQL.
+    Returns the issues of the chunk of keys keyed by requested key.
+
+    The search follows moved issues, but returns them under their new key. When a
+    single requested key is missing and a single unrequested issue is returned, they
+    are the same issue. Otherwise, the new key of each missing key is looked up, and
+    only keys the search did not match at all are fetched one by one. An empty
+    dictionary is returned for each key that matches no issue.
+    """
+    jira = _search_jira_info(jql=_key_list_jql(chunk), expand=expand, fields=fields)
+    # Keys that no longer exist are reported as warnings instead of failing the chunk
+    jira.payload["validateQuery"] = "warn"
+    pages = await rest.send_paginated_requests(jira=jira, client=client, decode=True)
+    returned = {issue["key"].upper(): issue for page in pages for issue in page["issues"]}
+    issues = {key: returned[key] for key in chunk if key in returned}
+    missing_keys = [key for key in chunk if key not in issues]
+    moved_issues = [issue for key, issue in returned.items() if key not in issues]
+    if len(missing_keys) == 1 and len(moved_issues) == 1:
+        issues[missing_keys[0]] = moved_issues[0]
+        return issues
+
+    async def fetch_missing(key: str) -> dict:
+        "Maps the key to a moved issue already returned, or fetches it by key."
+        if moved_issues:
+            moved = await _async_fetch_single_issue(
+                jira=_issue_jira_info(issue_key=key, fields=["key"]), client=client
+            )
+            if moved.get("key", "").upper() in returned:
+                return returned[moved["key"].upper()]
+        return await _async_fetch_single_issue(
+            jira=_issue_jira_info(issue_key=key, expand=expand, fields=fields), client=client
+        )
+
+    issues.update(zip(missing_keys, await asyncio.gather(*map(fetch_missing, missing_keys))))
+    return issues
+
+
+async def async_fetch_issues_from_list(
+    issue_keys: list[str],
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    chunk_size: int | None = None,
+    session: Session | None = None,
+) -> list[dict]:
+    """
+    Async call to fetch the details of a list of issues.
 
     It is intended to be used on asynchronous code. Use the sync version otherwise.
-    Return the results of a search for issues using the provided JQL. It is based on
-    the API POST /rest/api/2/search.
+    Return the details of a list of issues in the order of the provided keys. The keys
+    are split into chunks searched concurrently with the JQL key in (...) through the
+    API POST /rest/api/2/search, so each request returns many issues instead of one.
+    Chunks are bounded by number of keys and by the length of their JQL. Moved issues
+    returned by the search under their new key are mapped to the requested key, and
+    keys the search did not match are fetched one by one through
+    GET /rest/api/2/issue/{issueKey}, which follows the moves.
 
     Args:
-        jql (str): A valid Jira Query Language in string format.
+        issue_keys (list[str]): A list of strings representing the issue keys.
         expand (str | None, optional): Expect a simple string with a comma-separated\
         list of attributes to be expanded. They are: renderedFields, name, schema,\
         transitions, operations, editmeta, changelog, and versionedRepresentations.\
         Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        chunk_size (int | None, optional): Maximum number of keys per search.\
+        Defaults to the configured number of results per page.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
 
     Returns:
-        List of dictionaries representing the returned projects.\
-        An empty list is returned if nothing found.
+        List of dictionaries representing the returned issues, one per provided key.\
+        An empty dictionary is returned for each key that matches no issue.
     """
-    expand_dict = {} if expand is None else {"expand": expand}
-    query = {"jql": jql}
+    if chunk_size is None:
+        chunk_size = YajawConfig.configuration("pagination", "page_results")
+    normalized_keys = [key.strip().upper() for key in issue_keys]
 
-    jira = rest.JiraInfo(
+    issues_by_key: dict[str, dict] = {}
+    async with rest.client_scope(_session_client(session)) as client:
+        tasks = [
+            asyncio.create_task(_async_search_key_chunk(chunk, expand, fields, client))
+            for chunk in _chunk_issue_keys(normalized_keys, chunk_size)
+        ]
+        for issues in await asyncio.gather(*tasks):
+            issues_by_key.update(issues)
+
+    return [issues_by_key[key] for key in normalized_keys]
+
+
+@async_to_sync
+def fetch_issues_from_list(
+    issue_keys: list[str],
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    chunk_size: int | None = None,
+    session: Session | None = None,
+) -> list[dict]:
+    """
+    Sync call to fetch the details of a list of issues.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Return the details of a list of issues in the order of the provided keys. The keys
+    are split into chunks searched concurrently with the JQL key in (...) through the
+    API POST /rest/api/2/search, so each request returns many issues instead of one.
+    Chunks are bounded by number of keys and by the length of their JQL. Moved issues
+    returned by the search under their new key are mapped to the requested key, and
+    keys the search did not match are fetched one by one through
+    GET /rest/api/2/issue/{issueKey}, which follows the moves.
+
+    Args:
+        issue_keys (list[str]): A list of strings representing the issue keys.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. They are: renderedFields, name, schema,\
+        transitions, operations, editmeta, changelog, and versionedRepresentations.\
+        Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        chunk_size (int | None, optional): Maximum number of keys per search.\
+        Defaults to the configured number of results per page.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Returns:
+        List of dictionaries representing the returned issues, one per provided key.\
+        An empty dictionary is returned for each key that matches no issue.
+    """
+    return async_fetch_issues_from_list(
+        issue_keys=issue_keys, expand=expand, fields=fields, chunk_size=chunk_size, session=session
+    )
+
+
+def invalidate_cache(resource: str | None = None) -> None:
+    """
+    Removes responses kept by the in-memory cache of single-resource reads.
+
+    Args:
+        resource (str | None, optional): Resource, such as "project/ABC", or resource\
+        prefix, such as "issue", whose responses are removed. Every response is removed\
+        when None. Defaults to None.
+    """
+    if YajawConfig.MEMORY_CACHE is not None:
+        YajawConfig.MEMORY_CACHE.invalidate(resource)
+
+
+def register_field_profile(name: str, fields: list[str]) -> None:
+    """
+    Registers a named field profile to be used as the fields of a search.
+
+    Field profiles define common projections once, so searches can request only the
+    fields they need by name. Profiles may also be declared in the field_profiles
+    section of the configuration file.
+
+    Args:
+        name (str): Name of the field profile.
+        fields (list[str]): Fields returned for each issue when the profile is used.
+    """
+    YajawConfig.update_configuration("field_profiles", name, list(fields))
+
+
+async def _async_convert_pages(
+    pages: AsyncIterator[dict], items_key: str, result_type: type
+) -> list[Any]:
+    """Returns the items of the streamed pages converted to the result type, page by page."""
+    items = []
+    try:
+        async for page in pages:
+            items.extend(convert_issues(page.get(items_key, []), result_type))
+    except e.ResourceNotFoundError:
+        return []
+    finally:
+        await pages.aclose()
+    return items
+
+
+def _resolve_fields(fields: list[str] | str) -> list[str]:
+    """Returns the list of fields for a field profile name, comma-separated string or list."""
+    if isinstance(fields, str):
+        if fields in YajawConfig.FIELD_PROFILES:
+            return list(YajawConfig.FIELD_PROFILES[fields])
+        return [field.strip() for field in fields.split(",") if field.strip()]
+    return list(fields)
+
+
+def _search_jira_info(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+) -> rest.JiraInfo:
+    """Returns the JiraInfo for a JQL search with the requested projection."""
+    expand_dict = {} if expand is None else {"expand": expand}
+    query: dict = {"jql": jql}
+    if fields is not None:
+        query["fields"] = _resolve_fields(fields)
+    if properties is not None:
+        query["properties"] = list(properties)
+    if fields_by_keys:
+        query["fieldsByKeys"] = True
+
+    return rest.JiraInfo(
         method="POST",
         resource="search",
         api=YajawConfig.SERVER_API,
@@ -290,15 +639,81 @@ async def async_search_issues(jql: str, expand: str | None = None) -> list[dict]
         payload=query,
     )
 
+
+async def async_search_issues(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> list[dict] | list[Any]:
+    """
+    Async call to fetch the result of a search for issues using JQL.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Return the results of a search for issues using the provided JQL. It is based on
+    the API POST /rest/api/2/search.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. They are: renderedFields, name, schema,\
+        transitions, operations, editmeta, changelog, and versionedRepresentations.\
+        Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        properties (list[str] | None, optional): Issue properties returned for each\
+        issue. Defaults to None.
+        fields_by_keys (bool, optional): Whether the fields are referenced by keys\
+        instead of ids. Defaults to False.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
+
+    Returns:
+        List of dictionaries representing the returned projects.\
+        An empty list is returned if nothing found. Records of result_type are\
+        returned instead when result_type is not dict. They are converted as each\
+        page arrives, with at most the page window of pages in flight.
+    """
+    jira = _search_jira_info(
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        properties=properties,
+        fields_by_keys=fields_by_keys,
+    )
+
+    if result_type is not dict:
+        # Each page is converted as soon as it arrives and then released, so the issues
+        # are never all held as dictionaries at once
+        pages = rest.iter_paginated_requests(
+            jira=jira, client=_session_client(session), decode=True
+        )
+        return await _async_convert_pages(pages, "issues", result_type)
     try:
-        responses = await rest.send_paginated_requests(jira=jira)
-        return [issue for issue_page in responses for issue in issue_page.json()["issues"]]
+        pages = await rest.send_paginated_requests(
+            jira=jira, client=_session_client(session), decode=True
+        )
     except e.ResourceNotFoundError:
         return []
+    return [issue for issue_page in pages for issue in issue_page["issues"]]
 
 
 @async_to_sync
-def search_issues(jql: str, expand: str | None = None) -> list[dict]:
+def search_issues(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> list[dict] | list[Any]:
     """
     Sync call to fetch the result of a search for issues using JQL.
 
@@ -312,9 +727,699 @@ def search_issues(jql: str, expand: str | None = None) -> list[dict]:
         list of attributes to be expanded. They are: renderedFields, name, schema,\
         transitions, operations, editmeta, changelog, and versionedRepresentations.\
         Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        properties (list[str] | None, optional): Issue properties returned for each\
+        issue. Defaults to None.
+        fields_by_keys (bool, optional): Whether the fields are referenced by keys\
+        instead of ids. Defaults to False.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
 
     Returns:
         List of dictionaries representing the returned projects.\
+        An empty list is returned if nothing found. Records of result_type are\
+        returned instead when result_type is not dict. They are converted as each\
+        page arrives, with at most the page window of pages in flight.
+    """
+    return async_search_issues(
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        properties=properties,
+        fields_by_keys=fields_by_keys,
+        session=session,
+        result_type=result_type,
+    )
+
+
+async def _async_iter_search_pages(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+    window: int | None = None,
+    ordered: bool = True,
+    session: Session | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Async generator yielding the list of issues of each page from a JQL search."""
+    jira = _search_jira_info(
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        properties=properties,
+        fields_by_keys=fields_by_keys,
+    )
+
+    pages = rest.iter_paginated_requests(
+        jira=jira, client=_session_client(session), window=window, ordered=ordered, decode=True
+    )
+    try:
+        async for issue_page in pages:
+            yield issue_page["issues"]
+    except e.ResourceNotFoundError:
+        return
+    finally:
+        await pages.aclose()
+
+
+async def async_iter_search_issues(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+    window: int | None = None,
+    ordered: bool = True,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> AsyncIterator[dict | Any]:
+    """
+    Async iterator over the result of a search for issues using JQL.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Yield the issues of each page as soon as it arrives, keeping at most window
+    pages in flight and releasing each page once its issues are yielded. It is based
+    on the API POST /rest/api/2/search.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. They are: renderedFields, name, schema,\
+        transitions, operations, editmeta, changelog, and versionedRepresentations.\
+        Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        properties (list[str] | None, optional): Issue properties returned for each\
+        issue. Defaults to None.
+        fields_by_keys (bool, optional): Whether the fields are referenced by keys\
+        instead of ids. Defaults to False.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        ordered (bool, optional): Yields the pages in the search order when True, or\
+        as soon as each one completes otherwise. Defaults to True.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
+
+    Yields:
+        Dictionaries representing the returned issues, or records of result_type\
+        when it is not dict. Nothing is yielded if nothing found.
+    """
+    async for issue_page in _async_iter_search_pages(
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        properties=properties,
+        fields_by_keys=fields_by_keys,
+        window=window,
+        ordered=ordered,
+        session=session,
+    ):
+        for issue in convert_issues(issue_page, result_type):
+            yield issue
+
+
+def iter_search_issues(
+    jql: str,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    properties: list[str] | None = None,
+    fields_by_keys: bool = False,
+    window: int | None = None,
+    ordered: bool = True,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> Iterator[dict | Any]:
+    """
+    Sync iterator over the result of a search for issues using JQL.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Yield the issues of each page as soon as it arrives, keeping at most window
+    pages in flight and releasing each page once its issues are yielded. It is based
+    on the API POST /rest/api/2/search.
+
+    Args:
+        jql (str): A valid Jira Query Language in string format.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. They are: renderedFields, name, schema,\
+        transitions, operations, editmeta, changelog, and versionedRepresentations.\
+        Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        properties (list[str] | None, optional): Issue properties returned for each\
+        issue. Defaults to None.
+        fields_by_keys (bool, optional): Whether the fields are referenced by keys\
+        instead of ids. Defaults to False.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        ordered (bool, optional): Yields the pages in the search order when True, or\
+        as soon as each one completes otherwise. Defaults to True.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
+
+    Yields:
+        Dictionaries representing the returned issues, or records of result_type\
+        when it is not dict. Nothing is yielded if nothing found.
+    """
+    pages = _async_iter_search_pages(
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        properties=properties,
+        fields_by_keys=fields_by_keys,
+        window=window,
+        ordered=ordered,
+        session=session,
+    )
+    for issue_page in sync_iter(pages):
+        yield from convert_issues(issue_page, result_type)
+
+
+# Whether the paginated changelog resource exists, per Jira instance
+_CHANGELOG_RESOURCE: dict[str, bool] = {}
+
+
+async def _async_fetch_full_histories(issue_key: str, client: httpx.AsyncClient) -> list[dict]:
+    """
+    Returns every changelog history of the issue.
+
+    The paginated GET /rest/api/2/issue/{issueKey}/changelog is used when the instance
+    provides it. Otherwise, the whole changelog is fetched with the issue through
+    GET /rest/api/2/issue/{issueKey}?expand=changelog, which is not truncated.
+    """
+    base_url = YajawConfig.JIRA_BASE_URL
+    if _CHANGELOG_RESOURCE.get(base_url, True):
+        jira = rest.JiraInfo(
+            method="GET",
+            resource=f"issue/{issue_key}/changelog",
+            api=YajawConfig.SERVER_API,
+            params={},
+            payload=None,
+        )
+        try:
+            pages = await rest.send_paginated_requests(jira=jira, client=client, decode=True)
+            _CHANGELOG_RESOURCE[base_url] = True
+            return [history for page in pages for history in page.get("values", [])]
+        except e.ResourceNotFoundError:
+            pass
+
+    jira = _issue_jira_info(issue_key=issue_key, expand="changelog", fields=["key"])
+    issue = await _async_fetch_single_issue(jira=jira, client=client)
+    if issue and base_url not in _CHANGELOG_RESOURCE:
+        # The issue exists, so the changelog resource is not provided by the instance
+        _CHANGELOG_RESOURCE[base_url] = False
+    return (issue.get("changelog") or {}).get("histories", [])
+
+
+async def _async_issue_histories(issue: dict, client: httpx.AsyncClient) -> list[dict]:
+    """Returns the histories embedded in the issue, completed if they were truncated."""
+    changelog = issue.get("changelog") or {}
+    histories = changelog.get("histories", [])
+    if changelog.get("total", len(histories)) <= len(histories):
+        return histories
+    return await _async_fetch_full_histories(issue_key=issue["key"], client=client)
+
+
+async def _async_iter_changelog_pages(
+    issue_keys: list[str] | None,
+    jql: str | None,
+    window: int,
+    client: httpx.AsyncClient,
+) -> AsyncIterator[list[dict]]:
+    """Async generator yielding pages of issues with their embedded changelogs."""
+    if jql is not None:
+        jira = _search_jira_info(jql=jql, expand="changelog", fields=["key"])
+        pages = rest.iter_paginated_requests(jira=jira, client=client, window=window, decode=True)
+        try:
+            async for page in pages:
+                yield page["issues"]
+        except e.ResourceNotFoundError:
+            return
+        finally:
+            await pages.aclose()
+        return
+
+    chunk_size = YajawConfig.configuration("pagination", "page_results")
+    normalized_keys = [key.strip().upper() for key in issue_keys]
+    pending_chunks = collections.deque(_chunk_issue_keys(normalized_keys, chunk_size))
+    in_flight: collections.deque[asyncio.Task] = collections.deque()
+
+    async def fetch_chunk(chunk: list[str]) -> list[dict]:
+        "Search the issues of the chunk, each one once even if requested by old and new key."
+        issues = await _async_search_key_chunk(chunk, "changelog", ["key"], client)
+        return list({issue["key"]: issue for issue in issues.values() if issue}.values())
+
+    try:
+        while pending_chunks or in_flight:
+            while pending_chunks and len(in_flight) < window:
+                in_flight.append(asyncio.create_task(fetch_chunk(pending_chunks.popleft())))
+            yield await in_flight.popleft()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def async_iter_changelogs(
+    issue_keys: list[str] | None = None,
+    jql: str | None = None,
+    changed_fields: list[str] | None = None,
+    window: int | None = None,
+    session: Session | None = None,
+) -> AsyncIterator[ChangelogRecord]:
+    """
+    Async iterator over the field changes of the changelogs of many issues.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    The issues, either listed by key or matched by the JQL, are searched with their
+    changelogs expanded through POST /rest/api/2/search. Changelogs truncated by the
+    search are completed concurrently through GET /rest/api/2/issue/{issueKey}/changelog,
+    or GET /rest/api/2/issue/{issueKey}?expand=changelog when the former is not
+    provided. Each change is yielded as a compact record as soon as its page is
+    complete, so the histories of all issues are never held at once.
+
+    Args:
+        issue_keys (list[str] | None, optional): Keys of the issues. Defaults to None.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        used instead of issue_keys. Defaults to None.
+        changed_fields (list[str] | None, optional): Names of the fields whose changes\
+        are yielded, such as ["status"]. Every change is yielded when None.\
+        Defaults to None.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: Either both or none of issue_keys and jql were provided.
+
+    Yields:
+        ChangelogRecord: Record of each field change, per issue in the order of the\
+        changelog. Nothing is yielded if nothing found.
+    """
+    if (issue_keys is None) == (jql is None):
+        raise ValueError("Provide either issue_keys or jql.")
+    window = max(1, window or YajawConfig.PAGE_WINDOW)
+    wanted_fields = None if changed_fields is None else set(changed_fields)
+
+    async with rest.client_scope(_session_client(session)) as client:
+        pages = _async_iter_changelog_pages(
+            issue_keys=issue_keys, jql=jql, window=window, client=client
+        )
+        try:
+            async for issues in pages:
+                histories = await asyncio.gather(
+                    *(_async_issue_histories(issue=issue, client=client) for issue in issues)
+                )
+                for issue, issue_histories in zip(issues, histories):
+                    for record in changelog_records(issue["key"], issue_histories, wanted_fields):
+                        yield record
+        finally:
+            await pages.aclose()
+
+
+def iter_changelogs(
+    issue_keys: list[str] | None = None,
+    jql: str | None = None,
+    changed_fields: list[str] | None = None,
+    window: int | None = None,
+    session: Session | None = None,
+) -> Iterator[ChangelogRecord]:
+    """
+    Sync iterator over the field changes of the changelogs of many issues.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    The issues, either listed by key or matched by the JQL, are searched with their
+    changelogs expanded through POST /rest/api/2/search. Changelogs truncated by the
+    search are completed concurrently through GET /rest/api/2/issue/{issueKey}/changelog,
+    or GET /rest/api/2/issue/{issueKey}?expand=changelog when the former is not
+    provided. Each change is yielded as a compact record as soon as its page is
+    complete, so the histories of all issues are never held at once.
+
+    Args:
+        issue_keys (list[str] | None, optional): Keys of the issues. Defaults to None.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        used instead of issue_keys. Defaults to None.
+        changed_fields (list[str] | None, optional): Names of the fields whose changes\
+        are yielded, such as ["status"]. Every change is yielded when None.\
+        Defaults to None.
+        window (int | None, optional): Maximum number of pages in flight. Defaults to\
+        the pagination page_window setting.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: Either both or none of issue_keys and jql were provided.
+
+    Yields:
+        ChangelogRecord: Record of each field change, per issue in the order of the\
+        changelog. Nothing is yielded if nothing found.
+    """
+    if (issue_keys is None) == (jql is None):
+        raise ValueError("Provide either issue_keys or jql.")
+    yield from sync_iter(
+        async_iter_changelogs(
+            issue_keys=issue_keys,
+            jql=jql,
+            changed_fields=changed_fields,
+            window=window,
+            session=session,
+        )
+    )
+
+
+async def async_fetch_changelogs(
+    issue_keys: list[str] | None = None,
+    jql: str | None = None,
+    changed_fields: list[str] | None = None,
+    session: Session | None = None,
+) -> list[ChangelogRecord]:
+    """
+    Async call to fetch the field changes of the changelogs of many issues.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    It collects the records of async_iter_changelogs into a list. Prefer the iterator
+    for a large number of issues.
+
+    Args:
+        issue_keys (list[str] | None, optional): Keys of the issues. Defaults to None.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        used instead of issue_keys. Defaults to None.
+        changed_fields (list[str] | None, optional): Names of the fields whose changes\
+        are returned, such as ["status"]. Every change is returned when None.\
+        Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: Either both or none of issue_keys and jql were provided.
+
+    Returns:
+        List of ChangelogRecord, per issue in the order of the changelog.\
+        An empty list is returned if nothing found.
+    """
+    return [
+        record
+        async for record in async_iter_changelogs(
+            issue_keys=issue_keys, jql=jql, changed_fields=changed_fields, session=session
+        )
+    ]
+
+
+@async_to_sync
+def fetch_changelogs(
+    issue_keys: list[str] | None = None,
+    jql: str | None = None,
+    changed_fields: list[str] | None = None,
+    session: Session | None = None,
+) -> list[ChangelogRecord]:
+    """
+    Sync call to fetch the field changes of the changelogs of many issues.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    It collects the records of async_iter_changelogs into a list. Prefer the iterator
+    for a large number of issues.
+
+    Args:
+        issue_keys (list[str] | None, optional): Keys of the issues. Defaults to None.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        used instead of issue_keys. Defaults to None.
+        changed_fields (list[str] | None, optional): Names of the fields whose changes\
+        are returned, such as ["status"]. Every change is returned when None.\
+        Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Raises:
+        ValueError: Either both or none of issue_keys and jql were provided.
+
+    Returns:
+        List of ChangelogRecord, per issue in the order of the changelog.\
         An empty list is returned if nothing found.
     """
-    return async_search_issues(jql=jql, expand=expand)
+    return async_fetch_changelogs(
+        issue_keys=issue_keys, jql=jql, changed_fields=changed_fields, session=session
+    )
+
+
+async def _async_fetch_agile_items(
+    resource: str,
+    params: dict,
+    items_key: str = "values",
+    session: Session | None = None,
+    result_type: type = dict,
+) -> list[dict] | list[Any]:
+    """Returns the items of every page of an Agile API resource, as the result type."""
+    jira = rest.JiraInfo(
+        method="GET",
+        resource=resource,
+        api=YajawConfig.AGILE_API,
+        params={name: value for name, value in params.items() if value is not None},
+        payload=None,
+    )
+    if result_type is not dict:
+        pages = rest.iter_paginated_requests(
+            jira=jira, client=_session_client(session), decode=True
+        )
+        return await _async_convert_pages(pages, items_key, result_type)
+    try:
+        pages = await rest.send_paginated_requests(
+            jira=jira, client=_session_client(session), decode=True
+        )
+    except e.ResourceNotFoundError:
+        return []
+    return [item for page in pages for item in page.get(items_key, [])]
+
+
+async def async_fetch_boards(
+    board_type: str | None = None,
+    name: str | None = None,
+    project_key: str | None = None,
+    session: Session | None = None,
+) -> list[dict]:
+    """
+    Async call to fetch the boards visible to the user.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Return every board matching the optional filters. It is based on the API
+    GET /rest/agile/1.0/board, whose pages are requested concurrently when it reports
+    a total, and one after the other otherwise.
+
+    Args:
+        board_type (str | None, optional): Type of the boards: scrum, kanban or simple.\
+        Defaults to None.
+        name (str | None, optional): Text contained in the name of the boards.\
+        Defaults to None.
+        project_key (str | None, optional): Key or id of the project the boards are\
+        related to. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Returns:
+        List of dictionaries representing the returned boards.\
+        An empty list is returned if nothing found.
+    """
+    params = {"type": board_type, "name": name, "projectKeyOrId": project_key}
+    return await _async_fetch_agile_items(resource="board", params=params, session=session)
+
+
+@async_to_sync
+def fetch_boards(
+    board_type: str | None = None,
+    name: str | None = None,
+    project_key: str | None = None,
+    session: Session | None = None,
+) -> list[dict]:
+    """
+    Sync call to fetch the boards visible to the user.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Return every board matching the optional filters. It is based on the API
+    GET /rest/agile/1.0/board, whose pages are requested concurrently when it reports
+    a total, and one after the other otherwise.
+
+    Args:
+        board_type (str | None, optional): Type of the boards: scrum, kanban or simple.\
+        Defaults to None.
+        name (str | None, optional): Text contained in the name of the boards.\
+        Defaults to None.
+        project_key (str | None, optional): Key or id of the project the boards are\
+        related to. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Returns:
+        List of dictionaries representing the returned boards.\
+        An empty list is returned if nothing found.
+    """
+    return async_fetch_boards(
+        board_type=board_type, name=name, project_key=project_key, session=session
+    )
+
+
+async def async_fetch_sprints(
+    board_id: int, state: str | None = None, session: Session | None = None
+) -> list[dict]:
+    """
+    Async call to fetch the sprints of a board.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Return every sprint of the board. It is based on the API
+    GET /rest/agile/1.0/board/{boardId}/sprint, paginated with the is_last strategy:
+    each page starts after the items of the previous one until a page is marked as the
+    last. Pages are requested one after the other, concurrently when a total is
+    reported anyway, or through a window of future offsets when speculative
+    pagination is enabled.
+
+    Args:
+        board_id (int): Identifier of the board.
+        state (str | None, optional): Comma-separated states of the sprints: future,\
+        active or closed. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Returns:
+        List of dictionaries representing the sprints of every page, in the order of\
+        the pages. An empty list is returned if nothing found or the board does not\
+        exist.
+    """
+    return await _async_fetch_agile_items(
+        resource=f"board/{board_id}/sprint", params={"state": state}, session=session
+    )
+
+
+@async_to_sync
+def fetch_sprints(
+    board_id: int, state: str | None = None, session: Session | None = None
+) -> list[dict]:
+    """
+    Sync call to fetch the sprints of a board.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Return every sprint of the board. It is based on the API
+    GET /rest/agile/1.0/board/{boardId}/sprint, paginated with the is_last strategy:
+    each page starts after the items of the previous one until a page is marked as the
+    last. Pages are requested one after the other, concurrently when a total is
+    reported anyway, or through a window of future offsets when speculative
+    pagination is enabled.
+
+    Args:
+        board_id (int): Identifier of the board.
+        state (str | None, optional): Comma-separated states of the sprints: future,\
+        active or closed. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+
+    Returns:
+        List of dictionaries representing the sprints of every page, in the order of\
+        the pages. An empty list is returned if nothing found or the board does not\
+        exist.
+    """
+    return async_fetch_sprints(board_id=board_id, state=state, session=session)
+
+
+async def async_fetch_sprint_issues(
+    sprint_id: int,
+    jql: str | None = None,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> list[dict] | list[Any]:
+    """
+    Async call to fetch the issues of a sprint.
+
+    It is intended to be used on asynchronous code. Use the sync version otherwise.
+    Return every issue of the sprint, optionally filtered by a JQL. It is based on the
+    API GET /rest/agile/1.0/sprint/{sprintId}/issue, which reports a total, so its
+    pages are requested concurrently.
+
+    Args:
+        sprint_id (int): Identifier of the sprint.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        filtering the issues of the sprint. Defaults to None.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
+
+    Returns:
+        List of dictionaries representing the returned issues.\
+        An empty list is returned if nothing found. Records of result_type are\
+        returned instead when result_type is not dict. They are converted as each\
+        page arrives, with at most the page window of pages in flight.
+    """
+    params = {
+        "jql": jql,
+        "expand": expand,
+        "fields": None if fields is None else ",".join(_resolve_fields(fields)),
+    }
+    return await _async_fetch_agile_items(
+        resource=f"sprint/{sprint_id}/issue",
+        params=params,
+        items_key="issues",
+        session=session,
+        result_type=result_type,
+    )
+
+
+@async_to_sync
+def fetch_sprint_issues(
+    sprint_id: int,
+    jql: str | None = None,
+    expand: str | None = None,
+    fields: list[str] | str | None = None,
+    session: Session | None = None,
+    result_type: type = dict,
+) -> list[dict] | list[Any]:
+    """
+    Sync call to fetch the issues of a sprint.
+
+    It is intended to be used on synchronous code. Use the async version otherwise.
+    Return every issue of the sprint, optionally filtered by a JQL. It is based on the
+    API GET /rest/agile/1.0/sprint/{sprintId}/issue, which reports a total, so its
+    pages are requested concurrently.
+
+    Args:
+        sprint_id (int): Identifier of the sprint.
+        jql (str | None, optional): A valid Jira Query Language in string format,\
+        filtering the issues of the sprint. Defaults to None.
+        expand (str | None, optional): Expect a simple string with a comma-separated\
+        list of attributes to be expanded. Defaults to None.
+        fields (list[str] | str | None, optional): Fields returned for each issue,\
+        either as a list, a comma-separated string or the name of a field profile.\
+        Every navigable field is returned when None. Defaults to None.
+        session (Session | None, optional): Session whose pooled client is used.\
+        The active session, or a new client, is used otherwise. Defaults to None.
+        result_type (type, optional): Type of the returned issues. Either dict, or a\
+        compact record class such as yajaw.records.IssueRecord. Defaults to dict.
+
+    Returns:
+        List of dictionaries representing the returned issues.\
+        An empty list is returned if nothing found. Records of result_type are\
+        returned instead when result_type is not dict. They are converted as each\
+        page arrives, with at most the page window of pages in flight.
+    """
+    return async_fetch_sprint_issues(
+        sprint_id=sprint_id,
+        jql=jql,
+        expand=expand,
+        fields=fields,
+        session=session,
+        result_type=result_type,
+    )
@@ -0,0 +1,394 @@
+"""
+Module responsible for keeping a local mirror of Jira issues.
+Repeated synchronizations only request the issues updated since the last run.
+"""
+import asyncio
+import json
+import math
+import re
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from yajaw import YajawConfig
+from yajaw import jira as j
+from yajaw.core.session import Session
+from yajaw.utils.concurrency import async_to_sync
+
+_ORDER_BY = re.compile(r"\s+order\s+by\s+.*$", re.IGNORECASE | re.DOTALL)
+_JIRA_TIMESTAMP = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    id TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    updated TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_key ON issues (key);
+CREATE TABLE IF NOT EXISTS memberships (
+    jql TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    PRIMARY KEY (jql, issue_id)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    jql TEXT PRIMARY KEY,
+    watermark TEXT,
+    reconciled_at TEXT
+);
+"""
+
+
+def _normalize_jql(jql: str) -> str:
+    """Returns the JQL without its ordering clause and redundant whitespaces."""
+    return " ".join(_ORDER_BY.sub("", jql).split())
+
+
+def _parse_updated(issue: dict) -> datetime | None:
+    """Returns the issue updated timestamp as an aware datetime, if present."""
+    updated = issue.get("fields", {}).get("updated")
+    if not updated:
+        return None
+    return datetime.strptime(updated, _JIRA_TIMESTAMP).astimezone(UTC)
+
+
+class IssueMirror:
+    """
+    Class representing a local SQLite mirror of the issues matched by JQL searches.
+
+    The first synchronization of a JQL retrieves every matching issue. The next ones
+    only request the issues updated since the latest update seen, minus an overlap
+    window that absorbs clock skew between the client and the Jira instance, and
+    upsert them by issue id. Issues deleted or no longer matched are detected by
+    periodic key-only scans. The watermark is sent as a relative JQL date, so the
+    time zone of the Jira user does not matter.
+
+    Readers may query the mirror at any time without touching Jira:
+
+        with IssueMirror("issues.db") as mirror:
+            mirror.refresh("project = ABC")
+            issue = mirror.get_issue("ABC-1")
+
+    Attributes:
+        path: Location of the SQLite database file.
+        overlap: Window subtracted from the watermark on incremental synchronizations.
+        reconcile_interval: Minimum time between key-only scans of the same JQL.\
+        Scans only happen when requested explicitly if None.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        overlap: timedelta = timedelta(minutes=10),
+        reconcile_interval: timedelta | None = timedelta(days=1),
+    ):
+        """
+        Initializes an IssueMirror object and creates the database schema if needed.
+
+        Args:
+            path (str | Path): Location of the SQLite database file.
+            overlap (timedelta, optional): Window subtracted from the watermark.\
+            Defaults to 10 minutes.
+            reconcile_interval (timedelta | None, optional): Minimum time between\
+            key-only scans of the same JQL. Defaults to one day.
+        """
+        self.path = Path(path)
+        self.overlap = overlap
+        self.reconcile_interval = reconcile_interval
+        # Sync calls may run the coroutines on a different thread, and the writes run in
+        # worker threads, so the connection is shared and its transactions serialized
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        """Closes the connection to the database."""
+        self._db.close()
+
+    def __enter__(self) -> "IssueMirror":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _watermark(self, jql: str) -> tuple[datetime | None, datetime | None]:
+        """Returns the watermark and the last reconciliation time stored for the JQL."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark, reconciled_at FROM watermarks WHERE jql = ?", (jql,)
+            ).fetchone()
+        if row is None:
+            return None, None
+        return tuple(None if value is None else datetime.fromisoformat(value) for value in row)
+
+    def _incremental_jql(self, jql: str, watermark: datetime) -> str:
+        """Returns the JQL restricted to issues updated since the watermark minus overlap."""
+        elapsed = datetime.now(UTC) - watermark + self.overlap
+        minutes = max(1, math.ceil(elapsed.total_seconds() / 60))
+        return f'({jql}) AND updated >= "-{minutes}m"'
+
+    def _reconciliation_due(self, reconciled_at: datetime | None) -> bool:
+        """Checks if the periodic key-only scan is due."""
+        if self.reconcile_interval is None:
+            return False
+        return reconciled_at is None or datetime.now(UTC) - reconciled_at >= self.reconcile_interval
+
+    def _upsert(self, jql: str, issue: dict):
+        """Inserts or updates the issue and its membership to the JQL."""
+        updated = _parse_updated(issue)
+        self._db.execute(
+            "INSERT INTO issues (id, key, updated, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET "
+            "key = excluded.key, updated = excluded.updated, data = excluded.data",
+            (
+                issue["id"],
+                issue["key"],
+                None if updated is None else updated.isoformat(),
+                json.dumps(issue),
+            ),
+        )
+        self._db.execute(
+            "INSERT OR IGNORE INTO memberships (jql, issue_id) VALUES (?, ?)", (jql, issue["id"])
+        )
+
+    def _upsert_page(self, jql: str, issues: list[dict]):
+        """Upserts the issues of a page in a transaction of their own."""
+        with self._lock, self._db:
+            for issue in issues:
+                self._upsert(jql, issue)
+
+    def _remove_missing(self, jql: str, issue_ids: set[str]) -> int:
+        """Removes memberships of issues no longer matched and orphan issues."""
+        stored = {
+            row[0]
+            for row in self._db.execute("SELECT issue_id FROM memberships WHERE jql = ?", (jql,))
+        }
+        missing = [(jql, issue_id) for issue_id in stored - issue_ids]
+        self._db.executemany("DELETE FROM memberships WHERE jql = ? AND issue_id = ?", missing)
+        self._db.execute("DELETE FROM issues WHERE id NOT IN (SELECT issue_id FROM memberships)")
+        return len(missing)
+
+    def _store_watermark(self, jql: str, watermark: datetime | None, reconciled_at=None):
+        """Stores the watermark and, if provided, the reconciliation time for the JQL."""
+        self._db.execute(
+            "INSERT INTO watermarks (jql, watermark, reconciled_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (jql) DO UPDATE SET watermark = excluded.watermark, "
+            "reconciled_at = COALESCE(excluded.reconciled_at, watermarks.reconciled_at)",
+            (
+                jql,
+                None if watermark is None else watermark.isoformat(),
+                None if reconciled_at is None else reconciled_at.isoformat(),
+            ),
+        )
+
+    def _complete(
+        self,
+        jql: str,
+        issue_ids: set[str] | None,
+        watermark: datetime | None,
+        reconciled_at: datetime | None,
+    ) -> int:
+        """
+        Removes the issues missing from a full scan, if any, and stores the watermark.
+
+        The stored watermark is kept when it is more recent, such as when a concurrent
+        refresh of the same JQL completed first, or when none is provided.
+        """
+        with self._lock, self._db:
+            removed = 0 if issue_ids is None else self._remove_missing(jql, issue_ids)
+            stored, _ = self._watermark(jql)
+            if watermark is None or (stored is not None and stored > watermark):
+                watermark = stored
+            self._store_watermark(jql, watermark, reconciled_at=reconciled_at)
+        return removed
+
+    async def async_reconcile(self, jql: str, session: Session | None = None) -> int:
+        """
+        Async call to remove the mirrored issues no longer matched by the JQL.
+
+        It is intended to be used on asynchronous code. Use the sync version otherwise.
+        A key-only scan of the JQL is performed and the issues missing from it are
+        removed from the mirror.
+
+        Args:
+            jql (str): A valid Jira Query Language in string format.
+            session (Session | None, optional): Session whose pooled client is used.\
+            The active session, or a new client, is used otherwise. Defaults to None.
+
+        Returns:
+            Number of issues removed from the JQL.
+        """
+        jql = _normalize_jql(jql)
+        started_at = datetime.now(UTC)
+        issue_ids = {
+            issue["id"]
+            async for issue in j.async_iter_search_issues(
+                jql=jql, fields="key_only", session=session
+            )
+        }
+        removed = await asyncio.to_thread(self._complete, jql, issue_ids, None, started_at)
+        YajawConfig.LOGGER.info(f"mirror reconciled {jql!r} -- {removed} issues removed")
+        return removed
+
+    @async_to_sync
+    def reconcile(self, jql: str, session: Session | None = None) -> int:
+        """
+        Sync call to remove the mirrored issues no longer matched by the JQL.
+
+        It is intended to be used on synchronous code. Use the async version otherwise.
+        A key-only scan of the JQL is performed and the issues missing from it are
+        removed from the mirror.
+
+        Args:
+            jql (str): A valid Jira Query Language in string format.
+            session (Session | None, optional): Session whose pooled client is used.\
+            The active session, or a new client, is used otherwise. Defaults to None.
+
+        Returns:
+            Number of issues removed from the JQL.
+        """
+        return self.async_reconcile(jql=jql, session=session)
+
+    async def async_refresh(
+        self,
+        jql: str,
+        expand: str | None = None,
+        fields: list[str] | str | None = None,
+        session: Session | None = None,
+    ) -> dict:
+        """
+        Async call to synchronize the mirror with the issues matched by the JQL.
+
+        It is intended to be used on asynchronous code. Use the sync version otherwise.
+        Only the issues updated since the stored watermark are requested, except on the
+        first synchronization of the JQL. A key-only scan is also performed when the
+        reconciliation interval has elapsed.
+
+        Args:
+            jql (str): A valid Jira Query Language in string format.
+            expand (str | None, optional): Expect a simple string with a comma-separated\
+            list of attributes to be expanded. Defaults to None.
+            fields (list[str] | str | None, optional): Fields stored for each issue, as\
+            accepted by jira.search_issues. The updated field is always requested.\
+            Defaults to None.
+            session (Session | None, optional): Session whose pooled client is used.\
+            The active session, or a new client, is used otherwise. Defaults to None.
+
+        Returns:
+            Dictionary with the number of upserted and removed issues, whether the\
+            synchronization was a full one, and the new watermark.
+        """
+        jql = _normalize_jql(jql)
+        if fields is not None:
+            fields = [*j._resolve_fields(fields), "updated"]
+        started_at = datetime.now(UTC)
+        watermark, reconciled_at = await asyncio.to_thread(self._watermark, jql)
+        full = watermark is None
+        search_jql = jql if full else self._incremental_jql(jql, watermark)
+
+        # Each page is written in a short transaction off the event loop, so concurrent
+        # refreshes never share a transaction. The watermark is only stored at the end,
+        # so an interrupted refresh requests the same issues again.
+        upserted, issue_ids = 0, set()
+        async for issue_page in j._async_iter_search_pages(
+            jql=search_jql, expand=expand, fields=fields, session=session
+        ):
+            await asyncio.to_thread(self._upsert_page, jql, issue_page)
+            for issue in issue_page:
+                issue_ids.add(issue["id"])
+                updated = _parse_updated(issue)
+                if updated is not None and (watermark is None or updated > watermark):
+                    watermark = updated
+            upserted += len(issue_page)
+        if watermark is None:
+            watermark = started_at
+        removed = await asyncio.to_thread(
+            self._complete,
+            jql,
+            issue_ids if full else None,
+            watermark,
+            started_at if full else None,
+        )
+
+        if not full and self._reconciliation_due(reconciled_at):
+            removed = await self.async_reconcile(jql=jql, session=session)
+
+        YajawConfig.LOGGER.info(f"mirror refreshed {jql!r} -- {upserted} issues upserted")
+        return {
+            "upserted": upserted,
+            "removed": removed,
+            "full": full,
+            "watermark": watermark.isoformat(),
+        }
+
+    @async_to_sync
+    def refresh(
+        self,
+        jql: str,
+        expand: str | None = None,
+        fields: list[str] | str | None = None,
+        session: Session | None = None,
+    ) -> dict:
+        """
+        Sync call to synchronize the mirror with the issues matched by the JQL.
+
+        It is intended to be used on synchronous code. Use the async version otherwise.
+        Only the issues updated since the stored watermark are requested, except on the
+        first synchronization of the JQL. A key-only scan is also performed when the
+        reconciliation interval has elapsed.
+
+        Args:
+            jql (str): A valid Jira Query Language in string format.
+            expand (str | None, optional): Expect a simple string with a comma-separated\
+            list of attributes to be expanded. Defaults to None.
+            fields (list[str] | str | None, optional): Fields stored for each issue, as\
+            accepted by jira.search_issues. The updated field is always requested.\
+            Defaults to None.
+            session (Session | None, optional): Session whose pooled client is used.\
+            The active session, or a new client, is used otherwise. Defaults to None.
+
+        Returns:
+            Dictionary with the number of upserted and removed issues, whether the\
+            synchronization was a full one, and the new watermark.
+        """
+        return self.async_refresh(jql=jql, expand=expand, fields=fields, session=session)
+
+    def get_issue(self, issue_key: str) -> dict:
+        """
+        Returns a mirrored issue by its key or id.
+
+        Args:
+            issue_key (str): Key or id identifier for the issue.
+
+        Returns:
+            Dictionary with the issue details. An empty dictionary is returned\
+            if nothing is found.
+        """
+        row = self._db.execute(
+            "SELECT data FROM issues WHERE key = ? OR id = ?", (issue_key, issue_key)
+        ).fetchone()
+        return {} if row is None else json.loads(row[0])
+
+    def issues(self, jql: str | None = None) -> Iterator[dict]:
+        """
+        Iterates over the mirrored issues.
+
+        Args:
+            jql (str | None, optional): Restricts the issues to those synchronized for\
+            the JQL. Every mirrored issue is returned when None. Defaults to None.
+
+        Yields:
+            Dictionaries representing the mirrored issues.
+        """
+        if jql is None:
+            rows = self._db.execute("SELECT data FROM issues ORDER BY key")
+        else:
+            rows = self._db.execute(
+                "SELECT data FROM issues JOIN memberships ON issues.id = memberships.issue_id "
+                "WHERE memberships.jql = ? ORDER BY key",
+                (_normalize_jql(jql),),
+            )
+        for (data,) in rows:
+            yield json.loads(data)
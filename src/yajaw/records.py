@@ -0,0 +1,275 @@
+"""
+Module defining compact representations of Jira resources.
+They are an alternative to the nested dictionaries returned by default.
+"""
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from yajaw import YajawConfig
+from yajaw.core.codec import encode_json
+
+
+def _intern(value: str | None) -> str | None:
+    """Returns the interned string, so repeated values share a single object."""
+    return None if value is None else sys.intern(value)
+
+
+def _name(field: dict | None) -> str | None:
+    """Returns the interned name of a field such as the status or the priority."""
+    return None if not field else _intern(field.get("name"))
+
+
+def _user(field: dict | None) -> str | None:
+    """Returns the interned user name, or the account id on Jira Cloud."""
+    if not field:
+        return None
+    return _intern(field.get("name") or field.get("accountId") or field.get("displayName"))
+
+
+class IssueRecord:
+    """
+    Class representing an issue with only its common fields.
+
+    Records use __slots__ instead of a dictionary per object, and repeated values,
+    such as status, priority, issue type, project and user names, share a single
+    interned string, so a large number of issues fits in a fraction of the memory of
+    the nested dictionaries. The original payload is dropped, unless the record is
+    created with keep_raw, as RawIssueRecord does.
+
+    Use it through the result_type argument of the search and fetch functions:
+
+        issues = jira.search_issues("project = ABC", result_type=IssueRecord)
+
+    Attributes:
+        id: Issue identifier.
+        key: Issue key.
+        summary: Summary of the issue.
+        status: Name of the status.
+        priority: Name of the priority.
+        issue_type: Name of the issue type.
+        resolution: Name of the resolution.
+        project: Key of the project.
+        assignee: User name of the assignee.
+        reporter: User name of the reporter.
+        created: Creation timestamp as returned by Jira.
+        updated: Last update timestamp as returned by Jira.
+        labels: Tuple of labels.
+    """
+
+    __slots__ = (
+        "id",
+        "key",
+        "summary",
+        "status",
+        "priority",
+        "issue_type",
+        "resolution",
+        "project",
+        "assignee",
+        "reporter",
+        "created",
+        "updated",
+        "labels",
+        "_raw",
+    )
+
+    def __init__(self, **values: Any):
+        """
+        Initializes an IssueRecord object. Missing attributes are set to None.
+
+        Args:
+            **values (Any): Value per attribute name, and optionally the raw JSON bytes\
+            of the issue as _raw.
+        """
+        for name in IssueRecord.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_issue(cls, issue: dict, keep_raw: bool = False) -> "IssueRecord":
+        """
+        Creates a record from an issue returned by the Jira API.
+
+        Args:
+            issue (dict): Issue as returned by the Jira API.
+            keep_raw (bool, optional): Whether the payload is kept as compact JSON bytes,\
+            decoded again when the raw attribute is accessed. Defaults to False.
+
+        Returns:
+            IssueRecord: The compact record of the issue.
+        """
+        fields = issue.get("fields") or {}
+        project = fields.get("project") or {}
+        return cls(
+            id=issue.get("id"),
+            key=issue.get("key"),
+            summary=fields.get("summary"),
+            status=_name(fields.get("status")),
+            priority=_name(fields.get("priority")),
+            issue_type=_name(fields.get("issuetype")),
+            resolution=_name(fields.get("resolution")),
+            project=_intern(project.get("key")),
+            assignee=_user(fields.get("assignee")),
+            reporter=_user(fields.get("reporter")),
+            created=fields.get("created"),
+            updated=fields.get("updated"),
+            labels=tuple(_intern(label) for label in fields.get("labels") or ()),
+            _raw=encode_json(issue) if keep_raw else None,
+        )
+
+    @property
+    def raw(self) -> dict | None:
+        """Original payload of the issue, decoded on each access, if it was kept."""
+        return None if self._raw is None else YajawConfig.JSON_DECODER(self._raw)
+
+    def as_dict(self) -> dict:
+        """Returns the compact fields of the record as a flat dictionary."""
+        return {name: getattr(self, name) for name in IssueRecord.__slots__ if name != "_raw"}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"IssueRecord(key={self.key!r}, status={self.status!r})"
+
+
+class RawIssueRecord(IssueRecord):
+    """
+    Class representing an issue record that also keeps its original payload.
+
+    The payload is kept as compact JSON bytes and decoded again only when the raw
+    attribute is accessed. It costs about the size of the JSON body per issue.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_issue(cls, issue: dict, keep_raw: bool = True) -> "RawIssueRecord":
+        """
+        Creates a record keeping the payload from an issue returned by the Jira API.
+
+        Args:
+            issue (dict): Issue as returned by the Jira API.
+            keep_raw (bool, optional): Whether the payload is kept as compact JSON bytes.\
+            Defaults to True.
+
+        Returns:
+            RawIssueRecord: The compact record of the issue.
+        """
+        return super().from_issue(issue, keep_raw=keep_raw)
+
+
+def convert_issues(issues: list[dict], result_type: type) -> list:
+    """
+    Converts the issues into the requested result type.
+
+    Args:
+        issues (list[dict]): Issues as returned by the Jira API.
+        result_type (type): Either dict, which keeps the issues as they are, or a class\
+        providing a from_issue class method, such as IssueRecord.
+
+    Returns:
+        List of issues of the requested type.
+    """
+    if result_type is dict:
+        return issues
+    return [result_type.from_issue(issue) for issue in issues]
+
+
+class ChangelogRecord:
+    """
+    Class representing a single field change from the changelog of an issue.
+
+    Each history of a changelog may change several fields at once, and each of them
+    becomes a record. Field names, values and authors are interned, since the same
+    transitions, such as between statuses, repeat across issues.
+
+    Attributes:
+        issue: Key of the issue.
+        field: Name of the changed field.
+        from_value: Displayed value before the change, or its id when not displayed.
+        to_value: Displayed value after the change, or its id when not displayed.
+        author: User name of the author, or the account id on Jira Cloud.
+        timestamp: Timestamp of the change as returned by Jira.
+    """
+
+    __slots__ = ("issue", "field", "from_value", "to_value", "author", "timestamp")
+
+    def __init__(
+        self,
+        issue: str,
+        field: str,
+        from_value: str | None,
+        to_value: str | None,
+        author: str | None,
+        timestamp: str,
+    ):
+        """
+        Initializes a ChangelogRecord object.
+
+        Args:
+            issue (str): Key of the issue.
+            field (str): Name of the changed field.
+            from_value (str | None): Value before the change.
+            to_value (str | None): Value after the change.
+            author (str | None): User name of the author.
+            timestamp (str): Timestamp of the change.
+        """
+        self.issue = issue
+        self.field = field
+        self.from_value = from_value
+        self.to_value = to_value
+        self.author = author
+        self.timestamp = timestamp
+
+    def as_tuple(self) -> tuple:
+        """Returns the record as a tuple in the order of its attributes."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChangelogRecord):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangelogRecord(issue={self.issue!r}, field={self.field!r},"
+            f" from_value={self.from_value!r}, to_value={self.to_value!r},"
+            f" timestamp={self.timestamp!r})"
+        )
+
+
+def changelog_records(
+    issue_key: str, histories: list[dict], changed_fields: set[str] | None = None
+) -> Iterator[ChangelogRecord]:
+    """
+    Yields a record per changed field of the changelog histories of an issue.
+
+    Args:
+        issue_key (str): Key of the issue.
+        histories (list[dict]): Changelog histories as returned by the Jira API.
+        changed_fields (set[str] | None, optional): Names of the fields whose changes\
+        are yielded. Every change is yielded when None. Defaults to None.
+
+    Yields:
+        ChangelogRecord: Record of each field change.
+    """
+    for history in histories:
+        author = _user(history.get("author"))
+        timestamp = history.get("created")
+        for item in history.get("items", ()):
+            field = item.get("field")
+            if changed_fields is not None and field not in changed_fields:
+                continue
+            from_value = item.get("fromString")
+            to_value = item.get("toString")
+            yield ChangelogRecord(
+                issue=issue_key,
+                field=_intern(field),
+                from_value=_intern(from_value if from_value is not None else item.get("from")),
+                to_value=_intern(to_value if to_value is not None else item.get("to")),
+                author=author,
+                timestamp=timestamp,
+            )
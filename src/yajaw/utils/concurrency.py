@@ -3,9 +3,144 @@ Module responsible for utilitarian decorators used to run async function
 synchronously.
 """
 import asyncio
+import atexit
 import concurrent.futures
 import functools
 import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextvars import ContextVar, Token
+
+from yajaw import YajawConfig
+
+_runner_local = threading.local()
+
+
+class LoopRunner:
+    """
+    Class representing an event loop kept alive in a dedicated daemon thread.
+
+    Coroutines submitted from any other thread run on the same long-lived loop,
+    which allows loop-bound resources, such as pooled connections, to be reused
+    across synchronous calls.
+    """
+
+    def __init__(self, name: str = "yajaw-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._finalizers: list[Callable[[], Awaitable]] = []
+        self._thread = threading.Thread(target=self._run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_forever(self):
+        "Set the loop as the current one for the thread and run it until stopped."
+        asyncio.set_event_loop(self.loop)
+        _runner_local.runner = self
+        self.loop.run_forever()
+
+    def add_finalizer(self, finalizer: Callable[[], Awaitable]):
+        "Register a coroutine function awaited on the loop when the runner is closed."
+        self._finalizers.append(finalizer)
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        "Schedule the coroutine on the loop and return a future for its result."
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro):
+        "Run the coroutine on the loop and block until its result is available."
+        return self.submit(coro).result()
+
+    def owns_running_loop(self) -> bool:
+        "Check if the caller is already running on the loop managed by the runner."
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def close(self):
+        "Finalize async generators, stop the loop, join the thread and close the loop."
+        if self.loop.is_closed():
+            return
+        while self._finalizers:
+            self.run(self._finalizers.pop()())
+        self.run(self.loop.shutdown_asyncgens())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+_active_runner: ContextVar[LoopRunner | None] = ContextVar("yajaw_active_runner", default=None)
+
+
+def bind_runner(runner: LoopRunner) -> Token:
+    "Make the runner execute the async_to_sync calls issued in the current context."
+    return _active_runner.set(runner)
+
+
+def unbind_runner(token: Token) -> None:
+    "Restore the runner active before the matching bind_runner call."
+    _active_runner.reset(token)
+
+
+_active_batch: ContextVar = ContextVar("yajaw_active_batch", default=None)
+
+
+def bind_batch(batch) -> Token:
+    "Make the batch defer the async_to_sync calls issued in the current context."
+    return _active_batch.set(batch)
+
+
+def unbind_batch(token: Token) -> None:
+    "Restore the batch active before the matching bind_batch call."
+    _active_batch.reset(token)
+
+
+def current_runner() -> LoopRunner | None:
+    "Return the runner whose loop is running in the caller, if any."
+    runner = getattr(_runner_local, "runner", None)
+    return runner if runner is not None and runner.owns_running_loop() else None
+
+
+_background_runner: LoopRunner | None = None
+_background_lock = threading.Lock()
+
+
+def background_runner() -> LoopRunner:
+    """
+    Return the process-wide runner used by the persistent runner mode.
+
+    The runner is started on first use and lives until close_background_runner is
+    called or the interpreter exits. Every sync call made in persistent mode runs on
+    its loop, so the loop-bound resources, such as the pooled client, are reused.
+    """
+    global _background_runner
+    with _background_lock:
+        if _background_runner is None or _background_runner.loop.is_closed():
+            _background_runner = LoopRunner(name="yajaw-background")
+        return _background_runner
+
+
+def close_background_runner() -> None:
+    "Close the process-wide runner and the resources bound to its loop, if started."
+    global _background_runner
+    with _background_lock:
+        runner, _background_runner = _background_runner, None
+    if runner is not None:
+        runner.close()
+
+
+atexit.register(close_background_runner)
+
+
+def submit(coro) -> concurrent.futures.Future:
+    """
+    Schedule the coroutine without blocking and return a future for its result.
+
+    The coroutine runs on the runner of the active sync yajaw.Session, or on the
+    process-wide background runner otherwise.
+    """
+    runner = _active_runner.get()
+    if runner is None or runner.owns_running_loop():
+        runner = background_runner()
+    return runner.submit(coro)
 
 
 def async_to_sync(func):
@@ -15,6 +150,10 @@ def async_to_sync(func):
     Decorated target functions with this one will determine the right
     approach to execute the computation of asynchronous code, such as
     running in thread safe mode, or managing the event loop to be used.
+    When the concurrency runner setting is persistent, every call runs on
+    the process-wide background loop instead of a new one. The decorated
+    function also gets a submit attribute that schedules the call on that
+    loop without blocking and returns a concurrent.futures.Future.
     """
 
     async def main_wrap(args, kwargs, call_result):
@@ -42,6 +181,20 @@ def async_to_sync(func):
         call_result = concurrent.futures.Future()
         threadlocal = False
 
+        batch = _active_batch.get()
+        if batch is not None and not batch.owns_running_loop():
+            # A yajaw.batch block sends the call later, together with the other ones
+            return batch.defer(func, args, kwargs)
+
+        runner = _active_runner.get()
+        if runner is None and YajawConfig.RUNNER_MODE == "persistent":
+            runner = background_runner()
+        if runner is not None and not runner.owns_running_loop():
+            # A sync yajaw.Session, or the background runner, keeps its pooled client
+            # on the runner loop
+            runner.run(main_wrap(args, kwargs, call_result))
+            return call_result.result()
+
         try:
             main_event_loop = asyncio.get_running_loop()
 
@@ -77,4 +230,45 @@ def async_to_sync(func):
 
         return call_result.result()
 
+    def submit_call(*args, **kwargs) -> concurrent.futures.Future:
+        "Schedule the asynchronous computation without blocking."
+        return submit(func(*args, **kwargs))
+
+    wrapper.submit = submit_call
     return wrapper
+
+
+def sync_iter(async_iterator: AsyncIterator) -> Iterator:
+    """
+    sync_iter Function used to consume an async iterator synchronously.
+
+    Items are pulled one at a time from an event loop running in a background thread,
+    which is the one of the active sync yajaw.Session if any, or the process-wide
+    background loop when the concurrency runner setting is persistent, so the async
+    iterator keeps its pace and bounded memory when consumed from synchronous code.
+    """
+
+    async def next_item():
+        "Await the next item of the async iterator."
+        return await anext(async_iterator)
+
+    runner = _active_runner.get()
+    if runner is None and YajawConfig.RUNNER_MODE == "persistent":
+        runner = background_runner()
+    own_runner = runner is None or runner.owns_running_loop()
+    if own_runner:
+        runner = LoopRunner()
+    try:
+        while True:
+            try:
+                item = runner.run(next_item())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        try:
+            if hasattr(async_iterator, "aclose"):
+                runner.run(async_iterator.aclose())
+        finally:
+            if own_runner:
+                runner.close()
@@ -1,8 +1,9 @@
 """
 Module responsible for utilitarian decorators used to log the duration
-of a given function execution.
+of a given function execution, and for the progress counters of exports.
 """
 import asyncio
+import time
 from contextlib import contextmanager
 from functools import wraps
 from time import perf_counter
@@ -44,3 +45,41 @@ def duration(func):
             return _async_wrapping()
 
     return _wrapper
+
+
+class ExportStats:
+    """
+    Class representing the progress of an export.
+
+    The counters are updated while the export runs, so they may be read from another
+    thread to report progress.
+
+    Attributes:
+        issues: Number of issues written.
+        bytes: Number of bytes written before compression.
+        started: Monotonic time at which the export started.
+        finished: Monotonic time at which the export finished, if it did.
+    """
+
+    def __init__(self):
+        """Initializes an ExportStats object with zeroed counters."""
+        self.issues = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self.finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds elapsed since the export started, until it finished."""
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def issues_per_second(self) -> float:
+        """Average number of issues written per second."""
+        return self.issues / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExportStats(issues={self.issues}, bytes={self.bytes},"
+            f" elapsed={self.elapsed:.1f}s)"
+        )
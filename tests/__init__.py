@@ -3,4 +3,4 @@
 # SPDX-License-Identifier: MIT
 """File __init__.py responsible for enabling the import of yajaw.core package."""
 
-__all__ = ["test_jira"]
+__all__ = ["test_jira", "test_mirror", "test_records", "test_export", "test_cli"]
@@ -3,4 +3,16 @@
 # SPDX-License-Identifier: MIT
 """File __init__.py responsible for enabling the import of yajaw.core package."""
 
-__all__ = ["test_rest", "test_exceptions"]
+__all__ = [
+    "test_rest",
+    "test_exceptions",
+    "test_session",
+    "test_cache",
+    "test_limiter",
+    "test_retry",
+    "test_breaker",
+    "test_batch",
+    "test_codec",
+    "test_pagination",
+    "test_metrics",
+]
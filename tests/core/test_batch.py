@@ -0,0 +1,67 @@
+"""Module responsible for testing yajaw.core.batch module."""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import yajaw
+from tests.test_jira import mock_search_page
+from yajaw import export, jira
+from yajaw.core.batch import BatchCall
+
+
+def mock_project_by_key(self, method, url, **kwargs) -> httpx.Response:
+    """Auxiliary function to answer project requests according to their key."""
+    key = str(url).rsplit("/", 1)[-1]
+    return httpx.Response(
+        status_code=404 if key == "BAD" else 200,
+        request=httpx.Request(method, "https://example.org"),
+        json={"key": key},
+    )
+
+
+def test_batch_defers_sync_calls_until_a_result_is_needed():
+    """Test sync calls in a batch are sent together over a single client."""
+    with patch("httpx.AsyncClient.request", autospec=True) as mock_request:
+        mock_request.side_effect = mock_project_by_key
+        with yajaw.batch():
+            first = jira.fetch_project("ABC")
+            second = jira.fetch_projects_from_list(["XYZ", "BAD"], return_exceptions=True)
+            assert not first.done()
+            assert mock_request.call_count == 0
+            assert first.result() == {"key": "ABC"}
+            assert second.done()
+            missing = jira.fetch_project("BAD")
+        clients = {call.args[0] for call in mock_request.call_args_list}
+    assert len(clients) == 1
+    assert second.result().results == {"XYZ": {"key": "XYZ"}}
+    assert missing.result() == {}
+
+
+def test_batch_fails_pending_calls_on_error():
+    """Test calls still pending when the block raises are never sent."""
+    with patch("httpx.AsyncClient.request", autospec=True) as mock_request:
+        with pytest.raises(ValueError):
+            with yajaw.batch():
+                pending = jira.fetch_project("ABC")
+                raise ValueError
+    assert mock_request.call_count == 0
+    with pytest.raises(RuntimeError):
+        pending.result()
+
+
+def test_batch_defers_composite_export_calls():
+    """Test to_dataframe() is deferred as one call instead of failing on a BatchCall."""
+    pytest.importorskip("pyarrow")
+
+    with patch("httpx.AsyncClient.request", side_effect=mock_search_page):
+        with yajaw.batch():
+            frame = export.to_dataframe("project = ABC", columns={"key": "key"})
+            assert isinstance(frame, BatchCall) and not frame.done()
+    try:
+        import pandas  # noqa: F401 pylint: disable=unused-import,import-outside-toplevel
+    except ImportError:
+        with pytest.raises(ImportError):
+            frame.result()
+    else:
+        assert frame.result()["key"].tolist() == [f"ISSUE-{i}" for i in range(5)]
@@ -0,0 +1,85 @@
+"""Module responsible for testing yajaw.core.breaker module."""
+import time
+
+import httpx
+import pytest
+
+from yajaw.core.breaker import CircuitBreakerRegistry, CircuitState
+from yajaw.exceptions import CircuitOpenError
+
+
+def test_circuit_breaker_transitions():
+    """Test the breaker opens on failures, fails fast and recovers through a probe."""
+    registry = CircuitBreakerRegistry(failure_threshold=2, recovery_time=0.05)
+    transitions = []
+    registry.add_listener(lambda key, old, new: transitions.append((key, old, new)))
+    breaker = registry.get("https://jira.example.org/rest/api/2/search")
+    assert registry.get("https://jira.example.org/rest/agile/1.0/board") is breaker
+
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record(httpx.Response(status_code=503))
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(0.05)
+    breaker.before_request()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(httpx.Response(status_code=200))
+
+    assert registry.states() == {"https://jira.example.org": CircuitState.CLOSED}
+    assert [new for _, _, new in transitions] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_circuit_breaker_limits_half_open_probes():
+    """Test only half_open_probes requests go through and a failed probe reopens it."""
+    breaker = CircuitBreakerRegistry(
+        failure_threshold=1, recovery_time=0.05, half_open_probes=2
+    ).get("https://jira.example.org")
+    breaker.before_request()
+    breaker.record(httpx.ConnectError("refused"))
+    assert breaker.state is CircuitState.OPEN
+
+    time.sleep(0.05)
+    breaker.before_request()
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(None)
+    breaker.before_request()
+    breaker.record(httpx.Response(status_code=503))
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_circuit_breaker_half_open_probe_answered_with_4xx():
+    """Test a 429 probe reopens the circuit while other 4xx probes leave it half-open."""
+    breaker = CircuitBreakerRegistry(failure_threshold=1, recovery_time=0.05).get(
+        "https://jira.example.org"
+    )
+    breaker.before_request()
+    breaker.record(httpx.Response(status_code=503))
+
+    time.sleep(0.05)
+    breaker.before_request()
+    breaker.record(httpx.Response(status_code=401))
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.before_request()
+    breaker.record(httpx.Response(status_code=429))
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(0.05)
+    breaker.before_request()
+    breaker.record(httpx.Response(status_code=200))
+    assert breaker.state is CircuitState.CLOSED
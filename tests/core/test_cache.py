@@ -0,0 +1,136 @@
+"""Module responsible for testing yajaw.core.cache module."""
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from yajaw.configuration import YajawConfig
+from yajaw.core import rest
+from yajaw.core.cache import HttpCache, MemoryCache, TotalEstimates
+
+
+def conditional_handler(request: httpx.Request) -> httpx.Response:
+    """Auxiliary transport handler answering 304 when the ETag matches."""
+    if request.headers.get("If-None-Match") == '"v1"':
+        return httpx.Response(status_code=304, headers={"ETag": '"v1"'})
+    return httpx.Response(status_code=200, headers={"ETag": '"v1"'}, json={"key": "ABC"})
+
+
+@pytest.mark.asyncio
+async def test_http_cache_serves_not_modified_responses(tmp_path, monkeypatch):
+    """Test a 304 answer is served from the cache and counted as a hit."""
+    cache = HttpCache(tmp_path, max_bytes=1024)
+    monkeypatch.setattr(YajawConfig, "HTTP_CACHE", cache)
+    jira = rest.JiraInfo(method="GET", resource="project/ABC", api=YajawConfig.SERVER_API)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(conditional_handler)) as client:
+        first = await rest._send_request(jira=jira, client=client)
+        second = await rest._send_request(jira=jira, client=client)
+
+    assert first.json() == second.json() == {"key": "ABC"}
+    assert second.status_code == 200
+    assert cache.stats() | {"bytes": 0} == {
+        "hits": 1,
+        "misses": 1,
+        "revalidations": 1,
+        "entries": 1,
+        "bytes": 0,
+    }
+    assert HttpCache(tmp_path).stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_coalesces_identical_requests():
+    """Test concurrent identical requests share one in flight and are cached."""
+    cache = MemoryCache(max_entries=2, ttl=60.0, endpoint_ttls={"issue": 0})
+    calls = []
+
+    async def loader() -> httpx.Response:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json={"key": "ABC"})
+
+    key = cache.key("GET", "https://example.org/rest/api/2/project/ABC", {})
+    responses = await asyncio.gather(*[cache.fetch(key, "project/ABC", loader) for _ in range(50)])
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+    await cache.fetch(key, "project/ABC", loader)
+    assert cache.stats() == {"hits": 1, "misses": 1, "coalesced": 49, "entries": 1}
+
+    cache.invalidate("project")
+    await cache.fetch(key, "project/ABC", loader)
+    assert len(calls) == 2
+
+    issue_key = cache.key("GET", "https://example.org/rest/api/2/issue/ABC-1", {})
+    await cache.fetch(issue_key, "issue/ABC-1", loader)
+    assert cache.get(issue_key) is None
+
+
+@pytest.mark.asyncio
+async def test_total_estimates_start_every_page_at_once(tmp_path):
+    """Test a repeated search requests the estimated pages before the first one returns."""
+    requested = []
+
+    async def search_page(method, url, **kwargs) -> httpx.Response:
+        start_at = kwargs["json"]["startAt"]
+        requested.append(("start", start_at))
+        if start_at == 0:
+            await asyncio.sleep(0.01)
+            requested.append(("end", start_at))
+        issues = [
+            {"id": str(i), "key": f"ISSUE-{i}"} for i in range(start_at, min(start_at + 2, 5))
+        ]
+        page = {"startAt": start_at, "maxResults": 2, "total": 5, "issues": issues}
+        return httpx.Response(status_code=200, request=httpx.Request(method, url), json=page)
+
+    path = tmp_path / "totals.json"
+    YajawConfig.update_configuration("cache", "total_estimates", TotalEstimates(path=path))
+    jira = rest.JiraInfo("POST", "search", YajawConfig.SERVER_API, {}, {"jql": "project = ABC"})
+    try:
+        with patch("httpx.AsyncClient.request", side_effect=search_page):
+            await rest.send_paginated_requests(jira=jira, decode=True)
+            assert requested == [("start", 0), ("end", 0), ("start", 2), ("start", 4)]
+            requested.clear()
+            YajawConfig.update_configuration("cache", "total_estimates", TotalEstimates(path=path))
+            jira.payload["jql"] = "project  =  ABC"
+            pages = await rest.send_paginated_requests(jira=jira, decode=True)
+    finally:
+        YajawConfig.update_configuration("cache", "total_estimates", None)
+    assert requested[-1] == ("end", 0)
+    assert [issue["key"] for page in pages for issue in page["issues"]] == [
+        f"ISSUE-{i}" for i in range(5)
+    ]
+
+
+def test_memory_cache_expires_entries_under_lru_pressure():
+    """Test fresh entries are evicted by recency and recent entries still expire."""
+    cache = MemoryCache(max_entries=2, ttl=60.0, endpoint_ttls={"issue": 0.05})
+    response = httpx.Response(status_code=200, json={"key": "ABC"})
+    issue, project, other = (
+        cache.key("GET", f"https://example.org/rest/api/2/{resource}", {})
+        for resource in ("issue/ABC-1", "project/ABC", "project/XYZ")
+    )
+    cache.put(issue, "issue/ABC-1", response)
+    cache.put(project, "project/ABC", response)
+    assert cache.get(issue) is response
+    cache.put(other, "project/XYZ", response)
+    assert cache.get(project) is None
+    assert cache.get(issue) is response
+
+    time.sleep(0.06)
+    assert cache.get(issue) is None
+    assert cache.get(other) is response
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.parametrize("content", [b"[1, 2]", b'{"a": [1, 2, 3]}', b'{"a": 1}', b"{"])
+def test_total_estimates_start_empty_from_a_corrupt_file(tmp_path, content):
+    """Test a corrupt estimate file is ignored, and replaced on the next estimate."""
+    path = tmp_path / "totals.json"
+    path.write_bytes(content)
+    estimates = TotalEstimates(path=path)
+    assert estimates.stats()["entries"] == 0
+    estimates.put("key", 5, 2)
+    assert TotalEstimates(path=path).get("key") == (5, 2)
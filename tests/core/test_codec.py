@@ -0,0 +1,43 @@
+"""Module responsible for testing yajaw.core.codec module."""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tests.test_jira import mock_search_page
+from yajaw import YajawConfig, jira
+from yajaw.core import rest
+from yajaw.core.codec import get_decoder
+
+
+def test_get_decoder_by_name():
+    """Test decoders are picked by name and unknown names are rejected."""
+    assert get_decoder("json") is json.loads
+    assert get_decoder(len) is len
+    assert get_decoder("auto")(b'{"key": "ABC"}') == {"key": "ABC"}
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+@patch("httpx.AsyncClient.request")
+def test_paginated_search_decodes_each_page_once(mock_rest_request):
+    """Test paginated requests decode every page body exactly once, decoded or not."""
+    mock_rest_request.side_effect = mock_search_page
+    calls = []
+
+    def counting_decoder(content: bytes):
+        calls.append(content)
+        return json.loads(content)
+
+    YajawConfig.update_configuration("requests", "json_decoder", counting_decoder)
+    try:
+        issues = jira.search_issues("project = ABC")
+        assert len(calls) == 3
+        search = rest.JiraInfo("POST", "search", YajawConfig.SERVER_API, {}, {"jql": "x"})
+        responses = asyncio.run(rest.send_paginated_requests(jira=search))
+        pages = [rest.decode_json(response) for response in responses]
+    finally:
+        YajawConfig.update_configuration("requests", "json_decoder", "auto")
+    assert len(issues) == sum(len(page["issues"]) for page in pages) == 5
+    assert len(calls) == 6
@@ -0,0 +1,97 @@
+"""Module responsible for testing yajaw.core.limiter module."""
+import asyncio
+import time
+
+import pytest
+
+from yajaw.configuration import YajawConfig
+from yajaw.core.limiter import AdaptiveLimiter, RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_follows_responses():
+    """Test the limit grows on success, shrinks on overload and stays within bounds."""
+    limiter = AdaptiveLimiter(floor=2, ceiling=4, initial=2)
+    for _ in range(20):
+        limiter.observe(0.1, status_code=200)
+    assert limiter.limit == 4
+
+    limiter.observe(0.1, status_code=429)
+    assert limiter.limit == 2
+    limiter.observe(0.1, timeout=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_bounds_requests_in_flight():
+    """Test no more requests than the limit are in flight at the same time."""
+    limiter = AdaptiveLimiter(floor=2, ceiling=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[request() for _ in range(10)])
+    assert peak == 2
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_per_endpoint_class():
+    """Test requests beyond the burst wait for tokens of their class and the total."""
+    limiter = RateLimiter({"search": 20.0, "issue": 0, "total": 100.0}, {"search": 2})
+    assert set(limiter.buckets) == {"search", "total"}
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire("search") for _ in range(4)])
+    assert time.monotonic() - start >= 0.09
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire("issue") for _ in range(50)])
+    assert time.monotonic() - start < 0.05
+
+
+def test_rate_limiter_follows_runtime_settings():
+    """Test the rate limiter is built, tuned and removed when its settings are updated."""
+    rates = YajawConfig.configuration("rate_limit", "rates")
+    budget = YajawConfig.RETRY_POLICY.budget
+    assert YajawConfig.RATE_LIMITER is None
+    YajawConfig.update_configuration("rate_limit", "enabled", True)
+    try:
+        assert isinstance(YajawConfig.RATE_LIMITER, RateLimiter)
+        YajawConfig.update_configuration("rate_limit", "rates", {"search": 4.0})
+        assert set(YajawConfig.RATE_LIMITER.buckets) == {"search"}
+        assert YajawConfig.RATE_LIMITER.buckets["search"].rate == 4.0
+        assert YajawConfig.RETRY_POLICY.budget is budget
+    finally:
+        YajawConfig.update_configuration("rate_limit", "enabled", False)
+        YajawConfig.update_configuration("rate_limit", "rates", rates)
+    assert YajawConfig.RATE_LIMITER is None
+
+
+def test_token_bucket_refills_up_to_its_burst():
+    """Test an idle bucket refills at its rate but never beyond its burst."""
+    bucket = TokenBucket(rate=20.0, burst=2)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.05, abs=0.01)
+
+    time.sleep(0.3)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refunds_tokens_of_cancelled_waiters():
+    """Test requests cancelled while waiting give their tokens back."""
+    limiter = RateLimiter({"search": 10.0, "total": 10.0}, bursts={"search": 1, "total": 1})
+    await limiter.acquire("search")
+    waiters = [asyncio.create_task(limiter.acquire("search")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    for bucket in limiter.buckets.values():
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
@@ -0,0 +1,61 @@
+"""Module responsible for testing yajaw.core.metrics module."""
+from unittest.mock import patch
+
+import httpx
+
+from yajaw import YajawConfig, jira
+from yajaw.core.metrics import CallbackSink, Metrics, PrometheusSink
+
+
+@patch("asyncio.sleep")
+@patch("httpx.AsyncClient.request")
+def test_metrics_report_every_attempt(mock_rest_request, mock_sleep):
+    """Test each attempt is reported per endpoint template, including the retries."""
+    status_codes = iter([503, 200])
+
+    def answer(method, url, **kwargs) -> httpx.Response:
+        request = httpx.Request(method, url)
+        return httpx.Response(status_code=next(status_codes), request=request, json={"key": "A"})
+
+    mock_rest_request.side_effect = answer
+    sink = PrometheusSink(buckets=[1.0])
+    attempts = []
+    metrics = Metrics(sink, CallbackSink(lambda metric: attempts.append(metric.attempt)))
+    YajawConfig.update_configuration("metrics", "registry", metrics)
+    try:
+        assert jira.fetch_issue("ABC-1") == {"key": "A"}
+    finally:
+        YajawConfig.update_configuration("metrics", "registry", None)
+
+    assert attempts == [1, 2]
+    aggregates = sink.snapshot()["GET issue/{id}"]
+    assert aggregates["statuses"] == {"503": 1, "200": 1}
+    assert aggregates["retries"] == 1
+    assert aggregates["in_flight"] == 0
+    assert aggregates["response_bytes"] > 0
+    exposition = sink.exposition()
+    assert 'yajaw_requests_total{method="GET",endpoint="issue/{id}",status="503"} 1' in exposition
+    assert (
+        'yajaw_request_duration_seconds_bucket{method="GET",endpoint="issue/{id}",le="+Inf"} 2'
+        in exposition
+    )
+
+
+@patch("httpx.AsyncClient.request")
+def test_metrics_template_project_keys(mock_rest_request):
+    """Test project keys are reported under one endpoint template, whatever their case."""
+    request = httpx.Request("GET", "https://example.org")
+    mock_rest_request.return_value = httpx.Response(
+        status_code=200, request=request, json={"key": "VALID"}
+    )
+    sink = PrometheusSink(buckets=[1.0])
+    YajawConfig.update_configuration("metrics", "registry", Metrics(sink))
+    try:
+        for key in ("ABC", "XYZ", "abc"):
+            jira.fetch_project(key)
+    finally:
+        YajawConfig.update_configuration("metrics", "registry", None)
+
+    assert list(sink.snapshot()) == ["GET project/{key}"]
+    assert sink.snapshot()["GET project/{key}"]["statuses"] == {"200": 3}
+    assert 'endpoint="project/{key}"' in sink.exposition()
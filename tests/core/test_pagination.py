@@ -0,0 +1,130 @@
+"""Module responsible for testing yajaw.core.pagination module."""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tests.test_jira import mock_search_page
+from yajaw import YajawConfig, jira
+from yajaw.core.pagination import (
+    PageSizer,
+    ProbeWindow,
+    detect_strategy,
+    get_strategy,
+    probe_window,
+)
+
+
+def test_detect_strategy_from_page_attributes():
+    """Test each page shape is paginated by the strategy allowing the widest fan-out."""
+    with_total = {"startAt": 0, "maxResults": 2, "total": 5, "isLast": False, "values": [1, 2]}
+    assert detect_strategy(with_total).name == "total"
+    assert detect_strategy(with_total).remaining_pages(with_total) == [
+        {"startAt": 2, "maxResults": 2},
+        {"startAt": 4, "maxResults": 2},
+    ]
+
+    without_total = {"startAt": 0, "maxResults": 50, "isLast": False, "values": [1, 2]}
+    strategy = detect_strategy(without_total)
+    assert strategy.name == "is_last"
+    assert strategy.remaining_pages(without_total) is None
+    assert strategy.next_page(without_total) == {"startAt": 2, "maxResults": 50}
+
+    linked = {"values": [1], "nextPage": "https://example.org/project/search?startAt=1"}
+    assert detect_strategy(linked).next_page(linked) == {"startAt": "1"}
+    assert detect_strategy({"views": []}).remaining_pages({"views": []}) == []
+    with pytest.raises(ValueError):
+        get_strategy("cursor", without_total)
+
+
+def mock_sprint_page(method, url, **kwargs) -> httpx.Response:
+    """Auxiliary function to generate pages of 5 sprints reporting isLast but no total."""
+    start_at = kwargs["params"]["startAt"]
+    sprints = [{"id": i} for i in range(start_at, min(start_at + 2, 5))]
+    page = {"startAt": start_at, "maxResults": 2, "isLast": start_at + 2 >= 5, "values": sprints}
+    return httpx.Response(status_code=200, request=httpx.Request(method, url), json=page)
+
+
+@patch("httpx.AsyncClient.request")
+def test_fetch_sprints_pages_until_is_last(mock_rest_request):
+    """Test fetch_sprints() walks the pages of a resource without a total."""
+    mock_rest_request.side_effect = mock_sprint_page
+    sprints = jira.fetch_sprints(board_id=7, state="closed")
+    assert [sprint["id"] for sprint in sprints] == [0, 1, 2, 3, 4]
+    assert mock_rest_request.call_count == 3
+    assert mock_rest_request.call_args.kwargs["params"]["state"] == "closed"
+    assert "agile" in str(mock_rest_request.call_args.kwargs["url"])
+
+
+@patch("httpx.AsyncClient.request")
+def test_speculative_pagination_probes_future_offsets(mock_rest_request):
+    """Test speculative pagination requests offsets ahead and drops the overshoot."""
+    mock_rest_request.side_effect = mock_sprint_page
+    YajawConfig.update_configuration("pagination", "speculative", True)
+    try:
+        sprints = jira.fetch_sprints(board_id=8)
+    finally:
+        YajawConfig.update_configuration("pagination", "speculative", False)
+    assert [sprint["id"] for sprint in sprints] == [0, 1, 2, 3, 4]
+    offsets = sorted(call.kwargs["params"]["startAt"] for call in mock_rest_request.call_args_list)
+    assert offsets[:3] == [0, 2, 4]
+    assert probe_window("board/8/sprint", 4, 32).hit_rate < 1.0
+
+
+def test_probe_window_follows_hit_rate():
+    """Test the probe window shrinks after overshooting walks and doubles up to its maximum."""
+    window = ProbeWindow(initial=8, maximum=16)
+    assert window.start() == 8
+    assert window.grow(8) == 16
+    assert window.grow(16) == 16
+    for _ in range(5):
+        window.record(hits=1, misses=7)
+    assert window.start() < 4
+
+
+def test_page_sizer_learns_cap_and_costs():
+    """Test the page size follows the server cap and the latency and body size targets."""
+    sizer = PageSizer(maximum=1000, target_seconds=2.0, target_bytes=1024**2)
+    assert sizer.page_size() == 1000
+    page = {"maxResults": 500, "issues": [{}] * 500}
+    sizer.observe(requested=1000, page=page, seconds=0.5, size_bytes=500 * 1024)
+    assert sizer.cap == 500
+    assert sizer.page_size() == 500
+    sizer.observe(requested=500, page=page, seconds=25.0, size_bytes=500 * 1024)
+    assert 10 <= sizer.page_size() < 500
+
+
+def test_page_sizer_is_not_shrunk_by_short_pages():
+    """Test short pages only measure the fixed latency of a request."""
+    sizer = PageSizer(maximum=1000, target_seconds=2.0, target_bytes=1024**2)
+    page = {"maxResults": 500, "issues": [{}] * 500}
+    sizer.observe(requested=1000, page=page, seconds=1.0, size_bytes=500 * 1024)
+    assert sizer.page_size() == 500
+    for _ in range(20):
+        short = {"maxResults": 500, "issues": [{}] * 2}
+        sizer.observe(requested=500, page=short, seconds=0.6, size_bytes=2 * 1024)
+    assert sizer.page_size() == 500
+    assert 0.5 < sizer.baseline_seconds < 0.7
+
+    sizer = PageSizer(maximum=1000, target_seconds=2.0, target_bytes=1024**2)
+    sizer.observe(
+        requested=1000, page={"maxResults": 1000, "issues": [{}] * 3}, seconds=0.5, size_bytes=3072
+    )
+    assert sizer.page_size() == 1000
+
+
+@patch("httpx.AsyncClient.request")
+def test_adaptive_pagination_requests_the_learned_size(mock_rest_request):
+    """Test adaptive pagination probes the maximum first, then requests the server cap."""
+    mock_rest_request.side_effect = mock_search_page
+    YajawConfig.update_configuration("pagination", "adaptive", True)
+    try:
+        jira.search_issues("project = ABC", fields=["summary"])
+        first_request = mock_rest_request.call_args_list[0].kwargs["json"]
+        mock_rest_request.reset_mock()
+        issues = jira.search_issues("project = XYZ", fields=["summary"])
+    finally:
+        YajawConfig.update_configuration("pagination", "adaptive", False)
+    assert first_request["maxResults"] == YajawConfig.MAX_PAGE_RESULTS
+    assert mock_rest_request.call_args_list[0].kwargs["json"]["maxResults"] == 2
+    assert len(issues) == 5
@@ -0,0 +1,45 @@
+"""Module responsible for testing yajaw.core.retry module."""
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from yajaw.configuration import YajawConfig
+from yajaw.core.rest import _retry_request
+from yajaw.core.retry import RetryBudget, RetryPolicy
+from yajaw.exceptions import InvalidResponseError
+
+
+def test_retry_policy_delays():
+    """Test server requested delays take precedence over the jittered ones."""
+    policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=10.0)
+    throttled = httpx.Response(status_code=429, headers={"Retry-After": "5"})
+    assert 5.0 <= policy.next_delay(1, 0.0, throttled) <= 6.0
+    failed = httpx.Response(status_code=503)
+    assert all(0 <= policy.next_delay(3, 0.0, failed) <= 4.0 for _ in range(50))
+    assert all(0 <= policy.next_delay(9, 0.0, failed) <= 10.0 for _ in range(50))
+
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter="decorrelated")
+    assert all(1.0 <= policy.next_delay(2, 2.0, failed) <= 6.0 for _ in range(50))
+
+
+def test_retry_policy_limits():
+    """Test per-status attempts and the retry budget stop the retries."""
+    budget = RetryBudget(capacity=2, rate=0.0)
+    policy = RetryPolicy(tries=5, status_tries={400: 1}, budget=budget)
+    assert not policy.allows_retry(1, httpx.Response(status_code=400))
+    assert policy.allows_retry(1, httpx.Response(status_code=500))
+    assert policy.allows_retry(2, httpx.ConnectError("refused"))
+    assert not policy.allows_retry(3, httpx.Response(status_code=500))
+    assert not policy.allows_retry(5, httpx.Response(status_code=500))
+
+
+@pytest.mark.asyncio
+async def test_retry_request_retries_transport_errors(monkeypatch):
+    """Test transport errors are retried and surfaced as InvalidResponseError."""
+    monkeypatch.setattr(YajawConfig, "RETRY_POLICY", RetryPolicy(tries=3, base_delay=0.0))
+    with patch(
+        "yajaw.core.rest._send_request", side_effect=httpx.ReadTimeout("timeout")
+    ) as mock_send_request, pytest.raises(InvalidResponseError):
+        await _retry_request(MagicMock(), MagicMock(spec=httpx.AsyncClient))
+    assert mock_send_request.call_count == 3
@@ -0,0 +1,39 @@
+"""Module responsible for testing yajaw.core.session module."""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from yajaw import Session, jira
+from yajaw.core import rest
+
+
+def mock_valid_project() -> httpx.Response:
+    """Auxiliary function to generate a valid project as httpx.Response."""
+    return httpx.Response(
+        status_code=200, request=httpx.Request("GET", "https://example.org"), json={"key": "VALID"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_session_binds_its_client():
+    """Test the client owned by an async session is picked up implicitly."""
+    async with Session(keepalive_expiry=30.0) as session:
+        async with rest.client_scope() as client:
+            assert client is session.client
+        assert session.limits.keepalive_expiry == 30.0
+    assert not session.is_open
+    with pytest.raises(RuntimeError):
+        _ = session.client
+
+
+def test_sync_session_reuses_one_client():
+    """Test sync calls inside a session share the same pooled client."""
+    with patch("httpx.AsyncClient.request", autospec=True) as mock_request:
+        mock_request.return_value = mock_valid_project()
+        with Session() as session:
+            assert jira.fetch_project("VALID")["key"] == "VALID"
+            assert jira.fetch_projects_from_list(["VALID", "VALID"]) == [{"key": "VALID"}] * 2
+        clients = {call.args[0] for call in mock_request.call_args_list}
+    assert len(clients) == 1
+    assert not session.is_open
@@ -0,0 +1,84 @@
+"""Module responsible for testing yajaw.cli module."""
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+from tests.test_jira import mock_search_page
+from yajaw import YajawConfig, cli
+from yajaw import exceptions as e
+
+
+@patch("httpx.AsyncClient.request")
+def test_search_command_writes_issues_and_summary(mock_rest_request, tmp_path, capsys):
+    """Test the search command applies the flags and writes one issue per line."""
+    mock_rest_request.side_effect = mock_search_page
+    output = tmp_path / "issues.jsonl"
+    try:
+        status = cli.main(
+            ["--page-size", "2", "search", "project = ABC", "--fields", "key", "-o", str(output)]
+        )
+    finally:
+        YajawConfig.update_configuration("pagination", "page_results", 40)
+    assert status == 0
+    keys = [json.loads(line)["key"] for line in output.read_text().splitlines()]
+    assert keys == [f"ISSUE-{i}" for i in range(5)]
+    assert mock_rest_request.call_args_list[0].kwargs["json"]["maxResults"] == 2
+    assert mock_rest_request.call_args_list[0].kwargs["json"]["fields"] == ["key"]
+    assert capsys.readouterr().err.startswith("\r5 items")
+
+
+def test_command_reports_errors_on_stderr(capsys):
+    """Test a failed request is reported on stderr with a non-zero status."""
+    error = e.ResourceUnauthorizedError("invalid token")
+    with patch("yajaw.jira.iter_search_issues", side_effect=error):
+        status = cli.main(["--quiet", "search", "project = ABC"])
+    assert status == 1
+    assert capsys.readouterr().err == "yajaw: ResourceUnauthorizedError: invalid token\n"
+
+
+def test_export_command_passes_parquet_options():
+    """Test the window and compression flags reach the Parquet export."""
+    window = YajawConfig.configuration("pagination", "page_window")
+    try:
+        with patch("yajaw.export.to_parquet", return_value=3) as to_parquet:
+            status = cli.main(
+                ["--quiet", "--window", "2", "export", "project = ABC", "a.parquet"]
+                + ["--format", "parquet", "--compression", "gzip"]
+            )
+    finally:
+        YajawConfig.update_configuration("pagination", "page_window", window)
+    assert status == 0
+    assert to_parquet.call_args.kwargs["compression"] == "gzip"
+    assert to_parquet.call_args.kwargs["window"] == 2
+
+
+def test_command_reports_os_and_import_errors_on_stderr(tmp_path, capsys):
+    """Test an unwritable output or a missing optional package exits with one line."""
+    output = tmp_path / "missing" / "issues.jsonl"
+    assert cli.main(["--quiet", "search", "project = ABC", "-o", str(output)]) == 1
+    assert capsys.readouterr().err.startswith("yajaw: FileNotFoundError: ")
+
+    error = ImportError("Columnar exports require pyarrow.")
+    with patch("yajaw.export._require_pyarrow", side_effect=error):
+        status = cli.main(
+            ["--quiet", "export", "project = ABC", "a.parquet", "--format", "parquet"]
+        )
+    assert status == 1
+    assert capsys.readouterr().err == "yajaw: ImportError: Columnar exports require pyarrow.\n"
+
+
+def test_commands_only_import_what_they_use():
+    """Test a command other than export does not import the export module."""
+    script = """
+import sys
+from unittest.mock import patch
+import httpx
+from yajaw import cli
+response = httpx.Response(200, request=httpx.Request("GET", "https://example.org"), json=[])
+with patch("httpx.AsyncClient.request", return_value=response):
+    assert cli.main(["--quiet", "projects"]) == 0
+print("yajaw.export" in sys.modules)
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True)
+    assert result.stdout.strip() == b"False"
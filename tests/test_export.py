@@ -0,0 +1,109 @@
+"""Module responsible for testing yajaw.export module."""
+import gzip
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tests.test_jira import mock_search_page
+from yajaw import export
+
+
+def test_columns_are_inferred_and_flattened():
+    """Test infer_columns() maps fields to columns reduced to flat values."""
+    issue = {
+        "key": "ABC-1",
+        "fields": {"status": {"name": "Open", "id": "1"}, "labels": ["a", "b"], "points": 3},
+    }
+    columns = export.infer_columns(issue=issue)
+    assert columns == {
+        "key": "key",
+        "status": "fields.status",
+        "labels": "fields.labels",
+        "points": "fields.points",
+    }
+    row = {name: export._extract(issue, column) for name, column in columns.items()}
+    assert row == {"key": "ABC-1", "status": "Open", "labels": ["a", "b"], "points": 3}
+    assert export._extract(issue, "fields.missing.name") is None
+
+
+@patch("httpx.AsyncClient.request")
+def test_to_parquet_writes_row_groups(mock_rest_request, tmp_path):
+    """Test to_parquet() writes every issue in row groups of the requested size."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    mock_rest_request.side_effect = mock_search_page
+    path = tmp_path / "issues.parquet"
+    rows = export.to_parquet("project = ABC", path, columns={"key": "key"}, row_group_size=2)
+    assert rows == 5
+    assert mock_rest_request.call_args.kwargs["json"]["fields"] == ["key"]
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("key").to_pylist() == [f"ISSUE-{i}" for i in range(5)]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@patch("httpx.AsyncClient.request")
+def test_to_parquet_promotes_types_across_batches(mock_rest_request, tmp_path):
+    """Test empty lists and nulls of the first batch take the types of later batches."""
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fields = [
+        {"labels": [], "sprint": None, "points": 1},
+        {"labels": [], "sprint": None, "points": None},
+        {"labels": ["a", "b"], "sprint": "Sprint 1", "points": 3},
+        {"labels": [], "sprint": None, "points": 5},
+    ]
+
+    def search_page(**kwargs):
+        start_at = kwargs["json"]["startAt"]
+        issues = [{"key": f"ISSUE-{i}", "fields": fields[i]} for i in range(start_at, start_at + 2)]
+        page = {"startAt": start_at, "maxResults": 2, "total": 4, "issues": issues}
+        return httpx.Response(
+            status_code=200, request=httpx.Request("POST", "https://example.org"), json=page
+        )
+
+    mock_rest_request.side_effect = search_page
+    path = tmp_path / "issues.parquet"
+    columns = {"key": "key", "labels": "fields.labels", "sprint": "fields.sprint"}
+    columns["points"] = "fields.points"
+    assert export.to_parquet("project = ABC", path, columns=columns, row_group_size=2) == 4
+    table = pq.read_table(path)
+    assert table.schema.field("labels").type == pa.list_(pa.string())
+    assert table.schema.field("sprint").type == pa.string()
+    assert table.column("labels").to_pylist() == [[], [], ["a", "b"], []]
+    assert table.column("sprint").to_pylist() == [None, None, "Sprint 1", None]
+
+    fields[2]["sprint"] = ["Sprint 1", "Sprint 2"]
+    with pytest.raises(ValueError, match="schema="):
+        export.to_parquet("project = ABC", path, columns=columns, row_group_size=2)
+
+
+@patch("httpx.AsyncClient.request")
+def test_jsonl_streams_compressed_issues(mock_rest_request, tmp_path):
+    """Test jsonl() writes one issue per line, compressed, and counts them."""
+    mock_rest_request.side_effect = mock_search_page
+    path = tmp_path / "issues.jsonl.gz"
+    umask = os.umask(0o027)
+    try:
+        stats = export.jsonl("project = ABC", path)
+    finally:
+        os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o640
+    with gzip.open(path, "rt") as lines:
+        keys = [json.loads(line)["key"] for line in lines]
+    assert keys == [f"ISSUE-{i}" for i in range(5)]
+    assert stats.issues == 5
+    assert stats.bytes == sum(
+        len(json.dumps({"key": key}, separators=(",", ":"))) + 1 for key in keys
+    )
+    assert list(tmp_path.iterdir()) == [path]
+    # The gzip header records the final name, not the temporary one
+    assert path.read_bytes()[10:].startswith(b"issues.jsonl\x00")
+    temporaries = {export._temporary_path(path) for _ in range(2)}
+    assert len(temporaries) == 2
@@ -1,4 +1,5 @@
 """Module responsonsible for testing yajaw.jira module."""
+import asyncio
 from unittest.mock import patch
 
 import httpx
@@ -72,3 +73,168 @@ def test_fetch_single_issue_with_server_not_found(mock_rest_request, mock_sleep)
     mock_sleep.return_value = None
     with pytest.raises(e.YajawError):
         jira.fetch_project("INVALID-KEY")
+
+
+def mock_search_page(**kwargs) -> httpx.Response:
+    """Auxiliary function to generate a page of a search with 5 issues split by 2."""
+    start_at = kwargs["json"]["startAt"]
+    issues = [{"key": f"ISSUE-{i}"} for i in range(start_at, min(start_at + 2, 5))]
+    return httpx.Response(
+        status_code=200,
+        request=httpx.Request("POST", "https://example.org"),
+        json={"startAt": start_at, "maxResults": 2, "total": 5, "issues": issues},
+    )
+
+
+@patch("httpx.AsyncClient.request")
+def test_iter_search_issues_yields_every_page(mock_rest_request):
+    """Test iter_search_issues() streams all pages in order and as completed."""
+    mock_rest_request.side_effect = mock_search_page
+    expected = [f"ISSUE-{i}" for i in range(5)]
+    ordered = [issue["key"] for issue in jira.iter_search_issues("project = ABC", window=1)]
+    assert ordered == expected
+    unordered = jira.iter_search_issues("project = ABC", window=2, ordered=False)
+    assert sorted(issue["key"] for issue in unordered) == expected
+
+
+@patch("httpx.AsyncClient.request")
+def test_search_issues_keeps_projection_on_every_page(mock_rest_request):
+    """Test search_issues() sends the field profile and properties on every page."""
+    mock_rest_request.side_effect = mock_search_page
+    jira.register_field_profile("triage", ["summary", "status"])
+    issues = jira.search_issues("project = ABC", fields="triage", properties=["rank"])
+    assert len(issues) == 5
+    payloads = [call.kwargs["json"] for call in mock_rest_request.call_args_list]
+    assert len(payloads) == 3
+    for payload in payloads:
+        assert payload["fields"] == ["summary", "status"]
+        assert payload["properties"] == ["rank"]
+        assert "fieldsByKeys" not in payload
+
+
+def mock_bulk_issues(method, url, **kwargs) -> httpx.Response:
+    """Auxiliary function to answer searches by key and single issue requests.
+    OLD-1 was moved to NEW-1 and is returned by the search under its new key.
+    """
+    request = httpx.Request(method, "https://example.org")
+    if method == "GET":
+        return httpx.Response(status_code=404, request=request, json={})
+    keys = kwargs["json"]["jql"].removeprefix("key in (").removesuffix(")").split(", ")
+    moved = {'"OLD-1"': '"NEW-1"'}
+    keys = [moved.get(key, key) for key in keys]
+    issues = [{"key": key.strip('"')} for key in keys if not key.startswith('"GONE-')]
+    return httpx.Response(
+        status_code=200,
+        request=request,
+        json={"startAt": 0, "maxResults": 40, "total": len(issues), "issues": issues},
+    )
+
+
+@patch("httpx.AsyncClient.request")
+def test_fetch_issues_from_list_keeps_input_order(mock_rest_request):
+    """Test fetch_issues_from_list() chunks the keys and maps moved issues once."""
+    mock_rest_request.side_effect = mock_bulk_issues
+    keys = ["ABC-3", "old-1", "ABC-1", "GONE-1", "ABC-2", "ABC-3"]
+    issues = jira.fetch_issues_from_list(keys, fields="key_only", chunk_size=2)
+    assert [issue.get("key") for issue in issues] == [
+        "ABC-3",
+        "NEW-1",
+        "ABC-1",
+        None,
+        "ABC-2",
+        "ABC-3",
+    ]
+    searches = [
+        call.kwargs["json"]
+        for call in mock_rest_request.call_args_list
+        if call.kwargs["method"] == "POST"
+    ]
+    assert len(searches) == 3
+    assert all(search["validateQuery"] == "warn" for search in searches)
+    fetched = [
+        str(call.kwargs["url"])
+        for call in mock_rest_request.call_args_list
+        if call.kwargs["method"] == "GET"
+    ]
+    assert len(fetched) == 1 and fetched[0].endswith("issue/GONE-1")
+    long_keys = [f"LONG{'X' * 3000}-{i}" for i in range(4)]
+    assert [len(chunk) for chunk in jira._chunk_issue_keys(long_keys, 50)] == [2, 2]
+
+
+async def mock_project_by_key(method, url, **kwargs) -> httpx.Response:
+    """Auxiliary function to answer project requests according to their key.
+    BAD is not found, DENIED is unauthorized and SLOW takes a while to answer.
+    """
+    request = httpx.Request(method, "https://example.org")
+    key = str(url).rsplit("/", 1)[-1]
+    if key == "SLOW":
+        await asyncio.sleep(5)
+    status_code = {"BAD": 404, "DENIED": 401}.get(key, 200)
+    return httpx.Response(status_code=status_code, request=request, json={"key": key})
+
+
+@patch("httpx.AsyncClient.request")
+def test_fetch_projects_from_list_collects_errors_per_key(mock_rest_request):
+    """Test fetch_projects_from_list() keeps successes next to the failed keys."""
+    mock_rest_request.side_effect = mock_project_by_key
+    batch = jira.fetch_projects_from_list(["ABC", "BAD", "XYZ"], return_exceptions=True)
+    assert batch.results == {"ABC": {"key": "ABC"}, "XYZ": {"key": "XYZ"}}
+    assert isinstance(batch.errors["BAD"], e.ResourceNotFoundError)
+    assert not batch.ok
+
+
+@patch("httpx.AsyncClient.request")
+def test_fetch_projects_from_list_cancels_on_fatal_error(mock_rest_request):
+    """Test fetch_projects_from_list() cancels outstanding requests when unauthorized."""
+    mock_rest_request.side_effect = mock_project_by_key
+    batch = jira.fetch_projects_from_list(["SLOW", "DENIED"], return_exceptions=True)
+    assert isinstance(batch.errors["DENIED"], e.ResourceUnauthorizedError)
+    assert batch.cancelled == ["SLOW"]
+    with pytest.raises(e.ResourceUnauthorizedError):
+        jira.fetch_projects_from_list(["SLOW", "DENIED"])
+
+
+def mock_history(status_from: str, status_to: str) -> dict:
+    """Auxiliary function to generate a changelog history of a status change."""
+    return {
+        "author": {"name": "jdoe"},
+        "created": f"2024-01-01T{status_to}",
+        "items": [
+            {"field": "status", "fromString": status_from, "toString": status_to},
+            {"field": "assignee", "from": None, "to": "jdoe"},
+        ],
+    }
+
+
+def mock_changelogs(method, url, **kwargs) -> httpx.Response:
+    """Auxiliary function to answer a search with changelogs.
+    The changelog of ABC-2 is truncated by the search and has its own resource.
+    """
+    request = httpx.Request(method, "https://example.org")
+    histories = [mock_history("Open", "Doing"), mock_history("Doing", "Done")]
+    if method == "GET":
+        assert str(url).endswith("issue/ABC-2/changelog")
+        page = {"startAt": 0, "maxResults": 50, "total": 2, "values": histories}
+        return httpx.Response(status_code=200, request=request, json=page)
+    issues = [
+        {"key": "ABC-1", "changelog": {"total": 1, "histories": histories[:1]}},
+        {"key": "ABC-2", "changelog": {"total": 2, "histories": histories[:1]}},
+    ]
+    page = {"startAt": 0, "maxResults": 50, "total": 2, "issues": issues}
+    return httpx.Response(status_code=200, request=request, json=page)
+
+
+@patch("httpx.AsyncClient.request")
+def test_iter_changelogs_completes_truncated_histories(mock_rest_request):
+    """Test iter_changelogs() pages the truncated changelogs and filters the fields."""
+    mock_rest_request.side_effect = mock_changelogs
+    records = list(jira.iter_changelogs(jql="project = ABC", changed_fields=["status"]))
+    assert [(r.issue, r.from_value, r.to_value) for r in records] == [
+        ("ABC-1", "Open", "Doing"),
+        ("ABC-2", "Open", "Doing"),
+        ("ABC-2", "Doing", "Done"),
+    ]
+    assert records[0].author == "jdoe"
+    assert len(jira.fetch_changelogs(jql="project = ABC")) == 6
+    with pytest.raises(ValueError):
+        jira.fetch_changelogs()
@@ -0,0 +1,147 @@
+"""Module responsible for testing yajaw.mirror module."""
+import asyncio
+import re
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from yajaw.mirror import IssueMirror
+
+
+def mock_search(issues: list[dict]):
+    """Auxiliary function to generate a single page search response factory."""
+
+    def search(**kwargs) -> httpx.Response:
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("POST", "https://example.org"),
+            json={"startAt": 0, "maxResults": 50, "total": len(issues), "issues": issues},
+        )
+
+    return search
+
+
+def issue(issue_id: str, updated: str) -> dict:
+    """Auxiliary function to generate an issue with the given id and update timestamp."""
+    return {"id": issue_id, "key": f"ABC-{issue_id}", "fields": {"updated": updated}}
+
+
+@patch("httpx.AsyncClient.request")
+def test_mirror_refresh_is_incremental(mock_rest_request, tmp_path):
+    """Test the mirror requests only updated issues after the first refresh."""
+    first = [issue("1", "2024-01-01T10:00:00.000+0000"), issue("2", "2024-01-02T10:00:00.000+0000")]
+    with IssueMirror(tmp_path / "issues.db", reconcile_interval=None) as mirror:
+        mock_rest_request.side_effect = mock_search(first)
+        report = mirror.refresh("project = ABC ORDER BY key")
+        assert report["full"] and report["upserted"] == 2
+        assert report["watermark"] == "2024-01-02T10:00:00+00:00"
+
+        mock_rest_request.side_effect = mock_search([issue("2", "2024-01-03T10:00:00.000+0000")])
+        report = mirror.refresh("project = ABC")
+        assert not report["full"] and report["upserted"] == 1
+        jql = mock_rest_request.call_args.kwargs["json"]["jql"]
+        assert jql.startswith('(project = ABC) AND updated >= "-')
+        assert mirror.get_issue("ABC-2")["fields"]["updated"].startswith("2024-01-03")
+
+        mock_rest_request.side_effect = mock_search([{"id": "2", "key": "ABC-2"}])
+        assert mirror.reconcile("project = ABC") == 1
+        assert mirror.get_issue("ABC-1") == {}
+        assert [i["key"] for i in mirror.issues("project = ABC")] == ["ABC-2"]
+
+
+def jira_timestamp(moment: datetime) -> str:
+    """Auxiliary function to format a datetime as a Jira updated timestamp."""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+@patch("httpx.AsyncClient.request")
+def test_mirror_refresh_overlaps_the_watermark(mock_rest_request, tmp_path):
+    """Test the overlap widens the incremental window and old updates keep the watermark."""
+    recent = datetime.now(UTC) - timedelta(minutes=5)
+    with IssueMirror(
+        tmp_path / "issues.db", overlap=timedelta(minutes=10), reconcile_interval=None
+    ) as mirror:
+        mock_rest_request.side_effect = mock_search([issue("1", jira_timestamp(recent))])
+        watermark = mirror.refresh("project = ABC")["watermark"]
+
+        # An issue updated before the watermark, seen late because of clock skew
+        skewed = jira_timestamp(recent - timedelta(minutes=8))
+        mock_rest_request.side_effect = mock_search([issue("2", skewed)])
+        report = mirror.refresh("project = ABC")
+        minutes = int(re.search(r'"-(\d+)m"', mock_rest_request.call_args.kwargs["json"]["jql"])[1])
+        assert minutes in (15, 16)
+        assert report["upserted"] == 1 and report["watermark"] == watermark
+        assert mirror.get_issue("ABC-2")["fields"]["updated"] == skewed
+
+        # Issues updated ahead of the local clock still request at least one minute
+        ahead = recent + timedelta(minutes=30)
+        mock_rest_request.side_effect = mock_search([issue("3", jira_timestamp(ahead))])
+        mirror.refresh("project = ABC")
+        mirror.refresh("project = ABC")
+        assert mock_rest_request.call_args.kwargs["json"]["jql"].endswith('updated >= "-1m"')
+
+
+@patch("httpx.AsyncClient.request")
+def test_mirror_empty_first_refresh_starts_from_now(mock_rest_request, tmp_path):
+    """Test an empty first refresh stores the time it started as the watermark."""
+    with IssueMirror(tmp_path / "issues.db", reconcile_interval=None) as mirror:
+        mock_rest_request.side_effect = mock_search([])
+        before = datetime.now(UTC)
+        report = mirror.refresh("project = ABC")
+        assert report["full"] and report["upserted"] == 0 and report["removed"] == 0
+        assert before <= datetime.fromisoformat(report["watermark"]) <= datetime.now(UTC)
+
+        report = mirror.refresh("project = ABC")
+        assert not report["full"]
+        assert mock_rest_request.call_args.kwargs["json"]["jql"].endswith('updated >= "-11m"')
+
+
+@patch("httpx.AsyncClient.request")
+def test_mirror_refresh_reconciles_when_due(mock_rest_request, tmp_path):
+    """Test an incremental refresh runs the key-only scan once the interval elapsed."""
+    matched = [
+        issue("1", "2024-01-01T10:00:00.000+0000"),
+        issue("2", "2024-01-02T10:00:00.000+0000"),
+    ]
+
+    def search(**kwargs) -> httpx.Response:
+        incremental = "updated >=" in kwargs["json"]["jql"]
+        return mock_search([] if incremental else matched)(**kwargs)
+
+    mock_rest_request.side_effect = search
+    with IssueMirror(tmp_path / "issues.db", reconcile_interval=timedelta(0)) as mirror:
+        assert mirror.refresh("project = ABC")["upserted"] == 2
+        assert mock_rest_request.call_count == 1
+
+        del matched[0]
+        report = mirror.refresh("project = ABC")
+        assert not report["full"] and report["removed"] == 1
+        assert mock_rest_request.call_count == 3
+        assert mirror.get_issue("ABC-1") == {}
+
+    with IssueMirror(tmp_path / "issues.db", reconcile_interval=timedelta(days=1)) as mirror:
+        assert mirror.refresh("project = ABC")["removed"] == 0
+        assert mock_rest_request.call_count == 4
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.request")
+async def test_mirror_concurrent_refreshes_keep_their_writes(mock_rest_request, tmp_path):
+    """Test concurrent refreshes on one mirror write and complete independently."""
+
+    async def search(**kwargs) -> httpx.Response:
+        project = kwargs["json"]["jql"].split()[-1]
+        await asyncio.sleep(0.01)
+        issues = [{"id": f"{project}{i}", "key": f"{project}-{i}", "fields": {}} for i in range(3)]
+        return mock_search(issues)(**kwargs)
+
+    mock_rest_request.side_effect = search
+    with IssueMirror(tmp_path / "issues.db", reconcile_interval=None) as mirror:
+        reports = await asyncio.gather(
+            mirror.async_refresh("project = ABC"), mirror.async_refresh("project = XYZ")
+        )
+        assert [report["upserted"] for report in reports] == [3, 3]
+        assert [i["key"] for i in mirror.issues("project = XYZ")] == ["XYZ-0", "XYZ-1", "XYZ-2"]
+        assert len(list(mirror.issues())) == 6
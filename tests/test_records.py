@@ -0,0 +1,61 @@
+"""Module responsible for testing yajaw.records module."""
+from unittest.mock import patch
+
+import httpx
+
+from yajaw import jira
+from yajaw.records import IssueRecord, RawIssueRecord
+
+
+def mock_issue(key: str) -> dict:
+    """Auxiliary function to generate an issue as returned by the Jira API."""
+    return {
+        "id": key.split("-")[1],
+        "key": key,
+        "self": f"https://example.org/rest/api/2/issue/{key}",
+        "fields": {
+            "summary": f"Summary of {key}",
+            "status": {"name": "In " + "Progress", "id": "3"},
+            "priority": {"name": "Major"},
+            "issuetype": {"name": "Bug"},
+            "project": {"key": "ABC"},
+            "assignee": {"name": "jdoe", "displayName": "J. Doe"},
+            "reporter": None,
+            "labels": ["backend"],
+            "updated": "2024-01-01T10:00:00.000+0000",
+        },
+    }
+
+
+def test_issue_record_keeps_common_fields_and_raw_payload():
+    """Test IssueRecord interns repeated values and decodes the raw payload lazily."""
+    first = RawIssueRecord.from_issue(mock_issue("ABC-1"))
+    second = IssueRecord.from_issue(mock_issue("ABC-2"))
+    assert first.key == "ABC-1"
+    assert first.status == "In Progress"
+    assert first.status is second.status
+    assert first.assignee == "jdoe"
+    assert first.reporter is None
+    assert first.labels == ("backend",)
+    assert first.raw == mock_issue("ABC-1")
+    assert not hasattr(first, "__dict__")
+    assert second.raw is None
+    assert first == IssueRecord.from_issue(mock_issue("ABC-1"))
+
+
+@patch("httpx.AsyncClient.request")
+def test_search_issues_returns_records(mock_rest_request):
+    """Test search_issues() converts every issue to the requested result type."""
+    mock_rest_request.return_value = httpx.Response(
+        status_code=200,
+        request=httpx.Request("POST", "https://example.org"),
+        json={
+            "startAt": 0,
+            "maxResults": 40,
+            "total": 2,
+            "issues": [mock_issue("ABC-1"), mock_issue("ABC-2")],
+        },
+    )
+    issues = jira.search_issues("project = ABC", result_type=IssueRecord)
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2"]
+    assert all(isinstance(issue, IssueRecord) for issue in issues)
@@ -0,0 +1,50 @@
+"""Module responsible for testing yajaw.utils.concurrency module."""
+import asyncio
+import concurrent.futures
+from unittest.mock import patch
+
+import httpx
+
+from yajaw import YajawConfig, jira
+from yajaw.utils import concurrency
+
+
+def mock_valid_project() -> httpx.Response:
+    """Auxiliary function to generate a valid project as httpx.Response."""
+    return httpx.Response(
+        status_code=200, request=httpx.Request("GET", "https://example.org"), json={"key": "VALID"}
+    )
+
+
+def test_persistent_runner_reuses_one_loop_and_client():
+    """Test sync calls in persistent mode share the background loop and its client."""
+    YajawConfig.update_configuration("concurrency", "runner", "persistent")
+    try:
+        with patch("httpx.AsyncClient.request", autospec=True) as mock_request:
+            mock_request.return_value = mock_valid_project()
+            assert jira.fetch_project("VALID")["key"] == "VALID"
+            future = jira.fetch_projects_from_list.submit(["VALID", "VALID"])
+            assert isinstance(future, concurrent.futures.Future)
+            assert future.result(timeout=5) == [{"key": "VALID"}] * 2
+            clients = {call.args[0] for call in mock_request.call_args_list}
+        assert len(clients) == 1
+        assert concurrency.background_runner() is concurrency.background_runner()
+    finally:
+        YajawConfig.update_configuration("concurrency", "runner", "ephemeral")
+        concurrency.close_background_runner()
+    assert all(client.is_closed for client in clients)
+
+
+def test_sync_iter_runs_on_the_persistent_runner():
+    """Test streaming sync calls in persistent mode are consumed on the background loop."""
+
+    async def loops():
+        for _ in range(2):
+            yield asyncio.get_running_loop()
+
+    YajawConfig.update_configuration("concurrency", "runner", "persistent")
+    try:
+        assert set(concurrency.sync_iter(loops())) == {concurrency.background_runner().loop}
+    finally:
+        YajawConfig.update_configuration("concurrency", "runner", "ephemeral")
+        concurrency.close_background_runner()